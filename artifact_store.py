@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+"""
+Compressed, content-addressed storage for the per-book artifacts under `pricebooks/out`.
+
+Layout (for an output dir `out/`):
+- `out/_blobs/ab/abcdef....z`   zlib-compressed payloads, named by the sha256 of the
+                                  *uncompressed* bytes, so identical payloads are stored once
+                                  across books and revisions
+- `out/<book>/artifacts.json`   small pointer file: logical name -> current blob, plus the
+                                  blobs earlier revisions pointed at
+
+Callers keep using logical paths (`out/<book>/ocr_raw.json`). Reads check for a plain file at
+that path first (older outputs, checked-in fixtures, `unpack`ed books), then the pointer file;
+blobs are only opened and decompressed when an artifact is actually read.
+
+Set `PRICEBOOK_ARTIFACT_STORE=0` to write plain files instead.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+POINTER_FILENAME = "artifacts.json"
+BLOB_DIRNAME = "_blobs"
+POINTER_SCHEMA_VERSION = 1
+_COMPRESSION_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class ArtifactRef:
+    sha256: str
+    size: int
+    stored_size: int
+    updated_at: str
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "sha256": self.sha256,
+            "size": self.size,
+            "stored_size": self.stored_size,
+            "updated_at": self.updated_at,
+        }
+
+
+def store_enabled() -> bool:
+    return os.environ.get("PRICEBOOK_ARTIFACT_STORE", "1").strip().lower() not in {"0", "false", "no", "plain"}
+
+
+def blob_root(book_dir: Path) -> Path:
+    return book_dir.parent / BLOB_DIRNAME
+
+
+def _blob_path(book_dir: Path, sha256: str) -> Path:
+    return blob_root(book_dir) / sha256[:2] / f"{sha256}.z"
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _ref_from_dict(raw: object) -> Optional[ArtifactRef]:
+    if not isinstance(raw, dict) or not isinstance(raw.get("sha256"), str):
+        return None
+    return ArtifactRef(
+        sha256=str(raw["sha256"]),
+        size=int(raw.get("size") or 0),
+        stored_size=int(raw.get("stored_size") or 0),
+        updated_at=str(raw.get("updated_at") or ""),
+    )
+
+
+def _load_pointers(book_dir: Path) -> Dict[str, object]:
+    path = book_dir / POINTER_FILENAME
+    if not path.exists():
+        return {"schema_version": POINTER_SCHEMA_VERSION, "artifacts": {}, "history": {}}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("schema_version") != POINTER_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported artifact pointer file: {path}")
+    data.setdefault("artifacts", {})
+    data.setdefault("history", {})
+    return data
+
+
+def artifact_ref(path: Path) -> Optional[ArtifactRef]:
+    """
+    The stored blob a logical path currently points at, or None.
+    """
+    pointer = path.parent / POINTER_FILENAME
+    if not pointer.exists():
+        return None
+    artifacts = _load_pointers(path.parent).get("artifacts")
+    return _ref_from_dict(artifacts.get(path.name)) if isinstance(artifacts, dict) else None
+
+
+def write_artifact_bytes(path: Path, data: bytes) -> Path:
+    """
+    Store `data` under the logical `path` and return `path`.
+
+    Rewriting an artifact with unchanged content only touches the pointer file when needed;
+    the previous blob stays referenced from `history` so older revisions remain readable.
+    """
+    if not store_enabled():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+    book_dir = path.parent
+    digest = hashlib.sha256(data).hexdigest()
+    blob = _blob_path(book_dir, digest)
+    if not blob.exists():
+        _atomic_write_bytes(blob, zlib.compress(data, _COMPRESSION_LEVEL))
+
+    pointers = _load_pointers(book_dir)
+    artifacts = pointers["artifacts"]
+    history = pointers["history"]
+    assert isinstance(artifacts, dict) and isinstance(history, dict)
+    previous = _ref_from_dict(artifacts.get(path.name))
+    if previous is None or previous.sha256 != digest:
+        if previous is not None:
+            past = history.setdefault(path.name, [])
+            if isinstance(past, list) and previous.sha256 not in {p.get("sha256") for p in past if isinstance(p, dict)}:
+                past.append(previous.as_dict())
+        ref = ArtifactRef(
+            sha256=digest,
+            size=len(data),
+            stored_size=blob.stat().st_size,
+            updated_at=datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        )
+        artifacts[path.name] = ref.as_dict()
+        _atomic_write_bytes(book_dir / POINTER_FILENAME, json.dumps(pointers, indent=2).encode("utf-8"))
+
+    # The pointer is now the source of truth; a stale plain copy would shadow it on read.
+    if path.exists():
+        path.unlink()
+    return path
+
+
+def write_artifact_text(path: Path, text: str) -> Path:
+    return write_artifact_bytes(path, text.encode("utf-8"))
+
+
+def write_artifact_json(path: Path, data: object) -> Path:
+    return write_artifact_text(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def read_artifact_bytes(path: Path) -> bytes:
+    if path.exists():
+        return path.read_bytes()
+    ref = artifact_ref(path)
+    if ref is None:
+        raise FileNotFoundError(str(path))
+    data = zlib.decompress(_blob_path(path.parent, ref.sha256).read_bytes())
+    if len(data) != ref.size:
+        raise ValueError(f"Corrupt artifact blob for {path} ({ref.sha256})")
+    return data
+
+
+def read_artifact_text(path: Path, *, errors: str = "strict") -> str:
+    return read_artifact_bytes(path).decode("utf-8", errors=errors)
+
+
+def read_artifact_json(path: Path) -> object:
+    return json.loads(read_artifact_text(path))
+
+
+def artifact_exists(path: Path) -> bool:
+    return path.exists() or artifact_ref(path) is not None
+
+
+def artifact_sha256(path: Path) -> str:
+    """
+    sha256 of the artifact's uncompressed bytes. Stored artifacts answer from the pointer
+    file without touching the blob, and hash the same as their plain-file form.
+    """
+    if path.exists():
+        h = hashlib.sha256()
+        with path.open("rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(block)
+        return h.hexdigest()
+    ref = artifact_ref(path)
+    if ref is None:
+        raise FileNotFoundError(str(path))
+    return ref.sha256
+
+
+def artifact_version(path: Path) -> str:
+    """
+    A token that changes whenever the artifact does, for cache keys: the plain file's mtime and
+    size, or the sha256 the pointer file records. Neither reads nor hashes the payload.
+    """
+    if path.exists():
+        stat = path.stat()
+        return f"file:{stat.st_mtime_ns}:{stat.st_size}"
+    ref = artifact_ref(path)
+    if ref is None:
+        raise FileNotFoundError(str(path))
+    return f"sha256:{ref.sha256}"
+
+
+def find_artifacts(out_dir: Path, name: str) -> List[Path]:
+    """
+    Logical paths of every `name` artifact under `out_dir`, plain or stored.
+    """
+    found = set(out_dir.glob(f"**/{name}"))
+    for pointer in out_dir.glob(f"**/{POINTER_FILENAME}"):
+        try:
+            artifacts = _load_pointers(pointer.parent).get("artifacts")
+        except (OSError, ValueError):
+            continue
+        if isinstance(artifacts, dict) and name in artifacts:
+            found.add(pointer.parent / name)
+    return sorted(found)
+
+
+def pack_book(book_dir: Path, names: List[str]) -> List[Path]:
+    """
+    Move plain artifacts of one book into the store. Each plain file is removed only once its
+    blob and pointer are written, so a failed write leaves it in place.
+    """
+    packed: List[Path] = []
+    for name in names:
+        path = book_dir / name
+        if path.is_file():
+            write_artifact_bytes(path, path.read_bytes())
+            packed.append(path)
+    return packed
+
+
+def unpack_book(book_dir: Path) -> List[Path]:
+    """
+    Write every stored artifact of one book back out as a plain file (pointers are kept).
+    """
+    pointers = _load_pointers(book_dir)
+    artifacts = pointers.get("artifacts")
+    out: List[Path] = []
+    if isinstance(artifacts, dict):
+        for name in sorted(artifacts):
+            path = book_dir / name
+            if not path.exists():
+                _atomic_write_bytes(path, read_artifact_bytes(path))
+            out.append(path)
+    return out
+
+
+def collect_garbage(out_dir: Path) -> List[Path]:
+    """
+    Delete blobs no pointer file (current or history) references. Returns the deleted paths.
+    """
+    referenced = set()
+    for pointer in out_dir.glob(f"**/{POINTER_FILENAME}"):
+        try:
+            pointers = _load_pointers(pointer.parent)
+        except (OSError, ValueError):
+            # An unreadable pointer file may still reference blobs; don't risk deleting them.
+            return []
+        for raw in (pointers.get("artifacts") or {}).values():
+            ref = _ref_from_dict(raw)
+            if ref is not None:
+                referenced.add(ref.sha256)
+        for past in (pointers.get("history") or {}).values():
+            for raw in past if isinstance(past, list) else []:
+                ref = _ref_from_dict(raw)
+                if ref is not None:
+                    referenced.add(ref.sha256)
+
+    deleted: List[Path] = []
+    blobs = out_dir / BLOB_DIRNAME
+    if blobs.is_dir():
+        for blob in blobs.glob("*/*.z"):
+            if blob.stem not in referenced:
+                blob.unlink()
+                deleted.append(blob)
+    return deleted
@@ -1,12 +1,29 @@
 from __future__ import annotations
 
+import functools
+import heapq
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Callable, Dict, Generic, Iterable, List, NamedTuple, Optional, Tuple, TypeVar, Union
 
 from PIL import Image, ImageColor, ImageDraw
 
+# Bump whenever the drawn views change; caches of rendered quotes key on it.
+BUILDING_VIEWS_RENDERER_VERSION = 3
+
+RGB = Tuple[int, int, int]
+_BACKGROUND: RGB = (245, 245, 245)
+_GROUND: RGB = (220, 220, 220)
+_FRAME: RGB = (190, 190, 190)
+_VIEW_NAMES = ("isometric", "front", "back", "left", "right")
+# Fraction of the canvas that draft views (`render_building_views_png(draft=True)`) are drawn at.
+DRAFT_VIEW_SCALE = 0.4
+
 
 @dataclass(frozen=True)
 class BuildingColorScheme:
@@ -34,8 +51,9 @@ class BuildingOpening:
     A simple opening on a building face, for demo drawing purposes.
 
     Notes:
-    - `offset_ft` is along the wall from the left edge (when facing that wall).
-      If omitted, the renderer will auto-place openings evenly.
+    - `offset_ft` is where the opening's center sits along the wall, from the left edge (when
+      facing that wall). If omitted, `layout_openings` places it in the free space left by the
+      openings that have one.
     """
 
     side: BuildingSide
@@ -78,12 +96,249 @@ def _clamp_int(name: str, value: int, *, min_value: int, max_value: int) -> int:
     return max(min_value, min(max_value, value))
 
 
-def _encode_png(img: Image.Image) -> bytes:
+@dataclass(frozen=True)
+class VectorShape:
+    """
+    One drawing command in canvas pixels (origin top-left, y down), with the same meaning as
+    the `ImageDraw` call that paints it into the PNG: `rect`/`ellipse` take two inclusive
+    corner points, `polygon` and `line` a point list (a line is stroked `width` px wide).
+    """
+
+    kind: str  # "rect" | "polygon" | "line" | "ellipse"
+    points: Tuple[Tuple[int, int], ...]
+    fill: Optional[RGB] = None
+    outline: Optional[RGB] = None
+    width: int = 1
+
+
+@dataclass(frozen=True)
+class BuildingViewDrawing:
+    """
+    A building view as vector shapes, painted in order over a `canvas_px` canvas.
+    """
+
+    canvas_px: Tuple[int, int]
+    shapes: Tuple[VectorShape, ...]
+
+
+def _points(xy) -> Tuple[Tuple[int, int], ...]:
+    return tuple((int(x), int(y)) for x, y in _pairs(xy))
+
+
+def _pairs(xy) -> Tuple[Tuple[float, float], ...]:
+    pts = list(xy)
+    if pts and not isinstance(pts[0], (tuple, list)):
+        pts = list(zip(pts[0::2], pts[1::2]))
+    return tuple((x, y) for x, y in pts)
+
+
+@dataclass(frozen=True)
+class _SceneShape:
+    """
+    One drawer call in a view's scene: coordinates exactly as computed (not rounded, so replaying
+    it into PIL paints the same pixels) and colors as style slots (`_Paint` or a fixed RGB).
+    """
+
+    kind: str  # "rect" | "polygon" | "line" | "ellipse"
+    points: Tuple[Tuple[float, float], ...]
+    fill: Optional["_Color"] = None
+    outline: Optional["_Color"] = None
+    width: int = 1
+
+    def draw(self, d: "_Surface") -> None:
+        points = list(self.points)
+        if self.kind == "rect":
+            d.rectangle(points, fill=self.fill, outline=self.outline, width=self.width)
+        elif self.kind == "polygon":
+            d.polygon(points, fill=self.fill, outline=self.outline)
+        elif self.kind == "line":
+            d.line(points, fill=self.fill, width=self.width)
+        else:
+            d.ellipse(points, fill=self.fill, outline=self.outline)
+
+    def vector(self, resolve: Callable[["_Color"], RGB]) -> VectorShape:
+        fill = None if self.fill is None else resolve(self.fill)
+        if self.kind == "line":
+            return VectorShape("line", _points(self.points), outline=fill, width=max(1, int(self.width)))
+        outline = None if self.outline is None else resolve(self.outline)
+        return VectorShape(self.kind, _points(self.points), fill=fill, outline=outline, width=int(self.width))
+
+
+class _SceneRecorder:
+    """
+    Stand-in for `ImageDraw.ImageDraw` that records the calls the view drawers make.
+    """
+
+    def __init__(self) -> None:
+        self.shapes: List[_SceneShape] = []
+
+    def rectangle(self, xy, fill=None, outline=None, width: int = 1) -> None:
+        self.shapes.append(_SceneShape("rect", _pairs(xy), fill=fill, outline=outline, width=width))
+
+    def polygon(self, xy, fill=None, outline=None) -> None:
+        self.shapes.append(_SceneShape("polygon", _pairs(xy), fill=fill, outline=outline))
+
+    def line(self, xy, fill=None, width: int = 0) -> None:
+        self.shapes.append(_SceneShape("line", _pairs(xy), fill=fill, width=width))
+
+    def ellipse(self, xy, fill=None, outline=None) -> None:
+        self.shapes.append(_SceneShape("ellipse", _pairs(xy), fill=fill, outline=outline))
+
+
+@dataclass(frozen=True)
+class _Paint:
+    """
+    A color-scheme color ("roof", "trim" or "sides") after zero or more `_shade` factors.
+
+    The drawers paint with these instead of RGB, so one drawing can be rasterized into a
+    palette image once and recolored for any scheme by swapping the palette.
+    """
+
+    base: str
+    factors: Tuple[float, ...] = ()
+
+    def rgb(self, colors: BuildingColorScheme) -> RGB:
+        rgb = _color(getattr(colors, self.base))
+        for factor in self.factors:
+            rgb = _shade(rgb, factor)
+        return rgb
+
+
+_Color = Union[RGB, _Paint]
+
+
+class _PaintedSurface:
+    """
+    Forwards the drawers' calls to `d`, turning each color into what `d` takes via `resolve`
+    (an RGB tuple for RGB images and vectors, a palette slot for "P" images). With `scale`,
+    coordinates and stroke widths are scaled too, so a view laid out for the full canvas can
+    be drawn onto a smaller one.
+    """
+
+    def __init__(self, d, resolve: Callable[[_Color], object], scale: float = 1.0) -> None:
+        self._d = d
+        self._resolve = resolve
+        self._scale = scale
+
+    def _ink(self, color: Optional[_Color]):
+        return None if color is None else self._resolve(color)
+
+    def _xy(self, xy):
+        if self._scale == 1.0:
+            return xy
+        k = self._scale
+        return [(p[0] * k, p[1] * k) if isinstance(p, tuple) else p * k for p in xy]
+
+    def _width(self, width: int) -> int:
+        if self._scale == 1.0 or width <= 0:
+            return width
+        return max(1, int(round(width * self._scale)))
+
+    def rectangle(self, xy, fill=None, outline=None, width: int = 1) -> None:
+        self._d.rectangle(self._xy(xy), fill=self._ink(fill), outline=self._ink(outline), width=self._width(width))
+
+    def polygon(self, xy, fill=None, outline=None) -> None:
+        self._d.polygon(self._xy(xy), fill=self._ink(fill), outline=self._ink(outline))
+
+    def line(self, xy, fill=None, width: int = 0) -> None:
+        self._d.line(self._xy(xy), fill=self._ink(fill), width=self._width(width))
+
+    def ellipse(self, xy, fill=None, outline=None) -> None:
+        self._d.ellipse(self._xy(xy), fill=self._ink(fill), outline=self._ink(outline))
+
+
+# What the drawers draw on: a recorder while a scene is built, a painted PIL surface on replay.
+_Surface = Union[_SceneRecorder, _PaintedSurface]
+
+
+@dataclass(frozen=True)
+class ViewEncoding:
+    """
+    How rendered views are encoded.
+
+    - `default`: PNG with `optimize=True` (the historical output).
+    - `fast`: PNG at zlib level 1, no optimize pass; for interactive previews.
+    - `small`: indexed PNG with an exact palette (the drawings use only a handful of flat
+      colors, so nothing is lost), optimized; for embedding and storage.
+    - `webp`: lossless WebP; usually the smallest for browser delivery.
+    """
+
+    name: str
+    format: str = "PNG"  # "PNG" | "WEBP"
+    compress_level: int = 6
+    optimize: bool = False
+    indexed: bool = False
+    webp_method: int = 1  # higher methods cost 40%+ more time for ~no gain on these drawings
+
+
+DEFAULT_VIEW_ENCODING = ViewEncoding(name="default", optimize=True)
+FAST_VIEW_ENCODING = ViewEncoding(name="fast", compress_level=1)
+SMALL_VIEW_ENCODING = ViewEncoding(name="small", compress_level=9, optimize=True, indexed=True)
+WEBP_VIEW_ENCODING = ViewEncoding(name="webp", format="WEBP")
+VIEW_ENCODINGS: Dict[str, ViewEncoding] = {
+    e.name: e for e in (DEFAULT_VIEW_ENCODING, FAST_VIEW_ENCODING, SMALL_VIEW_ENCODING, WEBP_VIEW_ENCODING)
+}
+
+
+def view_encoding(name: str) -> ViewEncoding:
+    try:
+        return VIEW_ENCODINGS[(name or "").strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown view encoding {name!r} (expected one of: {', '.join(VIEW_ENCODINGS)})")
+
+
+def _exact_palette_image(img: Image.Image) -> Optional[Image.Image]:
+    """
+    `img` as a "P" image holding exactly its own colors, or None if that is not possible.
+    """
+    used = img.getcolors(256)
+    if used is None:
+        return None
+    # Asked for as many colors as there are, these quantizers give every color its own slot,
+    # i.e. an exact mapping (a fixed-palette quantize would snap near-identical shades
+    # together). Max coverage is the quicker one; check the result rather than trust it.
+    for method in (Image.Quantize.MAXCOVERAGE, Image.Quantize.MEDIANCUT):
+        indexed = img.quantize(colors=len(used), method=method, dither=Image.Dither.NONE)
+        if sorted(indexed.convert("RGB").getcolors(256) or []) == sorted(used):
+            return indexed
+    return None
+
+
+def _encode_view(img: Image.Image, encoding: ViewEncoding = DEFAULT_VIEW_ENCODING) -> bytes:
     buf = BytesIO()
-    img.save(buf, format="PNG", optimize=True)
+    if img.mode == "P" and not encoding.indexed:
+        img = img.convert("RGB")
+    if encoding.format == "WEBP":
+        img.save(buf, format="WEBP", lossless=True, method=encoding.webp_method)
+        return buf.getvalue()
+    if encoding.indexed and img.mode != "P":
+        img = _exact_palette_image(img) or img
+    img.save(buf, format="PNG", optimize=encoding.optimize, compress_level=encoding.compress_level)
     return buf.getvalue()
 
 
+_VIEW_POOL: Optional[ThreadPoolExecutor] = None
+_VIEW_POOL_LOCK = threading.Lock()
+
+
+def _shared_view_pool() -> Optional[ThreadPoolExecutor]:
+    """
+    Process-wide thread pool for rendering views side by side (`BUILDING_VIEWS_PARALLEL=0`
+    turns it off). PIL releases the GIL while encoding PNGs, so threads overlap the
+    expensive part of each view without pickling anything.
+    """
+    global _VIEW_POOL
+    if os.environ.get("BUILDING_VIEWS_PARALLEL", "1").strip().lower() in {"0", "false", "no", "off"}:
+        return None
+    workers = min(len(_VIEW_NAMES), os.cpu_count() or 1)
+    if workers <= 1:
+        return None  # nothing to overlap with; skip the hand-off
+    with _VIEW_POOL_LOCK:
+        if _VIEW_POOL is None:
+            _VIEW_POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="building-views")
+        return _VIEW_POOL
+
+
 def render_building_views_png(
     *,
     width_ft: int,
@@ -93,34 +348,195 @@ def render_building_views_png(
     openings: Tuple[BuildingOpening, ...] = (),
     view_names: Iterable[str] = ("isometric", "front", "back", "left", "right"),
     canvas_px: Tuple[int, int] = (900, 520),
+    executor: Optional[Executor] = None,
+    encoding: ViewEncoding = DEFAULT_VIEW_ENCODING,
+    draft: bool = False,
 ) -> Dict[str, bytes]:
     """
-    Render simple, demo-friendly "3D-ish" building views as PNG bytes.
+    Render simple, demo-friendly "3D-ish" building views as PNG bytes (WebP bytes with the
+    `webp` encoding; see `ViewEncoding`).
 
     This is not a true 3D renderer; it generates stylized drawings (like the screenshot) that
     are stable, fast, and local-only.
+
+    With several views, each is rendered and encoded as its own task on `executor` (default:
+    a shared thread pool; pass a `ProcessPoolExecutor` to use more cores for big canvases).
+    The result is the same dict, in the same order, as rendering them one after another.
+
+    `draft=True` renders a quick placeholder: `DRAFT_VIEW_SCALE` of `canvas_px`, without siding
+    lines or roof seams (pair it with the `fast` encoding). Previews show it while the full
+    render runs.
+    """
+    w, l, h, safe_openings, names = _view_request(width_ft, length_ft, height_ft, openings, view_names)
+    pool = executor if executor is not None else _shared_view_pool()
+    if pool is None or len(names) <= 1:
+        return {
+            name: _render_view_png(name, w, l, h, colors, safe_openings, canvas_px, encoding, draft) for name in names
+        }
+    futures = [
+        pool.submit(_render_view_png, name, w, l, h, colors, safe_openings, canvas_px, encoding, draft)
+        for name in names
+    ]
+    return {name: future.result() for name, future in zip(names, futures)}
+
+
+def _render_view_png(
+    name: str,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    colors: BuildingColorScheme,
+    openings: Tuple[BuildingOpening, ...],
+    canvas_px: Tuple[int, int],
+    encoding: ViewEncoding = DEFAULT_VIEW_ENCODING,
+    draft: bool = False,
+) -> bytes:
+    # Module-level (picklable) so process pools can run it too.
+    img = _render_view(
+        name=name,
+        width_ft=width_ft,
+        length_ft=length_ft,
+        height_ft=height_ft,
+        colors=colors,
+        openings=openings,
+        canvas_px=canvas_px,
+        draft=draft,
+    )
+    return _encode_view(img, encoding)
+
+
+def render_building_views_vector(
+    *,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    colors: BuildingColorScheme,
+    openings: Tuple[BuildingOpening, ...] = (),
+    view_names: Iterable[str] = ("isometric", "front", "back", "left", "right"),
+    canvas_px: Tuple[int, int] = (900, 520),
+) -> Dict[str, BuildingViewDrawing]:
+    """
+    The same drawings as `render_building_views_png`, as vector shapes instead of pixels.
+
+    Lets the quote PDF draw the views natively: a fraction of the bytes of the PNGs, no
+    encode/decode round trip, and crisp at any zoom or print resolution.
+    """
+    w, l, h, safe_openings, names = _view_request(width_ft, length_ft, height_ft, openings, view_names)
+    cw, ch = _canvas_size(canvas_px)
+    resolve = _resolver(colors)
+    views: Dict[str, BuildingViewDrawing] = {}
+    for name in names:
+        scene = _view_scene(name, w, l, h, safe_openings, (cw, ch))
+        views[name] = BuildingViewDrawing(canvas_px=(cw, ch), shapes=tuple(shape.vector(resolve) for shape in scene))
+    return views
+
+
+def render_building_views_svg(
+    *,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    colors: BuildingColorScheme,
+    openings: Tuple[BuildingOpening, ...] = (),
+    view_names: Iterable[str] = ("isometric", "front", "back", "left", "right"),
+    canvas_px: Tuple[int, int] = (900, 520),
+) -> Dict[str, str]:
+    """
+    The same drawings as `render_building_views_png`, as SVG documents.
+
+    A view is a few KB of text, needs no image encoding and stays crisp in the browser, so the
+    app shows previews this way (`st.image` takes SVG strings).
+    """
+    drawings = render_building_views_vector(
+        width_ft=width_ft,
+        length_ft=length_ft,
+        height_ft=height_ft,
+        colors=colors,
+        openings=openings,
+        view_names=view_names,
+        canvas_px=canvas_px,
+    )
+    return {name: building_view_svg(drawing) for name, drawing in drawings.items()}
+
+
+def building_view_svg(drawing: BuildingViewDrawing) -> str:
+    """
+    `drawing` as an SVG document sized to its canvas, painted the way PIL rasterizes it (see
+    `quote_pdf._draw_vector_shapes`, which follows the same rules).
+    """
+    cw, ch = drawing.canvas_px
+    body = "".join(_svg_shape(shape) for shape in drawing.shapes)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {cw} {ch}" width="{cw}" height="{ch}" '
+        f'stroke-linejoin="round">{body}</svg>'
+    )
+
+
+def _svg_shape(shape: VectorShape) -> str:
+    # Rect/ellipse corners are inclusive pixels, rectangle outlines sit inside the rectangle,
+    # and polygons and lines run through pixel centres.
+    fill = _svg_color(shape.fill) if shape.fill is not None else "none"
+    width = max(1, shape.width)
+    stroke = f' stroke="{_svg_color(shape.outline)}" stroke-width="{width}"' if shape.outline is not None else ""
+    if shape.kind in ("rect", "ellipse"):
+        (x1, y1), (x2, y2) = shape.points[0], shape.points[-1]
+        x1, x2 = min(x1, x2), max(x1, x2) + 1
+        y1, y2 = min(y1, y2), max(y1, y2) + 1
+        if shape.kind == "ellipse":
+            return (
+                f'<ellipse cx="{_svg_num((x1 + x2) / 2)}" cy="{_svg_num((y1 + y2) / 2)}" '
+                f'rx="{_svg_num((x2 - x1) / 2)}" ry="{_svg_num((y2 - y1) / 2)}" fill="{fill}"{stroke}/>'
+            )
+        out = ""
+        if shape.fill is not None:
+            out += f'<rect x="{x1}" y="{y1}" width="{x2 - x1}" height="{y2 - y1}" fill="{fill}"/>'
+        if shape.outline is not None:
+            inset = width / 2.0
+            out += (
+                f'<rect x="{_svg_num(x1 + inset)}" y="{_svg_num(y1 + inset)}" '
+                f'width="{_svg_num(x2 - x1 - 2 * inset)}" height="{_svg_num(y2 - y1 - 2 * inset)}" '
+                f'fill="none"{stroke}/>'
+            )
+        return out
+    if len(shape.points) < 2:
+        return ""
+    points = " ".join(f"{_svg_num(x + 0.5)},{_svg_num(y + 0.5)}" for x, y in shape.points)
+    if shape.kind == "polygon":
+        return f'<polygon points="{points}" fill="{fill}"{stroke}/>'
+    return f'<polyline points="{points}" fill="none"{stroke}/>'
+
+
+def _svg_color(rgb: RGB) -> str:
+    return "#%02x%02x%02x" % tuple(rgb)
+
+
+def _svg_num(value: float) -> str:
+    return f"{value:g}"
+
+
+def _view_request(
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    openings: Tuple[BuildingOpening, ...],
+    view_names: Iterable[str],
+) -> Tuple[int, int, int, Tuple[BuildingOpening, ...], Tuple[str, ...]]:
+    """
+    Clamp the building, normalize its openings, and pick the requested views in render order.
     """
     w = _clamp_int("width_ft", width_ft, min_value=6, max_value=120)
     l = _clamp_int("length_ft", length_ft, min_value=6, max_value=250)
     h = _clamp_int("height_ft", height_ft, min_value=6, max_value=30)
-
     safe_openings = _normalize_openings(openings, width_ft=w, length_ft=l, height_ft=h)
-
-    views: Dict[str, bytes] = {}
     want = {str(v).strip().lower() for v in view_names if str(v).strip()}
-    for name in ("isometric", "front", "back", "left", "right"):
-        if name in want:
-            img = _render_view(
-                name=name,
-                width_ft=w,
-                length_ft=l,
-                height_ft=h,
-                colors=colors,
-                openings=safe_openings,
-                canvas_px=canvas_px,
-            )
-            views[name] = _encode_png(img)
-    return views
+    return w, l, h, safe_openings, tuple(name for name in _VIEW_NAMES if name in want)
+
+
+def _canvas_size(canvas_px: Tuple[int, int]) -> Tuple[int, int]:
+    cw, ch = canvas_px
+    cw = _clamp_int("canvas_width_px", int(cw), min_value=320, max_value=2400)
+    ch = _clamp_int("canvas_height_px", int(ch), min_value=240, max_value=1600)
+    return cw, ch
 
 
 def _render_view(
@@ -132,70 +548,347 @@ def _render_view(
     colors: BuildingColorScheme,
     openings: Tuple[BuildingOpening, ...],
     canvas_px: Tuple[int, int],
+    draft: bool = False,
 ) -> Image.Image:
+    """
+    The view as a "P" image colored for `colors`: the cached geometry with its palette
+    filled in, so a color-only change costs a palette swap instead of a redraw.
+
+    A draft is drawn at `DRAFT_VIEW_SCALE` of the canvas, without siding lines or roof seams.
+    """
+    geometry = _view_geometry(name, width_ft, length_ft, height_ft, openings, _canvas_size(canvas_px), draft)
+    return geometry.recolor(colors)
+
+
+@dataclass(frozen=True)
+class _ViewGeometry:
+    image: Image.Image  # "P"; never mutated once cached
+    slots: Tuple[_Color, ...]  # what each palette index paints
+
+    def recolor(self, colors: BuildingColorScheme) -> Image.Image:
+        resolve = _resolver(colors)
+        palette: List[int] = []
+        for slot in self.slots:
+            palette.extend(resolve(slot))
+        img = self.image.copy()
+        img.putpalette(palette)
+        return img
+
+    def extend(self, draw: Callable[[_Surface], None], *, scale: float = 1.0) -> "_ViewGeometry":
+        """
+        A copy of this layer with `draw` painted on top, reusing its palette slots.
+        """
+        slots: Dict[_Color, int] = {slot: i for i, slot in enumerate(self.slots)}
+        img = self.image.copy()
+        draw(_PaintedSurface(ImageDraw.Draw(img), lambda c: slots.setdefault(c, len(slots)), scale))
+        return _ViewGeometry(image=img, slots=tuple(slots))
+
+
+def _resolver(colors: BuildingColorScheme) -> Callable[[_Color], RGB]:
+    memo: Dict[_Color, RGB] = {}
+
+    def resolve(color: _Color) -> RGB:
+        rgb = memo.get(color)
+        if rgb is None:
+            rgb = memo[color] = color.rgb(colors) if isinstance(color, _Paint) else color
+        return rgb
+
+    return resolve
+
+
+# The drawers compute each view's geometry once into a scene: `_SceneShape`s in canvas pixels
+# with style slots instead of colors, memoized per canvas (background, ground, frame), per view
+# and building size (structure), and per opening set (openings). The back ends only replay
+# scenes: the vector/SVG/PDF path resolves the slots to RGB, and the raster path paints them
+# into cached palette layers, each drawn on a copy of the one below (ground, structure,
+# openings, then the frame stamped from a mask). Changing the openings reuses the structure;
+# changing the size reuses the background and frame; changing colors reuses everything.
+# "texture" (siding lines and roof seams) is recorded within the structure, since the roof
+# overdraws the top of the siding. Drafts replay the full-canvas scene scaled down to
+# `DRAFT_VIEW_SCALE`, from a structure scene without the texture.
+_Scene = Tuple[_SceneShape, ...]
+
+
+def _record(draw: Callable[[_SceneRecorder], None]) -> _Scene:
+    rec = _SceneRecorder()
+    draw(rec)
+    return tuple(rec.shapes)
+
+
+def _replay(scene: _Scene, d: _Surface) -> None:
+    for shape in scene:
+        shape.draw(d)
+
+
+@functools.lru_cache(maxsize=16)
+def _ground_scene(canvas_px: Tuple[int, int]) -> _Scene:
     cw, ch = canvas_px
-    cw = _clamp_int("canvas_width_px", int(cw), min_value=320, max_value=2400)
-    ch = _clamp_int("canvas_height_px", int(ch), min_value=240, max_value=1600)
 
-    bg = (245, 245, 245)
-    ground = (220, 220, 220)
-    trim = _color(colors.trim)
-    roof = _color(colors.roof)
-    sides = _color(colors.sides)
+    def draw(d: _SceneRecorder) -> None:
+        d.rectangle([0, 0, cw - 1, ch - 1], fill=_BACKGROUND)
+        _draw_ground(d, canvas_px)
+
+    return _record(draw)
+
 
-    img = Image.new("RGB", (cw, ch), bg)
-    d = ImageDraw.Draw(img)
+@functools.lru_cache(maxsize=16)
+def _frame_scene(canvas_px: Tuple[int, int]) -> _Scene:
+    return _record(lambda d: _draw_frame(d, canvas_px))
 
-    # ground plane
-    ground_h = int(ch * 0.32)
-    d.rectangle([0, ch - ground_h, cw, ch], fill=ground)
-    ground_top_y = ch - ground_h
 
-    if name == "isometric":
-        _draw_isometric(
+@functools.lru_cache(maxsize=64)
+def _structure_scene(
+    name: str, width_ft: int, length_ft: int, height_ft: int, canvas_px: Tuple[int, int], texture: bool
+) -> _Scene:
+    return _record(
+        lambda d: _draw_building(
             d,
-            canvas_px=(cw, ch),
-            ground_top_y=ground_top_y,
+            name=name,
             width_ft=width_ft,
             length_ft=length_ft,
             height_ft=height_ft,
-            roof=roof,
-            trim=trim,
-            sides=sides,
-            openings=openings,
+            openings=(),
+            canvas_px=canvas_px,
+            layers=("structure", "texture") if texture else ("structure",),
         )
-    else:
-        _draw_elevation(
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _openings_scene(
+    name: str,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    openings: Tuple[BuildingOpening, ...],
+    canvas_px: Tuple[int, int],
+) -> _Scene:
+    return _record(
+        lambda d: _draw_building(
             d,
-            canvas_px=(cw, ch),
-            ground_top_y=ground_top_y,
-            side=name,
+            name=name,
             width_ft=width_ft,
             length_ft=length_ft,
             height_ft=height_ft,
-            roof=roof,
-            trim=trim,
-            sides=sides,
             openings=openings,
+            canvas_px=canvas_px,
+            layers=("openings",),
         )
+    )
 
+
+@functools.lru_cache(maxsize=128)
+def _view_scene(
+    name: str,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    openings: Tuple[BuildingOpening, ...],
+    canvas_px: Tuple[int, int],
+) -> _Scene:
+    """
+    The whole view, background first and frame last.
+    """
+    return (
+        _ground_scene(canvas_px)
+        + _structure_scene(name, width_ft, length_ft, height_ft, canvas_px, True)
+        + _openings_scene(name, width_ft, length_ft, height_ft, openings, canvas_px)
+        + _frame_scene(canvas_px)
+    )
+
+
+def _layer_scale(draft: bool) -> float:
+    return DRAFT_VIEW_SCALE if draft else 1.0
+
+
+def _layer_size(canvas_px: Tuple[int, int], draft: bool) -> Tuple[int, int]:
+    k = _layer_scale(draft)
+    return max(1, int(canvas_px[0] * k)), max(1, int(canvas_px[1] * k))
+
+
+_T = TypeVar("_T")
+
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    currbytes: int
+
+
+def _pixel_bytes(value: object) -> int:
+    img = value.image if isinstance(value, _ViewGeometry) else value
+    if not isinstance(img, Image.Image):
+        return 0
+    # PIL keeps "1"/"L"/"P" at one byte per pixel and RGB(A) at four.
+    return img.width * img.height * (1 if img.mode in ("1", "L", "P") else 4)
+
+
+class _PixelLruCache(Generic[_T]):
+    """
+    `functools.lru_cache` for the raster layer caches, bounded by pixel bytes as well as entry
+    count: a 2400x1600 layer is ~3.8 MB, so a count alone would let a long-lived worker keep
+    hundreds of MB of large canvases. Results bigger than the whole budget are returned but
+    not kept. Same `cache_info()` / `cache_clear()` as lru_cache, plus `currbytes`.
+    """
+
+    def __init__(self, fn: Callable[..., _T], *, maxsize: int, max_bytes: int) -> None:
+        functools.update_wrapper(self, fn)
+        self._fn = fn
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, Tuple[_T, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args: object) -> _T:
+        with self._lock:
+            entry = self._entries.get(args)
+            if entry is not None:
+                self._entries.move_to_end(args)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        value = self._fn(*args)
+        size = _pixel_bytes(value)
+        with self._lock:
+            if size > self._max_bytes:
+                return value
+            if args in self._entries:
+                # Another thread built the same entry meanwhile; keep the first.
+                return self._entries[args][0]
+            self._entries[args] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self._maxsize or self._bytes > self._max_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+        return value
+
+    def cache_info(self) -> _CacheInfo:
+        with self._lock:
+            return _CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries), self._bytes)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+
+def _pixel_lru_cache(*, maxsize: int, max_bytes: int) -> Callable[[Callable[..., _T]], _PixelLruCache[_T]]:
+    return lambda fn: _PixelLruCache(fn, maxsize=maxsize, max_bytes=max_bytes)
+
+
+# Worst case the four raster caches below hold 16 + 16 + 32 + 64 = 128 MB of pixels (e.g. ~33
+# full 2400x1600 layers); at the usual 900x520 a layer is ~0.45 MB and the entry counts bind first.
+@_pixel_lru_cache(maxsize=16, max_bytes=16 * 1024 * 1024)
+def _ground_layer(canvas_px: Tuple[int, int], draft: bool = False) -> _ViewGeometry:
+    base = _ViewGeometry(image=Image.new("P", _layer_size(canvas_px, draft), 0), slots=(_BACKGROUND,))
+    return base.extend(lambda d: _replay(_ground_scene(canvas_px), d), scale=_layer_scale(draft))
+
+
+@_pixel_lru_cache(maxsize=16, max_bytes=16 * 1024 * 1024)
+def _frame_mask(canvas_px: Tuple[int, int], draft: bool = False) -> Image.Image:
+    mask = Image.new("1", _layer_size(canvas_px, draft), 0)
+    _replay(_frame_scene(canvas_px), _PaintedSurface(ImageDraw.Draw(mask), lambda c: 1, _layer_scale(draft)))
+    return mask
+
+
+@_pixel_lru_cache(maxsize=64, max_bytes=32 * 1024 * 1024)
+def _structure_layer(
+    name: str, width_ft: int, length_ft: int, height_ft: int, canvas_px: Tuple[int, int], draft: bool = False
+) -> _ViewGeometry:
+    scene = _structure_scene(name, width_ft, length_ft, height_ft, canvas_px, not draft)
+    return _ground_layer(canvas_px, draft).extend(lambda d: _replay(scene, d), scale=_layer_scale(draft))
+
+
+@_pixel_lru_cache(maxsize=128, max_bytes=64 * 1024 * 1024)
+def _view_geometry(
+    name: str,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    openings: Tuple[BuildingOpening, ...],
+    canvas_px: Tuple[int, int],
+    draft: bool = False,
+) -> _ViewGeometry:
+    """
+    Rasterize a view once per geometry, with a stable palette slot per paint.
+    """
+    structure = _structure_layer(name, width_ft, length_ft, height_ft, canvas_px, draft)
+    slots: Dict[_Color, int] = {slot: i for i, slot in enumerate(structure.slots)}
+    img = structure.image.copy()
+    if openings:
+        _replay(
+            _openings_scene(name, width_ft, length_ft, height_ft, openings, canvas_px),
+            _PaintedSurface(ImageDraw.Draw(img), lambda c: slots.setdefault(c, len(slots)), _layer_scale(draft)),
+        )
+    img.paste(slots.setdefault(_FRAME, len(slots)), (0, 0), _frame_mask(canvas_px, draft))
+    return _ViewGeometry(image=img, slots=tuple(slots))
+
+
+def _ground_top_y(canvas_px: Tuple[int, int]) -> int:
+    return canvas_px[1] - int(canvas_px[1] * 0.32)
+
+
+def _draw_ground(d: _Surface, canvas_px: Tuple[int, int]) -> None:
+    cw, ch = canvas_px
+    d.rectangle([0, _ground_top_y(canvas_px), cw, ch], fill=_GROUND)
+
+
+def _draw_frame(d: _Surface, canvas_px: Tuple[int, int]) -> None:
     # subtle frame
-    d.rectangle([8, 8, cw - 9, ch - 9], outline=(190, 190, 190), width=2)
-    return img
+    cw, ch = canvas_px
+    d.rectangle([8, 8, cw - 9, ch - 9], outline=_FRAME, width=2)
+
+
+def _draw_building(
+    d: _Surface,
+    *,
+    name: str,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    openings: Tuple[BuildingOpening, ...],
+    canvas_px: Tuple[int, int],
+    layers: Tuple[str, ...],
+) -> None:
+    trim = _Paint("trim")
+    roof = _Paint("roof")
+    sides = _Paint("sides")
+    draw = _draw_isometric if name == "isometric" else functools.partial(_draw_elevation, side=name)
+    draw(
+        d,
+        canvas_px=canvas_px,
+        ground_top_y=_ground_top_y(canvas_px),
+        width_ft=width_ft,
+        length_ft=length_ft,
+        height_ft=height_ft,
+        roof=roof,
+        trim=trim,
+        sides=sides,
+        openings=openings,
+        layers=layers,
+    )
 
 
 def _draw_isometric(
-    d: ImageDraw.ImageDraw,
+    d: _Surface,
     *,
     canvas_px: Tuple[int, int],
     ground_top_y: int,
     width_ft: int,
     length_ft: int,
     height_ft: int,
-    roof: Tuple[int, int, int],
-    trim: Tuple[int, int, int],
-    sides: Tuple[int, int, int],
+    roof: _Color,
+    trim: _Color,
+    sides: _Color,
     openings: Tuple[BuildingOpening, ...],
+    layers: Tuple[str, ...],
 ) -> None:
     cw, ch = canvas_px
 
@@ -238,70 +931,74 @@ def _draw_isometric(
     ridge_front = (x0 + int(w * 0.52), y0 - h - roof_rise)
     ridge_back = (ridge_front[0] + dx, ridge_front[1] - dy)
 
-    # Draw order: far roof, side, front, near roof edge.
-    d.polygon([roof_back_left, roof_back_right, ridge_back], fill=_shade(roof, 0.88), outline=trim)
-    # Left roof plane (was missing; without it the roof looks like it has a hole).
-    d.polygon([roof_front_left, roof_back_left, ridge_back, ridge_front], fill=_shade(roof, 0.92), outline=trim)
-    d.polygon([roof_front_right, roof_back_right, ridge_back, ridge_front], fill=_shade(roof, 0.95), outline=trim)
-
-    d.polygon(side_face, fill=_shade(sides, 0.93), outline=trim)
-    d.polygon(front, fill=sides, outline=trim)
-
-    # Simple vertical siding texture (subtle)
-    _draw_siding_lines(d, x0=x0, y0=y0, w=w, h=h, line_color=_shade(trim, 0.8), every_px=10)
-
-    # roof front triangle
-    d.polygon([roof_front_left, roof_front_right, ridge_front], fill=roof, outline=trim)
-
-    # trim lines
-    d.line([roof_front_left, ridge_front, roof_front_right], fill=trim, width=3)
-    d.line([ridge_front, ridge_back], fill=trim, width=3)
-    d.line([roof_front_right, roof_back_right], fill=trim, width=3)
-    d.line([roof_front_left, roof_back_left], fill=trim, width=2)
-
-    # Roof panel/seam lines to distinguish roof planes
-    seam = _shade(trim, 0.75)
-    # Left roof plane lines (eave->ridge)
-    for i in range(1, 7):
-        u = i / 8.0
-        p_eave = _lerp_pt(roof_front_left, roof_back_left, u)
-        p_ridge = _lerp_pt(ridge_front, ridge_back, u)
-        d.line([p_eave, p_ridge], fill=seam, width=1)
-    # Right roof plane lines (eave->ridge)
-    for i in range(1, 7):
-        u = i / 8.0
-        p_eave = _lerp_pt(roof_front_right, roof_back_right, u)
-        p_ridge = _lerp_pt(ridge_front, ridge_back, u)
-        d.line([p_eave, p_ridge], fill=seam, width=1)
-
-    # Openings (front + right side are visible in this isometric orientation)
-    _draw_openings_isometric_front(
-        d,
-        openings=_filter_openings(openings, BuildingSide.FRONT),
-        wall_x0=x0,
-        wall_y0=y0,
-        wall_w_px=w,
-        wall_h_px=h,
-        width_ft=width_ft,
-        height_ft=height_ft,
-        trim=trim,
-    )
-    _draw_openings_isometric_side(
-        d,
-        openings=_filter_openings(openings, BuildingSide.RIGHT),
-        wall_x0=x0 + w,
-        wall_y0=y0,
-        wall_h_px=h,
-        length_ft=length_ft,
-        height_ft=height_ft,
-        dx=dx,
-        dy=dy,
-        trim=trim,
-    )
+    if "structure" in layers:
+        # Draw order: far roof, side, front, near roof edge.
+        d.polygon([roof_back_left, roof_back_right, ridge_back], fill=_shade(roof, 0.88), outline=trim)
+        # Left roof plane (was missing; without it the roof looks like it has a hole).
+        d.polygon([roof_front_left, roof_back_left, ridge_back, ridge_front], fill=_shade(roof, 0.92), outline=trim)
+        d.polygon([roof_front_right, roof_back_right, ridge_back, ridge_front], fill=_shade(roof, 0.95), outline=trim)
+
+        d.polygon(side_face, fill=_shade(sides, 0.93), outline=trim)
+        d.polygon(front, fill=sides, outline=trim)
+
+        # Simple vertical siding texture (subtle)
+        if "texture" in layers:
+            _draw_siding_lines(d, x0=x0, y0=y0, w=w, h=h, line_color=_shade(trim, 0.8), every_px=10)
+
+        # roof front triangle
+        d.polygon([roof_front_left, roof_front_right, ridge_front], fill=roof, outline=trim)
+
+        # trim lines
+        d.line([roof_front_left, ridge_front, roof_front_right], fill=trim, width=3)
+        d.line([ridge_front, ridge_back], fill=trim, width=3)
+        d.line([roof_front_right, roof_back_right], fill=trim, width=3)
+        d.line([roof_front_left, roof_back_left], fill=trim, width=2)
+
+        # Roof panel/seam lines to distinguish roof planes
+        if "texture" in layers:
+            seam = _shade(trim, 0.75)
+            # Left roof plane lines (eave->ridge)
+            for i in range(1, 7):
+                u = i / 8.0
+                p_eave = _lerp_pt(roof_front_left, roof_back_left, u)
+                p_ridge = _lerp_pt(ridge_front, ridge_back, u)
+                d.line([p_eave, p_ridge], fill=seam, width=1)
+            # Right roof plane lines (eave->ridge)
+            for i in range(1, 7):
+                u = i / 8.0
+                p_eave = _lerp_pt(roof_front_right, roof_back_right, u)
+                p_ridge = _lerp_pt(ridge_front, ridge_back, u)
+                d.line([p_eave, p_ridge], fill=seam, width=1)
+
+    if "openings" in layers:
+        # Openings (front + right side are visible in this isometric orientation)
+        _draw_openings_isometric_front(
+            d,
+            openings=_filter_openings(openings, BuildingSide.FRONT),
+            wall_x0=x0,
+            wall_y0=y0,
+            wall_w_px=w,
+            wall_h_px=h,
+            width_ft=width_ft,
+            height_ft=height_ft,
+            trim=trim,
+        )
+        _draw_openings_isometric_side(
+            d,
+            openings=_filter_openings(openings, BuildingSide.RIGHT),
+            wall_x0=x0 + w,
+            wall_y0=y0,
+            wall_h_px=h,
+            length_ft=length_ft,
+            height_ft=height_ft,
+            dx=dx,
+            dy=dy,
+            trim=trim,
+        )
 
 
 def _draw_elevation(
-    d: ImageDraw.ImageDraw,
+    d: _Surface,
     *,
     canvas_px: Tuple[int, int],
     ground_top_y: int,
@@ -309,10 +1006,11 @@ def _draw_elevation(
     width_ft: int,
     length_ft: int,
     height_ft: int,
-    roof: Tuple[int, int, int],
-    trim: Tuple[int, int, int],
-    sides: Tuple[int, int, int],
+    roof: _Color,
+    trim: _Color,
+    sides: _Color,
     openings: Tuple[BuildingOpening, ...],
+    layers: Tuple[str, ...],
 ) -> None:
     cw, ch = canvas_px
     is_end = side in ("front", "back")
@@ -333,47 +1031,52 @@ def _draw_elevation(
     x0 = int((cw - w) / 2)
     y0 = int(ground_top_y + 18)
 
-    # wall
-    d.rectangle([x0, y0 - h, x0 + w, y0], fill=sides, outline=trim, width=3)
-    _draw_siding_lines(d, x0=x0, y0=y0, w=w, h=h, line_color=_shade(trim, 0.8), every_px=10)
+    if "structure" in layers:
+        # wall
+        d.rectangle([x0, y0 - h, x0 + w, y0], fill=sides, outline=trim, width=3)
+        if "texture" in layers:
+            _draw_siding_lines(d, x0=x0, y0=y0, w=w, h=h, line_color=_shade(trim, 0.8), every_px=10)
 
-    if is_end:
-        # Front/back: gable roof (matches vendor FRONT/BACK pages)
-        ridge_x = x0 + int(w * 0.5)
-        ridge_y = y0 - h - roof_rise
-        d.polygon([(x0, y0 - h), (x0 + w, y0 - h), (ridge_x, ridge_y)], fill=roof, outline=trim)
+        if is_end:
+            # Front/back: gable roof (matches vendor FRONT/BACK pages)
+            ridge_x = x0 + int(w * 0.5)
+            ridge_y = y0 - h - roof_rise
+            d.polygon([(x0, y0 - h), (x0 + w, y0 - h), (ridge_x, ridge_y)], fill=roof, outline=trim)
 
-        # roof edge line
-        d.line([(x0, y0 - h), (ridge_x, ridge_y), (x0 + w, y0 - h)], fill=trim, width=3)
-    else:
-        # Left/right: vendor shows a shallow "roof cap" (not a gable peak).
-        overhang = max(6, int(w * 0.02))
-        cap_h = max(10, int(h * 0.10))
-        bl = (x0 - overhang, y0 - h)
-        br = (x0 + w + overhang, y0 - h)
-        tr = (x0 + w + overhang - int(overhang * 0.65), y0 - h - cap_h)
-        tl = (x0 - overhang + int(overhang * 0.65), y0 - h - cap_h)
-        d.polygon([bl, br, tr, tl], fill=roof, outline=trim)
-        # thicker eave line
-        d.line([bl, br], fill=trim, width=3)
-
-    # Openings
-    side_enum = BuildingSide(side)
-    face_ft = width_ft if is_end else length_ft
-    _draw_openings_elevation(
-        d,
-        openings=_filter_openings(openings, side_enum),
-        wall_x0=x0,
-        wall_y0=y0,
-        wall_w_px=w,
-        wall_h_px=h,
-        wall_ft=face_ft,
-        height_ft=height_ft,
-        trim=trim,
-    )
+            # roof edge line
+            d.line([(x0, y0 - h), (ridge_x, ridge_y), (x0 + w, y0 - h)], fill=trim, width=3)
+        else:
+            # Left/right: vendor shows a shallow "roof cap" (not a gable peak).
+            overhang = max(6, int(w * 0.02))
+            cap_h = max(10, int(h * 0.10))
+            bl = (x0 - overhang, y0 - h)
+            br = (x0 + w + overhang, y0 - h)
+            tr = (x0 + w + overhang - int(overhang * 0.65), y0 - h - cap_h)
+            tl = (x0 - overhang + int(overhang * 0.65), y0 - h - cap_h)
+            d.polygon([bl, br, tr, tl], fill=roof, outline=trim)
+            # thicker eave line
+            d.line([bl, br], fill=trim, width=3)
+
+    if "openings" in layers:
+        # Openings
+        side_enum = BuildingSide(side)
+        face_ft = width_ft if is_end else length_ft
+        _draw_openings_elevation(
+            d,
+            openings=_filter_openings(openings, side_enum),
+            wall_x0=x0,
+            wall_y0=y0,
+            wall_w_px=w,
+            wall_h_px=h,
+            wall_ft=face_ft,
+            height_ft=height_ft,
+            trim=trim,
+        )
 
 
-def _shade(rgb: Tuple[int, int, int], factor: float) -> Tuple[int, int, int]:
+def _shade(rgb: _Color, factor: float) -> _Color:
+    if isinstance(rgb, _Paint):
+        return _Paint(rgb.base, rgb.factors + (float(factor),))
     f = max(0.0, min(1.0, float(factor)))
     r, g, b = rgb
     return (int(r * f), int(g * f), int(b * f))
@@ -421,31 +1124,175 @@ def _filter_openings(openings: Tuple[BuildingOpening, ...], side: BuildingSide)
     return tuple(o for o in openings if o.side == side)
 
 
-def _auto_offsets_ft(openings: Tuple[BuildingOpening, ...], *, wall_ft: int) -> list[int]:
+@dataclass(frozen=True)
+class OpeningPlacement:
     """
-    Auto-place openings evenly across the wall if they don't specify offsets.
+    Where the layout put one opening, in feet along its wall from the left edge.
     """
-    if wall_ft <= 0:
-        return [0 for _ in openings]
 
-    n = len(openings)
-    if n <= 0:
-        return []
+    opening: BuildingOpening
+    start_ft: float
+    end_ft: float
+
+    @property
+    def center_ft(self) -> float:
+        return (self.start_ft + self.end_ft) / 2.0
 
-    usable = max(1, wall_ft - 2)
-    # Evenly spaced centers; clamp to [1, wall_ft-1]
-    centers = [int(round((i + 1) * usable / (n + 1))) for i in range(n)]
-    return [max(1, min(wall_ft - 1, c)) for c in centers]
+
+@dataclass(frozen=True)
+class OpeningLayout:
+    placements: Tuple[OpeningPlacement, ...]  # same order as the openings passed in
+    warnings: Tuple[str, ...]
+
+
+def layout_openings(
+    openings: Tuple[BuildingOpening, ...],
+    *,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int = 30,
+) -> OpeningLayout:
+    """
+    Lay every opening out on its wall the way the views draw it.
+
+    Openings with an `offset_ft` are placed first, centered there (slid back onto the wall if
+    they hang off an end). Auto-placed openings then fill the gaps the explicit ones leave, spread
+    evenly with their widths taken into account. `warnings` lists, in plain words, every opening
+    that overlaps another or did not fit, so the chat can tell the customer.
+    """
+    w, l, h, safe, _ = _view_request(width_ft, length_ft, height_ft, openings, ())
+    spans: List[Tuple[float, float]] = [(0.0, 0.0)] * len(safe)
+    warnings: List[str] = []
+    for side in BuildingSide:
+        index = [i for i, o in enumerate(safe) if o.side == side]
+        if not index:
+            continue
+        wall_ft = w if side in (BuildingSide.FRONT, BuildingSide.BACK) else l
+        wall = _layout_wall(tuple(safe[i] for i in index), wall_ft)
+        for i, span in zip(index, wall.spans):
+            spans[i] = span
+        warnings.extend(wall.warnings)
+    return OpeningLayout(
+        placements=tuple(OpeningPlacement(opening=o, start_ft=s, end_ft=e) for o, (s, e) in zip(safe, spans)),
+        warnings=tuple(warnings),
+    )
+
+
+@dataclass(frozen=True)
+class _WallLayout:
+    spans: Tuple[Tuple[float, float], ...]
+    warnings: Tuple[str, ...]
+
+
+def _wall_centers(openings: Tuple[BuildingOpening, ...], *, wall_ft: int) -> List[float]:
+    return [(s + e) / 2.0 for s, e in _layout_wall(openings, wall_ft).spans]
+
+
+def _ft(value: float) -> str:
+    return f"{round(value, 1):g} ft"
+
+
+def _opening_label(o: BuildingOpening, span: Tuple[float, float]) -> str:
+    return f"the {o.kind.value.replace('_', ' ')} at {_ft((span[0] + span[1]) / 2.0)}"
+
+
+@functools.lru_cache(maxsize=256)
+def _layout_wall(openings: Tuple[BuildingOpening, ...], wall_ft: int) -> _WallLayout:
+    """
+    Interval layout for the openings on one wall (all the same side, already normalized).
+
+    Explicit openings are sorted by their left edge and swept once, which both reports overlaps
+    and yields the free gaps between them. Auto-placed openings are then dealt out to those gaps,
+    each to the gap that would keep the most even spacing with it added (via a heap), and spaced
+    evenly inside each. O(n log n) in the number of openings.
+    """
+    if not openings:
+        return _WallLayout(spans=(), warnings=())
+    wall = f"{openings[0].side.value.capitalize()} wall"
+    spans: List[Tuple[float, float]] = [(0.0, 0.0)] * len(openings)
+    warnings: List[str] = []
+
+    explicit = [i for i, o in enumerate(openings) if o.offset_ft is not None]
+    for i in explicit:
+        o = openings[i]
+        half = o.width_ft / 2.0
+        center = min(max(float(o.offset_ft), half), wall_ft - half)
+        spans[i] = (center - half, center + half)
+
+    gaps: List[Tuple[float, float]] = []
+    cursor = 0.0
+    reach: Optional[int] = None  # the explicit opening reaching furthest right so far
+    for i in sorted(explicit, key=lambda j: (spans[j][0], j)):
+        start, end = spans[i]
+        if reach is not None and start < spans[reach][1]:
+            warnings.append(
+                f"{wall}: {_opening_label(openings[i], spans[i])} overlaps {_opening_label(openings[reach], spans[reach])}."
+            )
+        if start > cursor:
+            gaps.append((cursor, start))
+        if reach is None or end > spans[reach][1]:
+            reach = i
+        cursor = max(cursor, end)
+    if cursor < wall_ft:
+        gaps.append((cursor, float(wall_ft)))
+
+    auto = [i for i, o in enumerate(openings) if o.offset_ft is None]
+    if auto and not gaps:
+        warnings.append(f"{wall}: no room left for {len(auto)} auto-placed opening(s); they overlap other openings.")
+        gaps.append((0.0, float(wall_ft)))
+    members: List[List[int]] = [[] for _ in gaps]
+    used = [0.0] * len(gaps)
+
+    def room(g: int, width: float) -> float:
+        # Even spacing gap `g` would have if an opening `width` wide went in next.
+        start, end = gaps[g]
+        return (end - start - used[g] - width) / (len(members[g]) + 2)
+
+    # Widest first, so each heap only ever compares gaps for one width; walls have few distinct widths.
+    heap: List[Tuple[float, int]] = []
+    heap_width: Optional[float] = None
+    for i in sorted(auto, key=lambda j: (-openings[j].width_ft, j)):
+        width = openings[i].width_ft
+        if width != heap_width:
+            heap = [(-room(g, width), g) for g in range(len(gaps))]
+            heapq.heapify(heap)
+            heap_width = width
+        _, g = heapq.heappop(heap)
+        members[g].append(i)
+        used[g] += width
+        heapq.heappush(heap, (-room(g, width), g))
+
+    for g, idx in enumerate(members):
+        if not idx:
+            continue
+        idx.sort()  # left to right in the order they were given
+        start, end = gaps[g]
+        room = (end - start - used[g]) / (len(idx) + 1)
+        if room < 0:
+            warnings.append(
+                f"{wall}: {len(idx)} auto-placed opening(s) need {_ft(used[g])} but only "
+                f"{_ft(end - start)} is free between {_ft(start)} and {_ft(end)}; they overlap."
+            )
+            step = (end - start) / (len(idx) + 1)
+            for k, i in enumerate(idx):
+                center = start + step * (k + 1)
+                spans[i] = (center - openings[i].width_ft / 2.0, center + openings[i].width_ft / 2.0)
+            continue
+        x = start + room
+        for i in idx:
+            spans[i] = (x, x + openings[i].width_ft)
+            x += openings[i].width_ft + room
+    return _WallLayout(spans=tuple(spans), warnings=tuple(warnings))
 
 
 def _draw_siding_lines(
-    d: ImageDraw.ImageDraw,
+    d: _Surface,
     *,
     x0: int,
     y0: int,
     w: int,
     h: int,
-    line_color: Tuple[int, int, int],
+    line_color: _Color,
     every_px: int,
 ) -> None:
     if every_px <= 0:
@@ -456,7 +1303,7 @@ def _draw_siding_lines(
 
 
 def _draw_openings_elevation(
-    d: ImageDraw.ImageDraw,
+    d: _Surface,
     *,
     openings: Tuple[BuildingOpening, ...],
     wall_x0: int,
@@ -465,14 +1312,13 @@ def _draw_openings_elevation(
     wall_h_px: int,
     wall_ft: int,
     height_ft: int,
-    trim: Tuple[int, int, int],
+    trim: _Color,
 ) -> None:
     if not openings:
         return
 
-    offsets = _auto_offsets_ft(openings, wall_ft=wall_ft)
-    for i, o in enumerate(openings):
-        off_ft = o.offset_ft if o.offset_ft is not None else offsets[i]
+    centers = _wall_centers(openings, wall_ft=wall_ft)
+    for o, off_ft in zip(openings, centers):
         w_px = max(8, int((o.width_ft / max(1, wall_ft)) * wall_w_px))
         h_px = max(10, int((o.height_ft / max(1, height_ft)) * wall_h_px))
         cx = wall_x0 + int((off_ft / max(1, wall_ft)) * wall_w_px)
@@ -493,13 +1339,13 @@ def _draw_openings_elevation(
 
 
 def _draw_door_rect(
-    d: ImageDraw.ImageDraw,
+    d: _Surface,
     *,
     x1: int,
     y1: int,
     x2: int,
     y2: int,
-    trim: Tuple[int, int, int],
+    trim: _Color,
     is_garage: bool,
 ) -> None:
     fill = (250, 250, 250)
@@ -518,13 +1364,13 @@ def _draw_door_rect(
 
 
 def _draw_window_rect(
-    d: ImageDraw.ImageDraw,
+    d: _Surface,
     *,
     x1: int,
     y1: int,
     x2: int,
     y2: int,
-    trim: Tuple[int, int, int],
+    trim: _Color,
 ) -> None:
     glass = (245, 248, 255)
     outline = _shade(trim, 0.9)
@@ -537,7 +1383,7 @@ def _draw_window_rect(
 
 
 def _draw_openings_isometric_front(
-    d: ImageDraw.ImageDraw,
+    d: _Surface,
     *,
     openings: Tuple[BuildingOpening, ...],
     wall_x0: int,
@@ -546,13 +1392,12 @@ def _draw_openings_isometric_front(
     wall_h_px: int,
     width_ft: int,
     height_ft: int,
-    trim: Tuple[int, int, int],
+    trim: _Color,
 ) -> None:
     if not openings:
         return
-    offsets = _auto_offsets_ft(openings, wall_ft=width_ft)
-    for i, o in enumerate(openings):
-        off_ft = o.offset_ft if o.offset_ft is not None else offsets[i]
+    centers = _wall_centers(openings, wall_ft=width_ft)
+    for o, off_ft in zip(openings, centers):
         w_px = max(8, int((o.width_ft / max(1, width_ft)) * wall_w_px))
         h_px = max(10, int((o.height_ft / max(1, height_ft)) * wall_h_px))
         cx = wall_x0 + int((off_ft / max(1, width_ft)) * wall_w_px)
@@ -570,7 +1415,7 @@ def _draw_openings_isometric_front(
 
 
 def _draw_openings_isometric_side(
-    d: ImageDraw.ImageDraw,
+    d: _Surface,
     *,
     openings: Tuple[BuildingOpening, ...],
     wall_x0: int,
@@ -580,13 +1425,12 @@ def _draw_openings_isometric_side(
     height_ft: int,
     dx: int,
     dy: int,
-    trim: Tuple[int, int, int],
+    trim: _Color,
 ) -> None:
     if not openings:
         return
-    offsets = _auto_offsets_ft(openings, wall_ft=length_ft)
-    for i, o in enumerate(openings):
-        off_ft = o.offset_ft if o.offset_ft is not None else offsets[i]
+    centers = _wall_centers(openings, wall_ft=length_ft)
+    for o, off_ft in zip(openings, centers):
         u_center = off_ft / max(1, length_ft)
         u0 = max(0.0, u_center - (o.width_ft / max(1, length_ft)) / 2.0)
         u1 = min(1.0, u0 + (o.width_ft / max(1, length_ft)))
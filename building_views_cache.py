@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+"""
+Disk-backed LRU cache of encoded building views, shared by every process on the host.
+
+`st.cache_data` kept rendered previews per process, unbounded and lost on restart. This cache
+is content-addressed instead: one file per view, keyed by a canonical hash of what the view
+depends on (clamped dimensions, resolved RGB colors, normalized openings, canvas size, encoding,
+draft or full, and `BUILDING_VIEWS_RENDERER_VERSION`). App workers and batch scripts that ask
+for the same raster view share one entry. Quote PDFs draw the views as vectors and don't use it.
+
+Layout: `<root>/ab/abcdef....png` (or `.webp`), stored by `disk_lru_cache.DiskLruCache`
+(atomic writes, LRU eviction once the cache exceeds `max_bytes`, per-process hit/miss counts).
+
+Environment:
+- `BUILDING_VIEW_CACHE=0` disables the cache
+- `BUILDING_VIEW_CACHE_DIR` (default: `<tmp>/steven-demo-building-views`)
+- `BUILDING_VIEW_CACHE_MAX_MB` (default: 128)
+"""
+
+import hashlib
+import json
+import tempfile
+from concurrent.futures import Executor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from building_views import (
+    BUILDING_VIEWS_RENDERER_VERSION,
+    DEFAULT_VIEW_ENCODING,
+    BuildingColorScheme,
+    BuildingOpening,
+    ViewEncoding,
+    _canvas_size,
+    _color,
+    _view_request,
+    render_building_views_png,
+)
+from disk_lru_cache import DiskLruCache, DiskLruCacheStats, disk_lru_settings_from_env
+
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "steven-demo-building-views"
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+BUILDING_VIEW_CACHE_SCHEMA_VERSION = 1
+
+_SUFFIXES = {"PNG": ".png", "WEBP": ".webp"}
+_MAGIC = {".png": b"\x89PNG", ".webp": b"RIFF"}
+
+
+def building_view_cache_key(
+    *,
+    name: str,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    colors: BuildingColorScheme,
+    openings: Tuple[BuildingOpening, ...],
+    canvas_px: Tuple[int, int],
+    encoding: ViewEncoding,
+    draft: bool = False,
+) -> str:
+    """
+    sha256 over one view's inputs as the renderer sees them, so inputs that draw the same
+    picture (e.g. "Blue" and its hex, an out-of-range size and its clamp) share an entry.
+    """
+    w, l, h, safe_openings, _ = _view_request(width_ft, length_ft, height_ft, openings, ())
+    payload = {
+        "schema": BUILDING_VIEW_CACHE_SCHEMA_VERSION,
+        "renderer": BUILDING_VIEWS_RENDERER_VERSION,
+        "view": name,
+        "size_ft": [w, l, h],
+        "colors": {part: list(_color(getattr(colors, part))) for part in ("roof", "trim", "sides")},
+        "openings": [
+            [o.side.value, o.kind.value, o.width_ft, o.height_ft, o.offset_ft] for o in safe_openings
+        ],
+        "canvas_px": list(_canvas_size(canvas_px)),
+        "encoding": asdict(encoding),
+        "draft": bool(draft),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# Kept as its own name for callers; the stats come from the shared disk LRU.
+BuildingViewCacheStats = DiskLruCacheStats
+
+
+class BuildingViewDiskCache(DiskLruCache):
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        super().__init__(root, max_bytes=max_bytes, magic=_MAGIC, label="building view cache")
+
+    def get(self, key: str, encoding: ViewEncoding = DEFAULT_VIEW_ENCODING) -> Optional[bytes]:
+        return self.read(key, _SUFFIXES[encoding.format])
+
+    def put(self, key: str, data: bytes, encoding: ViewEncoding = DEFAULT_VIEW_ENCODING) -> Path:
+        return self.write(key, _SUFFIXES[encoding.format], lambda f: f.write(data))
+
+
+def render_building_views_cached(
+    cache: Optional[BuildingViewDiskCache],
+    *,
+    width_ft: int,
+    length_ft: int,
+    height_ft: int,
+    colors: BuildingColorScheme,
+    openings: Tuple[BuildingOpening, ...] = (),
+    view_names: Iterable[str] = ("isometric", "front", "back", "left", "right"),
+    canvas_px: Tuple[int, int] = (900, 520),
+    executor: Optional[Executor] = None,
+    encoding: ViewEncoding = DEFAULT_VIEW_ENCODING,
+    draft: bool = False,
+) -> Dict[str, bytes]:
+    """
+    `render_building_views_png`, serving views from `cache` and rendering (then storing) only
+    the missing ones. With `cache=None` this is a plain render.
+    """
+    request = dict(
+        width_ft=width_ft,
+        length_ft=length_ft,
+        height_ft=height_ft,
+        colors=colors,
+        openings=openings,
+        canvas_px=canvas_px,
+        encoding=encoding,
+        draft=draft,
+    )
+    if cache is None:
+        return render_building_views_png(view_names=view_names, executor=executor, **request)
+    names = _view_request(width_ft, length_ft, height_ft, (), view_names)[4]
+    keys = {name: building_view_cache_key(name=name, **request) for name in names}
+    found = {name: cache.get(key, encoding) for name, key in keys.items()}
+    missing = [name for name, data in found.items() if data is None]
+    if missing:
+        rendered = render_building_views_png(view_names=missing, executor=executor, **request)
+        for name, data in rendered.items():
+            found[name] = data
+            try:
+                cache.put(keys[name], data, encoding)
+            except OSError:
+                pass  # the view is rendered either way; it just isn't stored
+    return {name: found[name] for name in names}
+
+
+def building_view_cache_from_env() -> Optional[BuildingViewDiskCache]:
+    settings = disk_lru_settings_from_env(
+        "BUILDING_VIEW_CACHE", default_dir=DEFAULT_CACHE_DIR, default_max_bytes=DEFAULT_MAX_BYTES
+    )
+    if settings is None:
+        return None
+    root, max_bytes = settings
+    return BuildingViewDiskCache(root, max_bytes=max_bytes)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+"""
+Content-addressed files on disk with an LRU byte budget, shared by every process on the host.
+
+The quote PDF cache (`quote_pdf_cache.py`) and the building view cache
+(`building_views_cache.py`) are thin wrappers over `DiskLruCache`: they own their cache keys
+and file suffixes, this module owns the storage.
+
+Layout: `<root>/ab/abcdef....<suffix>`. Entries are written atomically (temp file + rename),
+so readers in other processes never see half a file. A hit bumps the file's mtime, and
+inserts evict least-recently-used entries once the cache exceeds `max_bytes`. An entry whose
+leading bytes don't match its suffix's magic is treated as a miss and removed. Hit/miss
+counters in `stats()` are per cache object (per process).
+"""
+
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class DiskLruCacheStats:
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    hits: int = 0
+    misses: int = 0
+
+
+class DiskLruCache:
+    def __init__(self, root: Path, *, max_bytes: int, magic: Mapping[str, bytes], label: str = "cache") -> None:
+        """
+        `magic` maps each file suffix the cache stores (e.g. ".pdf") to the bytes its files start with.
+        """
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self._magic = dict(magic)
+        self._label = label
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def path(self, key: str, suffix: str) -> Path:
+        if len(key) < 8 or not all(ch in "0123456789abcdef" for ch in key):
+            raise ValueError(f"Invalid {self._label} key: {key!r}")
+        if suffix not in self._magic:
+            raise ValueError(f"Unsupported {self._label} file suffix: {suffix!r}")
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def read(self, key: str, suffix: str) -> Optional[bytes]:
+        path = self.path(key, suffix)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = None
+        if data is not None and not data.startswith(self._magic[suffix]):
+            self._unlink(path)
+            data = None
+        if self._count(data is not None):
+            self._touch(path)
+        return data
+
+    def locate(self, key: str, suffix: str) -> Optional[Path]:
+        """
+        Like `read`, but checks only the entry's leading bytes and returns its path.
+        """
+        path = self.path(key, suffix)
+        magic = self._magic[suffix]
+        try:
+            with path.open("rb") as f:
+                head = f.read(len(magic))
+        except OSError:
+            head = None
+        if head is not None and head != magic:
+            self._unlink(path)
+            head = None
+        if not self._count(head is not None):
+            return None
+        self._touch(path)
+        return path
+
+    def write(self, key: str, suffix: str, write: Callable[[BinaryIO], object]) -> Path:
+        """
+        Store what `write` writes into the file object it is given, then evict down to budget.
+        """
+        path = self.path(key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            self._unlink(Path(tmp))
+            raise
+        self.evict(keep=path)
+        return path
+
+    def _count(self, hit: bool) -> bool:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return hit
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        out: List[Tuple[float, int, Path]] = []
+        if not self.root.is_dir():
+            return out
+        for path in self.root.glob("*/*"):
+            if path.suffix not in self._magic or path.name.startswith("."):
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue  # evicted by another process meanwhile
+            out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def evict(self, *, keep: Optional[Path] = None) -> List[Path]:
+        """
+        Delete least-recently-used entries until the cache fits in `max_bytes`, sparing `keep`
+        (the entry just written, which the caller is about to hand out).
+        """
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        removed: List[Path] = []
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            if self._unlink(path):
+                removed.append(path)
+            total -= size
+        return removed
+
+    def clear(self) -> int:
+        removed = 0
+        for _, _, path in self._entries():
+            removed += int(self._unlink(path))
+        return removed
+
+    def stats(self) -> DiskLruCacheStats:
+        entries = self._entries()
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        return DiskLruCacheStats(
+            entries=len(entries),
+            total_bytes=sum(size for _, size, _ in entries),
+            max_bytes=self.max_bytes,
+            hits=hits,
+            misses=misses,
+        )
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _unlink(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+
+def disk_lru_settings_from_env(
+    prefix: str, *, default_dir: Path, default_max_bytes: int
+) -> Optional[Tuple[Path, int]]:
+    """
+    `(root, max_bytes)` from `<prefix>_DIR` and `<prefix>_MAX_MB`, or None when `<prefix>=0`.
+    """
+    if os.environ.get(prefix, "1").strip().lower() in {"0", "false", "no", "off"}:
+        return None
+    root = str(os.environ.get(f"{prefix}_DIR") or "").strip()
+    try:
+        max_mb = float(os.environ.get(f"{prefix}_MAX_MB") or default_max_bytes / (1024 * 1024))
+    except ValueError:
+        max_mb = default_max_bytes / (1024 * 1024)
+    return (Path(root) if root else default_dir, int(max_mb * 1024 * 1024))
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from artifact_store import find_artifacts, read_artifact_text
+
 
 @dataclass(frozen=True)
 class ExtractedRule:
@@ -30,11 +32,11 @@ class ExtractedPricebook:
 
 
 def find_extracted_pricebooks(out_dir: Path) -> List[Path]:
-    return sorted(out_dir.glob("**/pricebook_extracted.json"))
+    return find_artifacts(out_dir, "pricebook_extracted.json")
 
 
 def load_extracted_pricebook(path: Path) -> ExtractedPricebook:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = json.loads(read_artifact_text(path))
     if not isinstance(data, dict):
         raise ValueError(f"Expected JSON object in {path}")
 
@@ -9,10 +9,13 @@ import re
 import hmac
 import hashlib
 import base64
+import threading
 import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal, Mapping, Optional, TypedDict
+from typing import BinaryIO, Callable, Literal, Mapping, Optional, TypedDict
 from urllib import error as urllib_error
 from urllib import request as urllib_request
 
@@ -21,12 +24,23 @@ import streamlit.components.v1 as components
 
 import ai_intent
 
+from artifact_store import artifact_version
 from building_views import (
     BuildingColorScheme,
     BuildingOpening,
     BuildingOpeningKind,
     BuildingSide,
-    render_building_views_png,
+    BuildingViewDrawing,
+    layout_openings,
+    render_building_views_svg,
+    render_building_views_vector,
+    view_encoding,
+)
+from building_views_cache import (
+    BuildingViewDiskCache,
+    building_view_cache_from_env,
+    building_view_cache_key,
+    render_building_views_cached,
 )
 from normalized_pricebooks import (
     build_demo_pricebook_r29,
@@ -34,13 +48,18 @@ from normalized_pricebooks import (
     find_normalized_pricebooks,
     load_normalized_pricebook,
 )
+from prefetch import BackgroundPrefetcher
 from quote_pdf import (
+    PRODUCTION_PDF_PROFILE,
     QuotePdfArtifact,
     QuotePdfLineItem,
+    QuotePdfOutput,
     QuotePdfTotals,
     logo_png_bytes_from_svg,
-    make_quote_pdf_bytes,
+    quote_pdf_profile,
+    write_quote_pdf,
 )
+from quote_pdf_cache import QuotePdfDiskCache, quote_pdf_cache_from_env, quote_pdf_cache_key, quote_pdf_spool
 from pricing_engine import (
     CarportStyle,
     PriceBook,
@@ -159,31 +178,124 @@ def _password_gate() -> None:
     st.stop()
 
 
-@st.cache_data(show_spinner=False)
-def _cached_building_isometric_png(
-    *,
-    width_ft: int,
-    length_ft: int,
-    height_ft: int,
-    roof_color: str,
-    trim_color: str,
-    side_color: str,
-    openings: tuple[BuildingOpening, ...],
-) -> bytes:
-    views = render_building_views_png(
-        width_ft=width_ft,
-        length_ft=length_ft,
-        height_ft=height_ft,
-        colors=BuildingColorScheme(roof=roof_color, trim=trim_color, sides=side_color),
-        openings=openings,
-        view_names=("isometric",),
-        canvas_px=(900, 520),
-    )
-    return views["isometric"]
+@st.cache_resource
+def _building_view_cache() -> Optional[BuildingViewDiskCache]:
+    # Shared with the other workers on this host; survives restarts (BUILDING_VIEW_CACHE=0 disables).
+    return building_view_cache_from_env()
 
 
-@st.cache_data(show_spinner=False)
-def _cached_building_views_png(
+@st.cache_resource
+def _building_preview_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="building-preview")
+
+
+# How long a rerun waits for the full preview before showing the draft (disk-cache hits and
+# small buildings finish well within this).
+_BUILDING_PREVIEW_WAIT_S = 0.05
+
+
+@dataclass(frozen=True)
+class _BuildingPreview:
+    width_ft: int
+    length_ft: int
+    height_ft: int
+    colors: BuildingColorScheme
+    openings: tuple[BuildingOpening, ...]
+    # "svg" (inline vector, the default), or a `building_views.VIEW_ENCODINGS` name for a PNG/WebP
+    # preview (`fast`: cheap zlib, no optimize pass).
+    encoding: str = "svg"
+
+    @property
+    def key(self) -> str:
+        return building_view_cache_key(
+            name="isometric",
+            width_ft=self.width_ft,
+            length_ft=self.length_ft,
+            height_ft=self.height_ft,
+            colors=self.colors,
+            openings=self.openings,
+            canvas_px=(900, 520),
+            encoding=view_encoding(self.encoding),
+        )
+
+    def render(self, cache: Optional[BuildingViewDiskCache], *, draft: bool = False) -> bytes:
+        views = render_building_views_cached(
+            cache,
+            width_ft=self.width_ft,
+            length_ft=self.length_ft,
+            height_ft=self.height_ft,
+            colors=self.colors,
+            openings=self.openings,
+            view_names=("isometric",),
+            canvas_px=(900, 520),
+            encoding=view_encoding("fast" if draft else self.encoding),
+            draft=draft,
+        )
+        return views["isometric"]
+
+    def svg(self) -> str:
+        views = render_building_views_svg(
+            width_ft=self.width_ft,
+            length_ft=self.length_ft,
+            height_ft=self.height_ft,
+            colors=self.colors,
+            openings=self.openings,
+            view_names=("isometric",),
+            canvas_px=(900, 520),
+        )
+        return views["isometric"]
+
+
+def _building_preview_prefetcher() -> BackgroundPrefetcher[bytes]:
+    prefetcher = st.session_state.get("_building_preview_prefetcher")
+    if not isinstance(prefetcher, BackgroundPrefetcher):
+        prefetcher = BackgroundPrefetcher[bytes](_building_preview_executor())
+        st.session_state["_building_preview_prefetcher"] = prefetcher
+    return prefetcher
+
+
+def _building_preview(preview: _BuildingPreview) -> None:
+    """
+    Show the isometric preview. By default it is inline SVG: a few KB sent with the page, drawn
+    in ~2 ms with no image encoding.
+
+    Raster previews don't block the rerun on the full render: the full image is rendered in the
+    background (through the shared view cache) and, unless it is ready almost at once, a draft
+    stands in until a polling fragment swaps it.
+    """
+    if preview.encoding == "svg":
+        st.image(preview.svg(), caption="Building view", use_container_width=True)
+        return
+    prefetcher = _building_preview_prefetcher()
+    failure = prefetcher.failed(preview.key)
+    if failure is None:
+        cache = _building_view_cache()
+        prefetcher.prefetch(preview.key, lambda _cancelled: preview.render(cache))
+        png = prefetcher.take(preview.key, timeout=_BUILDING_PREVIEW_WAIT_S)
+        if png is not None:
+            st.image(png, caption="Building view", use_container_width=True)
+            return
+        failure = prefetcher.failed(preview.key)
+    # Drafts are ~0.4x with no siding/seams, so they skip the disk cache.
+    draft_png = preview.render(None, draft=True)
+    if failure is not None:
+        # Keep the draft instead of polling (and re-rendering) a full view that keeps failing.
+        st.image(draft_png, caption="Building view (draft)", use_container_width=True)
+        st.warning(f"Could not render the full building view: {failure}")
+        return
+    _building_preview_draft(preview, draft_png)
+
+
+@st.fragment(run_every=0.5)
+def _building_preview_draft(preview: _BuildingPreview, draft_png: bytes) -> None:
+    prefetcher = _building_preview_prefetcher()
+    if prefetcher.take(preview.key, timeout=0) is not None or prefetcher.failed(preview.key) is not None:
+        # One full rerun shows the finished image (or the draft and the error) and drops this poll.
+        st.rerun()
+    st.image(draft_png, caption="Building view (refining…)", use_container_width=True)
+
+
+def _render_quote_views_vector(
     *,
     width_ft: int,
     length_ft: int,
@@ -192,8 +304,9 @@ def _cached_building_views_png(
     trim_color: str,
     side_color: str,
     openings: tuple[BuildingOpening, ...],
-) -> dict[str, bytes]:
-    return render_building_views_png(
+) -> dict[str, BuildingViewDrawing]:
+    # The PDF draws the views as vectors: no PNG encode here, and crisp when printed.
+    return render_building_views_vector(
         width_ft=width_ft,
         length_ft=length_ft,
         height_ft=height_ft,
@@ -271,6 +384,27 @@ def _preview_openings_from_mapping(state: Mapping[str, object]) -> tuple[Buildin
     return tuple(openings)
 
 
+def _opening_layout_notes(state: Mapping[str, object]) -> str:
+    """
+    Placement warnings (overlaps, no room) for the current openings, as a chat message suffix.
+    """
+    openings = _preview_openings_from_mapping(state)
+    if not openings:
+        return ""
+    warnings = layout_openings(
+        openings,
+        width_ft=int(state.get("width_ft") or 0),
+        length_ft=int(state.get("length_ft") or 0),
+        height_ft=int(state.get("leg_height_ft") or 0),
+    ).warnings
+    if not warnings:
+        return ""
+    shown = [f"- {w}" for w in warnings[:3]]
+    if len(warnings) > 3:
+        shown.append(f"- ...and {len(warnings) - 3} more.")
+    return "\n\nHeads up:\n" + "\n".join(shown)
+
+
 def _openings_to_building_openings(
     openings_state: list[object], *, state: Optional[Mapping[str, object]] = None
 ) -> tuple[BuildingOpening, ...]:
@@ -1316,7 +1450,7 @@ def _try_handle_with_ai_intent(*, step_key: str, raw: str, step_index: int, max_
                     openings_list.append({"id": oid, **p})
                 oid += 1
             st.session_state["opening_seq"] = oid
-            _chat_add(role="assistant", content=f"Placed **{len(placements)}** opening(s). Add more, or type **/next**.")
+            _chat_add(role="assistant", content=f"Placed **{len(placements)}** opening(s). Add more, or type **/next**." + _opening_layout_notes(st.session_state))
             st.rerun()
 
     # Options
@@ -3042,7 +3176,7 @@ def _handle_chat_input(*, text: str, step_key: str, step_index: int, max_step_in
             _chat_add(
                 role="assistant",
                 tag="ack:openings_placement_bulk",
-                content=f"Placed **{count}** {kind}(s) on **{side}**. Add more, or type **/next**.",
+                content=f"Placed **{count}** {kind}(s) on **{side}**. Add more, or type **/next**." + _opening_layout_notes(st.session_state),
             )
             st.rerun()
 
@@ -3071,6 +3205,7 @@ def _handle_chat_input(*, text: str, step_key: str, step_index: int, max_step_in
                 content=(
                     f"Placed **{placement['kind']}** on **{placement['side']}** at **{int(placement['offset_ft'])} ft**. "
                     "Add more, or type **/next**."
+                    + _opening_layout_notes(st.session_state)
                 ),
             )
             st.rerun()
@@ -3455,8 +3590,8 @@ def _load_pricebook_from_extracted() -> PriceBook:
     """
     try:
         normalized_path = _find_r29_normalized_path()
-        mtime = normalized_path.stat().st_mtime
-        book = _load_pricebook_from_extracted_cached(str(normalized_path), mtime)
+        version = artifact_version(normalized_path)
+        book = _load_pricebook_from_extracted_cached(str(normalized_path), version)
     except Exception as exc:
         st.error(str(exc))
         st.stop()
@@ -3489,15 +3624,16 @@ def _load_pricebook_from_extracted() -> PriceBook:
 
 
 @st.cache_resource
-def _load_pricebook_from_extracted_cached(normalized_path_str: str, normalized_path_mtime: float) -> PriceBook:
+def _load_pricebook_from_extracted_cached(normalized_path_str: str, normalized_version: str) -> PriceBook:
     """
     Cached loader for the demo PriceBook.
 
     Important:
     - Do NOT call Streamlit UI functions (`st.*`) in cached code.
-    - Cache invalidation is driven by `normalized_path_mtime`.
+    - Cache invalidation is driven by `normalized_version` (`artifact_store.artifact_version`),
+      which also covers books packed into the artifact store, where no plain file exists.
     """
-    _ = normalized_path_mtime  # included only to invalidate cache when the file changes
+    _ = normalized_version  # included only to invalidate cache when the book changes
     normalized_path = Path(normalized_path_str)
     normalized = load_normalized_pricebook(normalized_path)
     return build_demo_pricebook_r29(normalized)
@@ -3977,9 +4113,38 @@ def _post_quote_export_payload(*, url: str, payload: dict[str, object]) -> tuple
         return 0, str(exc)
 
 
-def _build_quote_pdf_bytes_for_current_state(book: PriceBook, quote) -> bytes:
+@st.cache_resource
+def _quote_pdf_store() -> QuotePdfDiskCache:
+    # Exported PDFs live on disk, not in session state. With the shared cache disabled
+    # (QUOTE_PDF_CACHE=0) they are spooled to a small private dir of this process instead.
+    cache = quote_pdf_cache_from_env()
+    if cache is not None:
+        return cache
+    return quote_pdf_spool()
+
+
+@st.cache_resource
+def _quote_pdf_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="quote-pdf")
+
+
+@dataclass(frozen=True)
+class _QuotePdfJob:
+    key: str
+    # Renders the views + PDF into a sink from values captured on the script thread (no
+    # Streamlit calls), so it can also run in a background worker. Stops between stages once
+    # the event is set.
+    write: Callable[[BinaryIO, Optional[threading.Event]], QuotePdfOutput]
+    store: QuotePdfDiskCache
+
+
+def _quote_pdf_job(book: PriceBook, quote) -> _QuotePdfJob:
     """
-    Build PDF bytes for the current quote + current UI state.
+    Capture everything the PDF for the current quote + current UI state depends on.
+
+    Finished PDFs are kept in a disk cache shared across app processes, keyed by everything
+    that goes into the PDF, so re-exporting an unchanged quote skips the view and PDF renders.
+    Sessions only hold the cached file's path.
     """
     defaults = _default_state(book)
     export_active_keys = _active_keys_for_step_key("quote")
@@ -3989,7 +4154,7 @@ def _build_quote_pdf_bytes_for_current_state(book: PriceBook, quote) -> bytes:
 
     quote_id = _quote_input_signature(book, quote)
     logo_bytes = _cached_logo_png_bytes()
-    all_views = _cached_building_views_png(
+    view_inputs = dict(
         width_ft=int(export_state.get("width_ft") or 0),
         length_ft=int(export_state.get("length_ft") or 0),
         height_ft=int(export_state.get("leg_height_ft") or 0),
@@ -4007,41 +4172,131 @@ def _build_quote_pdf_bytes_for_current_state(book: PriceBook, quote) -> bytes:
     downpayment_cents = int(round(downpayment_pct * subtotal_cents))
     balance_due_cents = subtotal_cents - downpayment_cents
 
-    artifact = QuotePdfArtifact(
-        quote_id=quote_id,
-        quote_date=datetime.now(timezone.utc).date(),
-        pricebook_revision=book.revision,
-        customer_name=str(st.session_state.get("lead_name") or "").strip(),
-        customer_email=str(st.session_state.get("lead_email") or "").strip(),
-        building_label="Commercial Buildings",
-        building_summary=(
-            f"{int(st.session_state.get('width_ft') or 0)} x "
-            f"{int(st.session_state.get('length_ft') or 0)} x "
-            f"{int(st.session_state.get('leg_height_ft') or 0)}"
-        ),
-        line_items=tuple(
-            QuotePdfLineItem(
-                description=str(li.description),
-                qty=1,
-                amount_cents=int(li.amount_usd) * 100,
-            )
-            for li in quote.line_items
-        ),
-        totals=QuotePdfTotals(
-            building_amount_cents=building_amount_cents,
-            discount_cents=discount_cents,
-            subtotal_cents=subtotal_cents,
-            additional_charges_cents=0,
-            grand_total_cents=subtotal_cents,
-            downpayment_cents=downpayment_cents,
-            balance_due_cents=balance_due_cents,
-        ),
-        notes=tuple(str(n) for n in (quote.notes or ())),
-        logo_png_bytes=logo_bytes,
-        building_preview_png_bytes=all_views.get("isometric"),
-        building_views_png_bytes=all_views,
+    quote_date = datetime.now(timezone.utc).date()
+    customer_name = str(st.session_state.get("lead_name") or "").strip()
+    customer_email = str(st.session_state.get("lead_email") or "").strip()
+    building_summary = (
+        f"{int(st.session_state.get('width_ft') or 0)} x "
+        f"{int(st.session_state.get('length_ft') or 0)} x "
+        f"{int(st.session_state.get('leg_height_ft') or 0)}"
     )
-    return make_quote_pdf_bytes(artifact)
+    profile_name = str(os.environ.get("QUOTE_PDF_PROFILE") or "").strip()
+    profile = quote_pdf_profile(profile_name) if profile_name else PRODUCTION_PDF_PROFILE
+
+    def write(sink: BinaryIO, cancelled: Optional[threading.Event]) -> QuotePdfOutput:
+        all_views = _render_quote_views_vector(**view_inputs)
+        if cancelled is not None and cancelled.is_set():
+            raise CancelledError()
+        artifact = QuotePdfArtifact(
+            quote_id=quote_id,
+            quote_date=quote_date,
+            pricebook_revision=book.revision,
+            customer_name=customer_name,
+            customer_email=customer_email,
+            building_label="Commercial Buildings",
+            building_summary=building_summary,
+            line_items=tuple(
+                QuotePdfLineItem(
+                    description=str(li.description),
+                    qty=1,
+                    amount_cents=int(li.amount_usd) * 100,
+                )
+                for li in quote.line_items
+            ),
+            totals=QuotePdfTotals(
+                building_amount_cents=building_amount_cents,
+                discount_cents=discount_cents,
+                subtotal_cents=subtotal_cents,
+                additional_charges_cents=0,
+                grand_total_cents=subtotal_cents,
+                downpayment_cents=downpayment_cents,
+                balance_due_cents=balance_due_cents,
+            ),
+            notes=tuple(str(n) for n in (quote.notes or ())),
+            logo_png_bytes=logo_bytes,
+            building_views_vector=all_views,
+        )
+        return write_quote_pdf(artifact, sink, profile=profile)
+
+    key = quote_pdf_cache_key(
+        {
+            "signature": quote_id,
+            "pricebook_revision": book.revision,
+            "quote_date": quote_date.isoformat(),
+            "lead": {"name": customer_name, "email": customer_email},
+            "building_summary": building_summary,
+            "line_items": [(str(li.description), int(li.amount_usd)) for li in quote.line_items],
+            "notes": [str(n) for n in (quote.notes or ())],
+            "totals_cents": [building_amount_cents, discount_cents, downpayment_cents, balance_due_cents],
+            "discount_pct": discount_pct,
+            "downpayment_pct": downpayment_pct,
+            "views": view_inputs,
+            "view_format": "vector",
+            "logo_sha256": hashlib.sha256(logo_bytes).hexdigest() if logo_bytes else None,
+            "profile": profile,
+        }
+    )
+    return _QuotePdfJob(key=key, write=write, store=_quote_pdf_store())
+
+
+def _run_quote_pdf_job(job: _QuotePdfJob, cancelled: Optional[threading.Event] = None) -> Path:
+    return job.store.get_or_write(job.key, lambda sink: job.write(sink, cancelled))
+
+
+def _quote_pdf_prefetcher() -> BackgroundPrefetcher[Path]:
+    prefetcher = st.session_state.get("_quote_pdf_prefetcher")
+    if not isinstance(prefetcher, BackgroundPrefetcher):
+        prefetcher = BackgroundPrefetcher[Path](_quote_pdf_executor())
+        st.session_state["_quote_pdf_prefetcher"] = prefetcher
+    return prefetcher
+
+
+def _prefetch_quote_pdf(book: PriceBook, quote) -> None:
+    """
+    Start building the PDF in the background (restarting it if the inputs changed since). A
+    build that already failed for these inputs is not retried; Export builds it synchronously
+    and shows the error.
+    """
+    job = _quote_pdf_job(book, quote)
+    prefetcher = _quote_pdf_prefetcher()
+    if prefetcher.failed(job.key) is not None:
+        return
+    prefetcher.prefetch(job.key, lambda cancelled: _run_quote_pdf_job(job, cancelled))
+
+
+def _ready_quote_pdf_path(book: PriceBook, quote) -> Optional[Path]:
+    """
+    The PDF for the current state if it is already built (prefetched or cached), without waiting.
+    """
+    job = _quote_pdf_job(book, quote)
+    path = _quote_pdf_prefetcher().take(job.key, timeout=0)
+    if path is not None and path.is_file():
+        return path
+    return job.store.get_path(job.key)
+
+
+def _quote_pdf_path_for_current_state(book: PriceBook, quote) -> Path:
+    """
+    Build the PDF for the current quote + current UI state and return its file, reusing (or
+    waiting for) the background prefetch for the same inputs when there is one.
+    """
+    job = _quote_pdf_job(book, quote)
+    prefetched = _quote_pdf_prefetcher().take(job.key)
+    if prefetched is not None and prefetched.is_file():
+        return prefetched
+    return _run_quote_pdf_job(job)
+
+
+def _quote_pdf_download_button(path: Path, *, where=st) -> None:
+    # Streams the cached file to Streamlit's media store; the session keeps only the path.
+    with path.open("rb") as f:
+        where.download_button(
+            "Download quote (PDF)",
+            data=f,
+            file_name="quote.pdf",
+            mime="application/pdf",
+            use_container_width=True,
+        )
 
 
 def _quote_line_items_csv(quote) -> str:
@@ -4132,16 +4387,14 @@ def _render_sidebar(book: PriceBook, step_index: int, step_labels: list[str], qu
                 mime="application/json",
                 use_container_width=True,
             )
-            # PDF export (demo v1)
+            # PDF export (demo v1): offered once the background build for these inputs is
+            # ready, so the sidebar never blocks a rerun on view + PDF rendering.
             try:
-                pdf_bytes = _build_quote_pdf_bytes_for_current_state(book, quote)
-                st.sidebar.download_button(
-                    "Download quote (PDF)",
-                    data=pdf_bytes,
-                    file_name="quote.pdf",
-                    mime="application/pdf",
-                    use_container_width=True,
-                )
+                pdf_path = _ready_quote_pdf_path(book, quote)
+                if pdf_path is not None:
+                    _quote_pdf_download_button(pdf_path, where=st.sidebar)
+                else:
+                    st.sidebar.caption("Quote PDF: prepared in the background on the Quote step.")
             except Exception:
                 # Keep the sidebar usable even if PDF export fails.
                 pass
@@ -4831,6 +5084,11 @@ def main() -> None:
             elif quote:
                 # Auto-save lead snapshot
                 _append_lead_snapshot(book=book, quote=quote)
+                # Start the PDF now so Export can hand over finished bytes.
+                try:
+                    _prefetch_quote_pdf(book, quote)
+                except Exception:
+                    pass
                 left, right = st.columns([2, 1], gap="large")
                 with left:
                     st.metric("Total", _format_usd(quote.total_usd))
@@ -4839,16 +5097,20 @@ def main() -> None:
                             st.info(note)
                 with right:
                     try:
-                        preview_png = _cached_building_isometric_png(
-                            width_ft=int(state.get("width_ft") or 0),
-                            length_ft=int(state.get("length_ft") or 0),
-                            height_ft=int(state.get("leg_height_ft") or 0),
-                            roof_color=str(state.get("roof_color") or "White"),
-                            trim_color=str(state.get("trim_color") or "White"),
-                            side_color=str(state.get("side_color") or "White"),
-                            openings=_preview_openings_from_mapping(state),
+                        _building_preview(
+                            _BuildingPreview(
+                                width_ft=int(state.get("width_ft") or 0),
+                                length_ft=int(state.get("length_ft") or 0),
+                                height_ft=int(state.get("leg_height_ft") or 0),
+                                colors=BuildingColorScheme(
+                                    roof=str(state.get("roof_color") or "White"),
+                                    trim=str(state.get("trim_color") or "White"),
+                                    sides=str(state.get("side_color") or "White"),
+                                ),
+                                openings=_preview_openings_from_mapping(state),
+                                encoding=str(os.environ.get("BUILDING_PREVIEW_ENCODING") or "svg").strip(),
+                            )
                         )
-                        st.image(preview_png, caption="Building view", use_container_width=True)
                     except Exception:
                         # The quote should still render even if the preview fails.
                         pass
@@ -4864,10 +5126,10 @@ def main() -> None:
                     st.session_state["export_payload"] = payload
                     # Generate PDF so the next page can offer download immediately.
                     try:
-                        st.session_state["export_pdf_bytes"] = _build_quote_pdf_bytes_for_current_state(book, quote)
+                        st.session_state["export_pdf_path"] = str(_quote_pdf_path_for_current_state(book, quote))
                         st.session_state["export_pdf_error"] = None
                     except Exception as exc:
-                        st.session_state["export_pdf_bytes"] = None
+                        st.session_state["export_pdf_path"] = None
                         st.session_state["export_pdf_error"] = str(exc)
 
                     if export_url:
@@ -4905,16 +5167,17 @@ def main() -> None:
             elif post_status:
                 st.warning(f"Export POST returned HTTP {post_status}.")
 
-            pdf_bytes = st.session_state.get("export_pdf_bytes")
+            pdf_path = str(st.session_state.get("export_pdf_path") or "")
             pdf_err = str(st.session_state.get("export_pdf_error") or "")
-            if isinstance(pdf_bytes, (bytes, bytearray)):
-                st.download_button(
-                    "Download quote (PDF)",
-                    data=bytes(pdf_bytes),
-                    file_name="quote.pdf",
-                    mime="application/pdf",
-                    use_container_width=True,
-                )
+            if pdf_path and not Path(pdf_path).is_file() and quote:
+                # Evicted from the PDF cache since Export; render it again.
+                try:
+                    pdf_path = str(_quote_pdf_path_for_current_state(book, quote))
+                    st.session_state["export_pdf_path"] = pdf_path
+                except Exception as exc:
+                    pdf_path, pdf_err = "", str(exc)
+            if pdf_path and Path(pdf_path).is_file():
+                _quote_pdf_download_button(Path(pdf_path))
             elif pdf_err:
                 st.error(f"Could not generate PDF: {pdf_err}")
 
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Mapping, Optional, Tuple
 
+from artifact_store import find_artifacts, read_artifact_text
 from pricing_engine import CarportStyle, PriceBook, RoofStyle
 
 
@@ -42,11 +43,11 @@ class NormalizedPricebook:
 
 
 def find_normalized_pricebooks(out_dir: Path) -> List[Path]:
-    return sorted(out_dir.glob("**/normalized_pricebook.json"))
+    return find_artifacts(out_dir, "normalized_pricebook.json")
 
 
 def load_normalized_pricebook(path: Path) -> NormalizedPricebook:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = json.loads(read_artifact_text(path))
     if not isinstance(data, dict):
         raise ValueError(f"Expected JSON object in {path}")
 
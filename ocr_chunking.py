@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class OcrBlock:
+    """
+    One structural block of OCR markdown.
+
+    `kind` is one of: "heading", "table", "image", "text".
+    """
+
+    kind: str
+    text: str
+    est_tokens: int
+
+
+@dataclass(frozen=True)
+class ChunkStats:
+    chunk_count: int
+    total_tokens_est: int
+    min_tokens_est: int
+    max_tokens_est: int
+    mean_tokens_est: float
+    max_tokens_budget: int
+    table_count: int
+    tables_split: int
+    oversize_chunk_count: int
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "chunk_count": self.chunk_count,
+            "total_tokens_est": self.total_tokens_est,
+            "min_tokens_est": self.min_tokens_est,
+            "max_tokens_est": self.max_tokens_est,
+            "mean_tokens_est": round(self.mean_tokens_est, 1),
+            "max_tokens_budget": self.max_tokens_budget,
+            "table_count": self.table_count,
+            "tables_split": self.tables_split,
+            "oversize_chunk_count": self.oversize_chunk_count,
+        }
+
+
+# Words/numbers are roughly one token each; punctuation (pipes, `$`, `,`, `.`) usually
+# tokenizes on its own. This overestimates prose slightly and tracks price tables well,
+# which is the direction we want when budgeting prompt size.
+_TOKEN_RE = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+_HEADING_RE = re.compile(r"^#{1,6}\s")
+_IMAGE_RE = re.compile(r"^!\[[^\]]*\]\([^)]*\)\s*$")
+_SEP_ROW_RE = re.compile(r"^\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$")
+
+# A short paragraph directly above a table is usually its caption ("14 GAUGE A-FRAME ...").
+_CAPTION_MAX_CHARS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap, dependency-free token estimate for OCR markdown.
+    """
+    if not text:
+        return 0
+    words = _TOKEN_RE.findall(text)
+    # Long alphabetic words split into several BPE pieces.
+    extra = sum(max(0, math.ceil(len(w) / 6) - 1) for w in words if w.isalpha())
+    return len(words) + extra
+
+
+def split_ocr_markdown_blocks(text: str) -> List[OcrBlock]:
+    """
+    Split OCR markdown into blank-line separated blocks, keeping pipe tables whole.
+
+    OCR tables sometimes contain multi-line cells (a row that starts with `|` and only
+    closes a few lines later), so a table block runs until the next blank line rather
+    than until the next line that doesn't start with `|`.
+    """
+    blocks: List[OcrBlock] = []
+    current: List[str] = []
+
+    def flush() -> None:
+        if not current:
+            return
+        body = "\n".join(current).strip("\n")
+        current.clear()
+        if not body.strip():
+            return
+        first = body.lstrip().splitlines()[0].strip()
+        if first.startswith("|"):
+            kind = "table"
+        elif _HEADING_RE.match(first) and len(body.splitlines()) == 1:
+            kind = "heading"
+        elif _IMAGE_RE.match(first) and len(body.splitlines()) == 1:
+            kind = "image"
+        else:
+            kind = "text"
+        blocks.append(OcrBlock(kind=kind, text=body, est_tokens=estimate_tokens(body)))
+
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        stripped = line.strip()
+        if not stripped:
+            flush()
+            continue
+        # A heading always starts its own block, even without a blank line before it.
+        if _HEADING_RE.match(stripped):
+            flush()
+            current.append(line)
+            flush()
+            continue
+        # A table that starts right under a paragraph still gets its own block.
+        if stripped.startswith("|") and current and not current[0].lstrip().startswith("|"):
+            flush()
+        current.append(line)
+    flush()
+    return blocks
+
+
+@dataclass
+class _Section:
+    headings: List[OcrBlock]
+    units: List[str]
+    unit_tokens: List[int]
+    table_count: int = 0
+    tables_split: int = 0
+
+
+def _split_table_rows(table: str, *, max_tokens: int, prefix_tokens: int) -> List[str]:
+    """
+    Split an oversized pipe table into row groups, repeating the header rows on every piece
+    so each piece is still a valid table the structuring model can read on its own.
+    """
+    lines = table.splitlines()
+    header: List[str] = []
+    body_start = 0
+    # Header = rows up to and including the first separator row (if it's near the top).
+    for i, ln in enumerate(lines[:4]):
+        if _SEP_ROW_RE.match(ln.strip()):
+            header = lines[: i + 1]
+            body_start = i + 1
+            break
+    body = lines[body_start:]
+    header_text = "\n".join(header)
+    header_tokens = estimate_tokens(header_text)
+    budget = max(1, max_tokens - prefix_tokens - header_tokens)
+
+    pieces: List[str] = []
+    group: List[str] = []
+    group_tokens = 0
+    for ln in body:
+        t = estimate_tokens(ln)
+        if group and group_tokens + t > budget:
+            pieces.append("\n".join(header + group))
+            group = []
+            group_tokens = 0
+        group.append(ln)
+        group_tokens += t
+    if group or not pieces:
+        pieces.append("\n".join(header + group))
+    return pieces
+
+
+def _build_sections(blocks: List[OcrBlock], *, max_tokens: int) -> List[_Section]:
+    """
+    Group blocks into heading-led sections made of atomic "units".
+
+    A unit is the smallest piece we never split: a paragraph, or a table together with its
+    caption paragraph. Tables larger than the whole budget are split by rows.
+    """
+    sections: List[_Section] = []
+    sec = _Section(headings=[], units=[], unit_tokens=[])
+
+    def push_unit(text: str) -> None:
+        sec.units.append(text)
+        sec.unit_tokens.append(estimate_tokens(text))
+
+    for b in blocks:
+        if b.kind == "heading":
+            # Consecutive headings stack (e.g. "# Coast To Coast" + "# Carports, Inc.").
+            if sec.units:
+                sections.append(sec)
+                sec = _Section(headings=[], units=[], unit_tokens=[])
+            sec.headings.append(b)
+            continue
+
+        if b.kind == "table":
+            sec.table_count += 1
+            caption: Optional[str] = None
+            if sec.units and len(sec.units[-1]) <= _CAPTION_MAX_CHARS and not sec.units[-1].lstrip().startswith("|"):
+                caption = sec.units.pop()
+                sec.unit_tokens.pop()
+            unit = b.text if caption is None else f"{caption}\n\n{b.text}"
+            heading_tokens = sum(h.est_tokens for h in sec.headings)
+            if estimate_tokens(unit) + heading_tokens > max_tokens:
+                prefix = caption or ""
+                pieces = _split_table_rows(
+                    b.text,
+                    max_tokens=max_tokens,
+                    prefix_tokens=heading_tokens + estimate_tokens(prefix),
+                )
+                if len(pieces) > 1:
+                    sec.tables_split += 1
+                for piece in pieces:
+                    push_unit(piece if not prefix else f"{prefix}\n\n{piece}")
+            else:
+                push_unit(unit)
+            continue
+
+        push_unit(b.text)
+
+    if sec.units or sec.headings:
+        sections.append(sec)
+    return sections
+
+
+def chunk_ocr_markdown(text: str, *, max_tokens: int) -> Tuple[List[str], ChunkStats]:
+    """
+    Chunk OCR markdown for the structuring pass, budgeting by estimated tokens.
+
+    - Pipe tables are never cut mid-row; a table stays with its heading(s) and caption.
+    - Small sections are packed together so a book needs as few calls as possible.
+    - A section larger than the budget is split between units, and each continuation
+      repeats the section headings so the model keeps its context.
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be > 0")
+    text = (text or "").strip()
+    if not text:
+        return [], ChunkStats(
+            chunk_count=0,
+            total_tokens_est=0,
+            min_tokens_est=0,
+            max_tokens_est=0,
+            mean_tokens_est=0.0,
+            max_tokens_budget=max_tokens,
+            table_count=0,
+            tables_split=0,
+            oversize_chunk_count=0,
+        )
+
+    sections = _build_sections(split_ocr_markdown_blocks(text), max_tokens=max_tokens)
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    def flush() -> None:
+        nonlocal current_tokens
+        if current:
+            chunks.append("\n\n".join(current).strip())
+        current.clear()
+        current_tokens = 0
+
+    for sec in sections:
+        heading_text = "\n\n".join(h.text for h in sec.headings)
+        heading_tokens = estimate_tokens(heading_text)
+        section_tokens = heading_tokens + sum(sec.unit_tokens)
+
+        if current and current_tokens + section_tokens <= max_tokens:
+            if heading_text:
+                current.append(heading_text)
+            current.extend(sec.units)
+            current_tokens += section_tokens
+            continue
+
+        if section_tokens <= max_tokens:
+            flush()
+            if heading_text:
+                current.append(heading_text)
+            current.extend(sec.units)
+            current_tokens = section_tokens
+            continue
+
+        # Oversized section: split between units, repeating headings on each piece.
+        flush()
+        if heading_text:
+            current.append(heading_text)
+            current_tokens = heading_tokens
+        for unit, unit_tokens in zip(sec.units, sec.unit_tokens):
+            if current_tokens + unit_tokens > max_tokens and current_tokens > heading_tokens:
+                flush()
+                if heading_text:
+                    current.append(heading_text)
+                    current_tokens = heading_tokens
+            current.append(unit)
+            current_tokens += unit_tokens
+    flush()
+
+    token_counts = [estimate_tokens(c) for c in chunks]
+    stats = ChunkStats(
+        chunk_count=len(chunks),
+        total_tokens_est=sum(token_counts),
+        min_tokens_est=min(token_counts) if token_counts else 0,
+        max_tokens_est=max(token_counts) if token_counts else 0,
+        mean_tokens_est=(sum(token_counts) / len(token_counts)) if token_counts else 0.0,
+        max_tokens_budget=max_tokens,
+        table_count=sum(s.table_count for s in sections),
+        tables_split=sum(s.tables_split for s in sections),
+        oversize_chunk_count=sum(1 for t in token_counts if t > max_tokens),
+    )
+    return chunks, stats
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+"""
+Per-page quality scoring for OCR output.
+
+Some books come back from OCR as nothing but dots (R31), and a structuring pass over that
+text just makes up generic rules. These scores are computed right after OCR so that pages
+with no usable content never reach the LLM:
+- character entropy: a page of repeated filler ('.', '-', '_') has almost none,
+- dot-run ratio: share of characters in dot leaders / dot filler,
+- digit and table density: price pages are full of numbers and pipe-table rows,
+- plain volume: a handful of characters can't hold a price or a rule.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+DEFAULT_MIN_PAGE_QUALITY = 0.35
+
+_MIN_PAGE_CHARS = 40
+_DOT_RUN_RE = re.compile(r"(?:[.·•…]\s*){3,}")
+_IMAGE_REF_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+
+
+@dataclass(frozen=True)
+class PageQuality:
+    index: int
+    chars: int
+    entropy: float
+    dot_run_ratio: float
+    digit_ratio: float
+    table_ratio: float
+    score: float
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "index": self.index,
+            "chars": self.chars,
+            "entropy": round(self.entropy, 3),
+            "dot_run_ratio": round(self.dot_run_ratio, 3),
+            "digit_ratio": round(self.digit_ratio, 3),
+            "table_ratio": round(self.table_ratio, 3),
+            "score": round(self.score, 3),
+        }
+
+
+@dataclass(frozen=True)
+class OcrQualityReport:
+    pages: List[PageQuality]
+    min_score: float
+
+    @property
+    def usable_indices(self) -> List[int]:
+        return [p.index for p in self.pages if p.score >= self.min_score]
+
+    @property
+    def skipped_indices(self) -> List[int]:
+        return [p.index for p in self.pages if p.score < self.min_score]
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "min_score": self.min_score,
+            "usable_pages": self.usable_indices,
+            "skipped_pages": self.skipped_indices,
+            "pages": [p.as_dict() for p in self.pages],
+        }
+
+
+def _entropy_bits(chars: str) -> float:
+    if not chars:
+        return 0.0
+    n = len(chars)
+    return max(0.0, -sum((c / n) * math.log2(c / n) for c in Counter(chars).values()))
+
+
+def score_ocr_page(markdown: str, *, index: int = 0) -> PageQuality:
+    # Image placeholders are OCR bookkeeping, not page content.
+    text = _IMAGE_REF_RE.sub(" ", markdown)
+    chars = "".join(ch for ch in text if not ch.isspace())
+    n = len(chars)
+    if n == 0:
+        return PageQuality(index=index, chars=0, entropy=0.0, dot_run_ratio=1.0, digit_ratio=0.0, table_ratio=0.0, score=0.0)
+
+    entropy = _entropy_bits(chars)
+    dot_chars = sum(len(re.sub(r"\s", "", m.group(0))) for m in _DOT_RUN_RE.finditer(text))
+    dot_run_ratio = min(1.0, dot_chars / n)
+    digit_ratio = sum(1 for ch in chars if ch.isdigit()) / n
+    alnum_ratio = sum(1 for ch in chars if ch.isalnum()) / n
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+    table_ratio = sum(1 for ln in lines if ln.startswith("|")) / len(lines) if lines else 0.0
+
+    volume = min(1.0, n / _MIN_PAGE_CHARS)
+    diversity = min(1.0, entropy / 3.0)
+    legibility = min(1.0, alnum_ratio / 0.4)
+    # Rules pages are prose, so density only nudges the score rather than gating it.
+    density = max(table_ratio, min(1.0, digit_ratio * 5.0))
+    score = volume * diversity * legibility * (1.0 - dot_run_ratio) * (0.7 + 0.3 * density)
+    return PageQuality(
+        index=index,
+        chars=n,
+        entropy=entropy,
+        dot_run_ratio=dot_run_ratio,
+        digit_ratio=digit_ratio,
+        table_ratio=table_ratio,
+        score=score,
+    )
+
+
+def page_texts_from_ocr_payload(ocr_payload: Dict[str, object]) -> List[Tuple[int, str]]:
+    """
+    (page index, markdown-or-text) per page, in payload order. Payloads without a `pages`
+    list come back as a single page 0.
+    """
+    pages = ocr_payload.get("pages")
+    out: List[Tuple[int, str]] = []
+    if isinstance(pages, list):
+        for pos, page in enumerate(pages):
+            if not isinstance(page, dict):
+                continue
+            idx = page.get("index")
+            text = page.get("markdown")
+            if not isinstance(text, str) or not text.strip():
+                text = page.get("text")
+            out.append((idx if isinstance(idx, int) else pos, text if isinstance(text, str) else ""))
+        return out
+    for key in ("markdown", "text"):
+        top = ocr_payload.get(key)
+        if isinstance(top, str) and top.strip():
+            return [(0, top)]
+    return []
+
+
+def assess_ocr_pages(ocr_payload: Dict[str, object], *, min_score: float = DEFAULT_MIN_PAGE_QUALITY) -> OcrQualityReport:
+    pages = [score_ocr_page(text, index=idx) for idx, text in page_texts_from_ocr_payload(ocr_payload)]
+    return OcrQualityReport(pages=pages, min_score=float(min_score))
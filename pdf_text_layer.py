@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+"""
+Local text-layer pre-pass for price-book PDFs.
+
+Digitally generated price books usually carry an embedded text layer that is as good as OCR
+output. This module pulls that layer out page by page (via the optional `pypdf` dependency),
+rebuilds column-aligned rows into markdown pipe tables, and scores each page so that only the
+pages with a missing or broken layer have to go through Mistral OCR.
+
+Scoring (0..1) looks at:
+- how much text there is at all (scanned pages have none),
+- how much of it is extraction garbage (`(cid:NN)` glyph refs, replacement chars),
+- whether table-looking rows agree on a column count (a layer that lost its column
+  spacing turns a price grid into a run of loose numbers).
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+try:
+    from pypdf import PdfReader
+except Exception:  # pragma: no cover - optional dependency
+    PdfReader = None  # type: ignore[assignment]
+
+DEFAULT_MIN_TEXT_LAYER_SCORE = 0.75
+
+_MIN_PAGE_CHARS = 40
+_CELL_SPLIT_RE = re.compile(r"\s{2,}|\t+")
+_GARBAGE_RE = re.compile(r"\(cid:\d+\)|�")
+_PRICE_RE = re.compile(r"\$?\d[\d,]*(?:\.\d{2})?")
+
+
+@dataclass(frozen=True)
+class TextLayerPage:
+    index: int
+    markdown: str
+    score: float
+
+    def usable(self, min_score: float) -> bool:
+        return self.score >= min_score
+
+
+@dataclass(frozen=True)
+class TextLayerPlan:
+    page_count: int
+    pages: List[TextLayerPage]
+    min_score: float
+
+    @property
+    def text_layer_indices(self) -> List[int]:
+        return [p.index for p in self.pages if p.usable(self.min_score)]
+
+    @property
+    def ocr_indices(self) -> List[int]:
+        return [p.index for p in self.pages if not p.usable(self.min_score)]
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "page_count": self.page_count,
+            "min_score": self.min_score,
+            "text_layer_pages": self.text_layer_indices,
+            "ocr_pages": self.ocr_indices,
+            "scores": {str(p.index): round(p.score, 3) for p in self.pages},
+        }
+
+
+def text_layer_available() -> bool:
+    return PdfReader is not None
+
+
+def extract_page_texts(pdf_path: Path) -> List[str]:
+    """
+    Raw text layer per page, or [] when pypdf is missing or the file can't be parsed.
+
+    Layout mode keeps the horizontal spacing between columns, which is what lets
+    `text_layer_to_markdown` recover tables.
+    """
+    if PdfReader is None:
+        return []
+    try:
+        reader = PdfReader(str(pdf_path))
+        if reader.is_encrypted:
+            return []
+        texts: List[str] = []
+        for page in reader.pages:
+            try:
+                txt = page.extract_text(extraction_mode="layout")
+            except TypeError:  # pragma: no cover - older pypdf without layout mode
+                txt = page.extract_text()
+            texts.append(txt or "")
+        return texts
+    except Exception:
+        return []
+
+
+def _split_cells(line: str) -> List[str]:
+    return [c.strip() for c in _CELL_SPLIT_RE.split(line.strip()) if c.strip()]
+
+
+def _table_groups(lines: Sequence[str]) -> List[List[List[str]]]:
+    """
+    Consecutive lines with 3+ whitespace-separated cells, as rows of cells.
+    """
+    groups: List[List[List[str]]] = []
+    current: List[List[str]] = []
+    for line in lines:
+        cells = _split_cells(line)
+        if len(cells) >= 3:
+            current.append(cells)
+            continue
+        if len(current) >= 2:
+            groups.append(current)
+        current = []
+    if len(current) >= 2:
+        groups.append(current)
+    return groups
+
+
+def text_layer_to_markdown(text: str) -> str:
+    """
+    Paragraph lines pass through; runs of column-aligned rows become pipe tables
+    (first row as header), matching the shape OCR returns for the same pages.
+    """
+    out: List[str] = []
+    pending: List[List[str]] = []
+
+    def flush_table() -> None:
+        if len(pending) >= 2:
+            width = max(len(r) for r in pending)
+            rows = [r + [""] * (width - len(r)) for r in pending]
+            out.append("")
+            out.append("| " + " | ".join(rows[0]) + " |")
+            out.append("|" + " --- |" * width)
+            for r in rows[1:]:
+                out.append("| " + " | ".join(r) + " |")
+            out.append("")
+        elif pending:
+            out.append(" ".join(pending[0]))
+        pending.clear()
+
+    for raw in text.splitlines():
+        cells = _split_cells(raw)
+        if len(cells) >= 3:
+            pending.append(cells)
+            continue
+        flush_table()
+        line = " ".join(cells)
+        if line or (out and out[-1]):
+            out.append(line)
+    flush_table()
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(out)).strip()
+
+
+def score_text_layer_page(text: str) -> float:
+    chars = [c for c in text if not c.isspace()]
+    if len(chars) < _MIN_PAGE_CHARS:
+        return 0.0
+
+    garbage = sum(len(m.group(0)) for m in _GARBAGE_RE.finditer(text))
+    clean = max(0.0, 1.0 - garbage / len(chars))
+    alnum = sum(1 for c in chars if c.isalnum()) / len(chars)
+    legibility = min(1.0, alnum / 0.6)
+
+    lines = text.splitlines()
+    groups = _table_groups(lines)
+    if groups:
+        consistent = 0
+        total = 0
+        for rows in groups:
+            modal = Counter(len(r) for r in rows).most_common(1)[0][0]
+            consistent += sum(1 for r in rows if len(r) == modal)
+            total += len(rows)
+        completeness = consistent / total
+    elif len(_PRICE_RE.findall(text)) >= 12:
+        # Lots of prices but no column structure: the layer flattened a table.
+        completeness = 0.0
+    else:
+        completeness = 1.0
+
+    return clean * legibility * (0.4 + 0.6 * completeness)
+
+
+def plan_text_layer_pass(pdf_path: Path, *, min_score: float = DEFAULT_MIN_TEXT_LAYER_SCORE) -> Optional[TextLayerPlan]:
+    """
+    Score every page's text layer. Returns None when no text layer could be read at all,
+    in which case the caller should OCR the whole document as before.
+    """
+    texts = extract_page_texts(pdf_path)
+    if not texts:
+        return None
+    pages = [
+        TextLayerPage(index=i, markdown=text_layer_to_markdown(t), score=score_text_layer_page(t))
+        for i, t in enumerate(texts)
+    ]
+    return TextLayerPlan(page_count=len(pages), pages=pages, min_score=float(min_score))
+
+
+def merge_text_layer_and_ocr(plan: TextLayerPlan, ocr_payload: Optional[Dict[str, object]]) -> Dict[str, object]:
+    """
+    One OCR-shaped payload (`{"pages": [{"index", "markdown"}]}`) in page order, taking
+    text-layer pages from `plan` and the rest from the (partial) OCR response.
+    """
+    by_index: Dict[int, Dict[str, object]] = {}
+    for p in plan.pages:
+        if p.usable(plan.min_score):
+            by_index[p.index] = {"index": p.index, "markdown": p.markdown, "source": "text_layer"}
+
+    ocr_pages = ocr_payload.get("pages") if isinstance(ocr_payload, dict) else None
+    if isinstance(ocr_pages, list):
+        for page in ocr_pages:
+            if not isinstance(page, dict):
+                continue
+            idx = page.get("index")
+            if not isinstance(idx, int) or idx in by_index:
+                continue
+            by_index[idx] = {**page, "source": "ocr"}
+
+    merged: Dict[str, object] = {
+        "pages": [by_index[i] for i in sorted(by_index)],
+        "text_layer": plan.as_dict(),
+    }
+    if isinstance(ocr_payload, dict):
+        for key in ("model", "usage_info"):
+            if key in ocr_payload:
+                merged[key] = ocr_payload[key]
+    return merged
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+from artifact_store import artifact_exists, artifact_sha256
+
+MANIFEST_FILENAME = "pipeline_manifest.json"
+MANIFEST_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class StageRecord:
+    """
+    What a completed stage consumed and produced.
+
+    A stage is up to date when its recomputed `input_hash` matches and every recorded
+    output still exists with the same content hash.
+    """
+
+    name: str
+    input_hash: str
+    inputs: Mapping[str, str]
+    tool_version: str
+    outputs: Mapping[str, str]  # relative filename -> sha256
+    started_at: str
+    duration_s: float
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "input_hash": self.input_hash,
+            "inputs": dict(self.inputs),
+            "tool_version": self.tool_version,
+            "outputs": dict(self.outputs),
+            "started_at": self.started_at,
+            "duration_s": round(self.duration_s, 3),
+        }
+
+
+@dataclass
+class PipelineManifest:
+    book_dir: Path
+    source: str
+    stages: Dict[str, StageRecord] = field(default_factory=dict)
+
+    @property
+    def path(self) -> Path:
+        return self.book_dir / MANIFEST_FILENAME
+
+    def is_current(self, stage: str, *, input_hash: str) -> bool:
+        rec = self.stages.get(stage)
+        if rec is None or rec.input_hash != input_hash:
+            return False
+        for rel, digest in rec.outputs.items():
+            out = self.book_dir / rel
+            if not artifact_exists(out) or file_sha256(out) != digest:
+                return False
+        return True
+
+    def record(self, rec: StageRecord) -> None:
+        """
+        Record a finished stage and persist immediately, so a crash later in the batch
+        never loses completed work.
+        """
+        self.stages[rec.name] = rec
+        self.save()
+
+    def invalidate(self, stage: str) -> None:
+        if self.stages.pop(stage, None) is not None:
+            self.save()
+
+    def save(self) -> None:
+        data = {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
+            "source": self.source,
+            "updated_at": utc_now_iso(),
+            "stages": {name: rec.as_dict() for name, rec in self.stages.items()},
+        }
+        atomic_write_text(self.path, json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def load_manifest(book_dir: Path, *, source: str) -> PipelineManifest:
+    """
+    Load a book's manifest, or start an empty one if it is missing or unreadable.
+    """
+    path = book_dir / MANIFEST_FILENAME
+    manifest = PipelineManifest(book_dir=book_dir, source=source)
+    if not path.exists():
+        return manifest
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return manifest
+    if not isinstance(data, dict) or data.get("schema_version") != MANIFEST_SCHEMA_VERSION:
+        return manifest
+    stages = data.get("stages")
+    if not isinstance(stages, dict):
+        return manifest
+    for name, raw in stages.items():
+        rec = _stage_record_from_dict(raw)
+        if rec is not None and rec.name == name:
+            manifest.stages[name] = rec
+    return manifest
+
+
+def _stage_record_from_dict(raw: object) -> Optional[StageRecord]:
+    if not isinstance(raw, dict):
+        return None
+    name = raw.get("name")
+    input_hash = raw.get("input_hash")
+    tool_version = raw.get("tool_version")
+    inputs = raw.get("inputs")
+    outputs = raw.get("outputs")
+    if not isinstance(name, str) or not isinstance(input_hash, str) or not isinstance(tool_version, str):
+        return None
+    if not isinstance(inputs, dict) or not isinstance(outputs, dict):
+        return None
+    duration = raw.get("duration_s")
+    started_at = raw.get("started_at")
+    return StageRecord(
+        name=name,
+        input_hash=input_hash,
+        inputs={str(k): str(v) for k, v in inputs.items()},
+        tool_version=tool_version,
+        outputs={str(k): str(v) for k, v in outputs.items()},
+        started_at=started_at if isinstance(started_at, str) else "",
+        duration_s=float(duration) if isinstance(duration, (int, float)) else 0.0,
+    )
+
+
+def file_sha256(path: Path) -> str:
+    # Plain files and artifact-store entries hash identically (sha256 of the uncompressed bytes).
+    return artifact_sha256(path)
+
+
+def inputs_fingerprint(inputs: Mapping[str, str], *, tool_version: str) -> str:
+    """
+    Stable hash over a stage's named inputs (file hashes, model names, settings) and its version.
+    """
+    payload = json.dumps({"inputs": dict(inputs), "tool_version": tool_version}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write via a temp file + rename so readers never observe a half-written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
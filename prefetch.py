@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+"""
+Speculative background builds, one in flight per prefetcher.
+
+The app starts slow work (the quote PDF, the full building preview) on a worker before the user
+asks for it, so it is usually ready when they do. A build's result is whatever the caller's
+`build` returns. Builds are identified by a cache key of their inputs, and submitting a new key
+supersedes the old job. Each session owns one `BackgroundPrefetcher` per kind of build.
+
+Builds must not touch Streamlit state: everything they need is captured on the script thread.
+"""
+
+import threading
+from concurrent.futures import CancelledError, Executor, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundPrefetcher(Generic[T]):
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._key: Optional[str] = None
+        self._future: Optional["Future[T]"] = None
+        self._cancelled: Optional[threading.Event] = None
+        self._failure: Optional[Tuple[str, Exception]] = None
+
+    @property
+    def key(self) -> Optional[str]:
+        return self._key
+
+    def prefetch(self, key: str, build: Callable[[threading.Event], T]) -> None:
+        """
+        Start building `key` unless that build is already running or done. A job for other
+        inputs is cancelled: dropped if still queued, told to stop via its event otherwise.
+
+        `build` receives that event and should return early (raising is fine) once it is set.
+        """
+        with self._lock:
+            if self._key == key and self._future is not None:
+                return
+            self._cancel_locked()
+            self._failure = None
+            cancelled = threading.Event()
+            self._key = key
+            self._cancelled = cancelled
+            self._future = self._executor.submit(build, cancelled)
+
+    def take(self, key: str, *, timeout: Optional[float] = None) -> Optional[T]:
+        """
+        The prefetched result for `key`: waits up to `timeout` seconds (None: until done) for an
+        in-flight build. Returns None if nothing was prefetched for `key`, it is still running
+        after `timeout`, or it failed (the caller then builds synchronously and sees the error,
+        or asks `failed` for it).
+        """
+        with self._lock:
+            future = self._future if self._key == key else None
+        if future is None:
+            return None
+        try:
+            result = future.result(timeout=timeout)
+        except (FutureTimeoutError, CancelledError):
+            return None
+        except Exception as exc:
+            with self._lock:
+                if self._future is future:
+                    self._key = None
+                    self._future = None
+                    self._failure = (key, exc)
+            return None
+        return result
+
+    def failed(self, key: str) -> Optional[Exception]:
+        """
+        The error the last build of `key` raised, once `take` has seen it. Pollers use it to
+        stop waiting, and to avoid prefetching a build that fails on every rerun.
+        """
+        with self._lock:
+            if self._failure is not None and self._failure[0] == key:
+                return self._failure[1]
+        return None
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancel_locked()
+
+    def _cancel_locked(self) -> None:
+        if self._cancelled is not None:
+            self._cancelled.set()
+        if self._future is not None:
+            self._future.cancel()
+        self._key = None
+        self._future = None
+        self._cancelled = None
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import re
+import threading
 from dataclasses import dataclass
 from datetime import date
 from io import BytesIO
+from itertools import accumulate
 from pathlib import Path
-from typing import Mapping, Optional, Tuple
+from typing import BinaryIO, Callable, Dict, List, Mapping, Optional, Set, Tuple
 
+from PIL import Image
 from reportlab.lib import colors
+from reportlab.lib.boxstuff import aspectRatioFix
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfdoc, pdfmetrics
 from reportlab.pdfgen import canvas
 
+from building_views import BuildingViewDrawing, VectorShape
+
 
 @dataclass(frozen=True)
 class QuotePdfLineItem:
@@ -49,6 +57,72 @@ class QuotePdfArtifact:
     building_preview_png_bytes: Optional[bytes] = None
     # Optional additional view pages (keys like: "front", "back", "left", "right", "isometric")
     building_views_png_bytes: Optional[Mapping[str, bytes]] = None
+    # The same views as vector drawings (`building_views.render_building_views_vector`). A view
+    # present here is drawn natively instead of from its PNG; the "isometric" drawing is also
+    # the page-1 preview when `building_preview_png_bytes` is not given.
+    building_views_vector: Optional[Mapping[str, BuildingViewDrawing]] = None
+
+
+@dataclass(frozen=True)
+class QuotePdfProfile:
+    """
+    Output settings for `write_quote_pdf` (and `make_quote_pdf_bytes`).
+
+    `debug` leaves content streams uncompressed and embeds images as given, so the bytes are
+    easy to diff and tests can find text markers in them. `production` compresses content
+    streams and downsamples each image to `image_dpi` for the largest box it is drawn into;
+    with `jpeg_quality` set, opaque images are also re-encoded as JPEG.
+    """
+
+    name: str
+    compress_streams: bool = False
+    image_dpi: Optional[float] = None
+    jpeg_quality: Optional[int] = None
+
+
+DEBUG_PDF_PROFILE = QuotePdfProfile(name="debug")
+PRODUCTION_PDF_PROFILE = QuotePdfProfile(name="production", compress_streams=True, image_dpi=150.0)
+QUOTE_PDF_PROFILES: Dict[str, QuotePdfProfile] = {p.name: p for p in (DEBUG_PDF_PROFILE, PRODUCTION_PDF_PROFILE)}
+
+
+def quote_pdf_profile(name: str) -> QuotePdfProfile:
+    try:
+        return QUOTE_PDF_PROFILES[(name or "").strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown quote PDF profile {name!r} (expected one of: {', '.join(QUOTE_PDF_PROFILES)})")
+
+
+# Page geometry shared by the planner and the renderer.
+_PAGE_MARGIN = 0.6 * inch
+_HEADER_H = 1.35 * inch
+_CUSTOMER_BLOCK_H = 1.55 * inch
+_ROW_H = 0.27 * inch
+_FIRST_ROW_OFFSET = 0.55 * inch
+_TOTALS_BOX_H = 2.05 * inch
+_TOTALS_BOTTOM_PAD = 0.15 * inch
+_MIN_TOTALS_TABLE_H = 3.6 * inch
+_LINE_ITEM_FONT = ("Helvetica", 9)
+_VIEW_ORDER = ("front", "back", "left", "right", "isometric")
+
+
+@dataclass(frozen=True)
+class LineItemsPagePlan:
+    table_top_y: float
+    table_h: float
+    include_totals: bool
+    # (description fitted to its column, qty, amount) per row, ready to draw.
+    rows: Tuple[Tuple[str, str, str], ...]
+
+
+@dataclass(frozen=True)
+class QuotePdfPagePlan:
+    line_item_pages: Tuple[LineItemsPagePlan, ...]
+    # View keys, in page order, that get a BUILDING VIEW page.
+    view_pages: Tuple[str, ...]
+
+    @property
+    def page_count(self) -> int:
+        return len(self.line_item_pages) + len(self.view_pages)
 
 
 def format_usd(amount: int) -> str:
@@ -67,58 +141,477 @@ def format_usd(amount: int) -> str:
     return f"{sign}${dollars:,.2f}"
 
 
-def make_quote_pdf_bytes(artifact: QuotePdfArtifact) -> bytes:
+# Bump when anything drawn inside the chrome forms below changes; it is part of the template cache key.
+QUOTE_CHROME_LAYOUT_VERSION = 1
+
+_HEADER_FORM = "QuoteHeaderChrome"
+_TOTALS_FORM = "QuoteTotalsChrome"
+_VIEW_FRAME_FORM = "QuoteBuildingViewFrame"
+_CHROME_CACHE_MAX = 8
+
+
+@dataclass(frozen=True)
+class QuoteChromeTemplate:
+    """
+    The static parts of a quote, prepared once and shared by every PDF.
+
+    ReportLab Form XObjects belong to a single document, so what is cached across quotes is
+    the expensive input: the vendor logo, decoded once into an `ImageReader`. Each document
+    draws it with `drawImage` inside the header form, defines the chrome forms once
+    (`_ChromeForms`) and stamps them with `doForm` wherever they repeat (continuation tables,
+    every BUILDING VIEW page). Documents built at the same time share the reader read-only.
+    """
+
+    layout_version: int
+    logo_sha256: Optional[str]
+    logo: Optional[ImageReader]
+
+
+_chrome_cache: Dict[Tuple[int, Optional[str]], QuoteChromeTemplate] = {}
+_chrome_cache_lock = threading.Lock()
+
+
+def quote_chrome_template(logo_png_bytes: Optional[bytes]) -> QuoteChromeTemplate:
+    """
+    Cached chrome template for a logo, keyed by the logo's sha256 and `QUOTE_CHROME_LAYOUT_VERSION`.
+    """
+    digest = hashlib.sha256(logo_png_bytes).hexdigest() if logo_png_bytes else None
+    key = (QUOTE_CHROME_LAYOUT_VERSION, digest)
+    with _chrome_cache_lock:
+        cached = _chrome_cache.get(key)
+    if cached is not None:
+        return cached
+
+    logo: Optional[ImageReader] = None
+    if logo_png_bytes:
+        try:
+            logo = ImageReader(BytesIO(logo_png_bytes))
+            # Decode now, before the reader is shared: the first getRGBData() call fills in the
+            # reader's pixel and alpha data, later calls only read them.
+            logo.getRGBData()
+        except Exception:
+            logo = None
+    template = QuoteChromeTemplate(
+        layout_version=QUOTE_CHROME_LAYOUT_VERSION,
+        logo_sha256=digest,
+        logo=logo,
+    )
+    with _chrome_cache_lock:
+        if len(_chrome_cache) >= _CHROME_CACHE_MAX:
+            _chrome_cache.pop(next(iter(_chrome_cache)))
+        _chrome_cache[key] = template
+    return template
+
+
+def clear_quote_chrome_cache() -> None:
+    with _chrome_cache_lock:
+        _chrome_cache.clear()
+
+
+class _ChromeForms:
+    """
+    Per-document Form XObjects: defined on first use, then only referenced.
+    """
+
+    def __init__(self, c: canvas.Canvas) -> None:
+        self._c = c
+        self._defined: Set[str] = set()
+
+    def stamp(
+        self,
+        name: str,
+        draw: Callable[[canvas.Canvas], None],
+        *,
+        x: float = 0.0,
+        y: float = 0.0,
+        scale: float = 1.0,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+    ) -> None:
+        c = self._c
+        if name not in self._defined:
+            if bbox is None:
+                c.beginForm(name)
+            else:
+                c.beginForm(name, *bbox)
+            draw(c)
+            c.endForm()
+            self._defined.add(name)
+        c.saveState()
+        c.translate(x, y)
+        if scale != 1.0:
+            c.scale(scale, scale)
+        c.doForm(name)
+        c.restoreState()
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+@dataclass(frozen=True)
+class _EncodedImage:
+    """
+    Image data a PDF viewer can decode directly: PNG IDAT (zlib + PNG row predictors) or JPEG.
+    """
+
+    width: int
+    height: int
+    color_space: str
+    filter_name: str
+    data: bytes
+
+
+def _png_passthrough(png_bytes: bytes) -> Optional[_EncodedImage]:
+    """
+    The IDAT stream of an 8-bit, non-interlaced RGB or grayscale PNG, which PDF's FlateDecode
+    reads as-is with PNG predictors. Anything else (alpha, palette, 16-bit) returns None.
     """
-    Render a quote PDF suitable for the demo.
+    if not png_bytes.startswith(_PNG_SIGNATURE):
+        return None
+    pos = len(_PNG_SIGNATURE)
+    header: Optional[Tuple[int, int, int, int, int]] = None
+    idat: List[bytes] = []
+    while pos + 8 <= len(png_bytes):
+        length = int.from_bytes(png_bytes[pos : pos + 4], "big")
+        kind = png_bytes[pos + 4 : pos + 8]
+        body = png_bytes[pos + 8 : pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IHDR" and len(body) == 13:
+            width = int.from_bytes(body[0:4], "big")
+            height = int.from_bytes(body[4:8], "big")
+            header = (width, height, body[8], body[9], body[12])
+        elif kind == b"IDAT":
+            idat.append(body)
+        elif kind in (b"tRNS", b"PLTE"):
+            return None
+        elif kind == b"IEND":
+            break
+    if header is None or not idat:
+        return None
+    width, height, bit_depth, color_type, interlace = header
+    if bit_depth != 8 or interlace != 0 or color_type not in (0, 2):
+        return None
+    return _EncodedImage(
+        width=width,
+        height=height,
+        color_space="DeviceRGB" if color_type == 2 else "DeviceGray",
+        filter_name="FlateDecode",
+        data=b"".join(idat),
+    )
+
+
+class _EncodedImageXObject(pdfdoc.PDFImageXObject):
+    """
+    Image XObject around already-compressed data, embedded without decoding or re-encoding.
+    """
+
+    def __init__(self, name: str, image: _EncodedImage) -> None:
+        super().__init__(name)
+        self.image = image
+        self.width = image.width
+        self.height = image.height
+
+    def format(self, document: pdfdoc.PDFDocument) -> bytes:
+        image = self.image
+        stream = pdfdoc.PDFStream(content=image.data)
+        d = stream.dictionary
+        d["Type"] = pdfdoc.PDFName("XObject")
+        d["Subtype"] = pdfdoc.PDFName("Image")
+        d["Width"] = image.width
+        d["Height"] = image.height
+        d["BitsPerComponent"] = 8
+        d["ColorSpace"] = pdfdoc.PDFName(image.color_space)
+        d["Filter"] = pdfdoc.PDFName(image.filter_name)
+        if image.filter_name == "FlateDecode":
+            d["DecodeParms"] = pdfdoc.PDFDictionary(
+                {
+                    "Predictor": 15,
+                    "Colors": 3 if image.color_space == "DeviceRGB" else 1,
+                    "BitsPerComponent": 8,
+                    "Columns": image.width,
+                }
+            )
+        d["Length"] = len(image.data)
+        return stream.format(document)
+
+
+class _DocumentImages:
+    """
+    Per-document image embedding: each distinct PNG is decoded or encoded at most once and
+    embedded as a single image XObject however often it is drawn.
+
+    The debug profile hands images to `drawImage` as before. Other profiles embed the PNG's
+    own compressed data (after downsampling to `image_dpi` / re-encoding as JPEG when asked),
+    so images are never decompressed, hashed and recompressed by ReportLab. Callers `reserve`
+    every placement up front so a shared image is sized for the largest box it appears in.
+    """
+
+    def __init__(self, c: canvas.Canvas, profile: QuotePdfProfile) -> None:
+        self._c = c
+        self._profile = profile
+        self._passthrough = profile.compress_streams or profile.image_dpi is not None or profile.jpeg_quality is not None
+        self._boxes: Dict[str, List[Tuple[float, float]]] = {}
+        self._readers: Dict[str, Optional[ImageReader]] = {}
+        self._embedded: Dict[str, Optional[Tuple[str, _EncodedImage]]] = {}
+
+    def reserve(self, png_bytes: bytes, width: float, height: float) -> None:
+        self._boxes.setdefault(hashlib.sha256(png_bytes).hexdigest(), []).append((width, height))
+
+    def draw(self, png_bytes: bytes, x: float, y: float, *, width: float, height: float, anchor: str) -> None:
+        key = hashlib.sha256(png_bytes).hexdigest()
+        if self._passthrough:
+            if key not in self._embedded:
+                self._embedded[key] = self._embed(key, png_bytes, self._boxes.get(key) or [(width, height)])
+            embedded = self._embedded[key]
+            if embedded is not None:
+                self._do_image(embedded[0], embedded[1], x, y, width, height, anchor)
+                return
+        if key not in self._readers:
+            try:
+                self._readers[key] = ImageReader(BytesIO(png_bytes))
+            except Exception:
+                self._readers[key] = None
+        reader = self._readers[key]
+        if reader is None:
+            return
+        self._c.drawImage(
+            reader,
+            x,
+            y,
+            width=width,
+            height=height,
+            preserveAspectRatio=True,
+            anchor=anchor,
+            mask="auto",
+        )
+
+    def _encode(self, png_bytes: bytes, boxes: List[Tuple[float, float]]) -> Optional[_EncodedImage]:
+        profile = self._profile
+        encoded = _png_passthrough(png_bytes)
+        if encoded is None:
+            # Alpha/palette PNGs keep ReportLab's own path (it builds the soft mask).
+            return None
+        scale = 1.0
+        if profile.image_dpi:
+            # preserveAspectRatio fits the image inside each box; size for the largest fit.
+            fit = max(min(bw / encoded.width, bh / encoded.height) for bw, bh in boxes)
+            scale = min(1.0, fit * profile.image_dpi / 72.0)
+        if scale >= 1.0 and profile.jpeg_quality is None:
+            return encoded
+
+        im = Image.open(BytesIO(png_bytes)).convert("RGB" if encoded.color_space == "DeviceRGB" else "L")
+        if scale < 1.0:
+            im = im.resize(
+                (max(1, round(encoded.width * scale)), max(1, round(encoded.height * scale))), Image.LANCZOS
+            )
+        out = BytesIO()
+        if profile.jpeg_quality is not None:
+            im.save(out, format="JPEG", quality=int(profile.jpeg_quality), optimize=True)
+            return _EncodedImage(
+                width=im.width,
+                height=im.height,
+                color_space=encoded.color_space,
+                filter_name="DCTDecode",
+                data=out.getvalue(),
+            )
+        im.save(out, format="PNG")
+        return _png_passthrough(out.getvalue())
+
+    def _embed(self, key: str, png_bytes: bytes, boxes: List[Tuple[float, float]]) -> Optional[Tuple[str, _EncodedImage]]:
+        try:
+            encoded = self._encode(png_bytes, boxes)
+        except Exception:
+            return None
+        if encoded is None:
+            return None
+        # ReportLab has no public call for registering an already-encoded image stream, so this
+        # goes through the document object (reportlab is pinned in requirements.txt). Should
+        # that ever change, the image falls back to `drawImage`.
+        name = f"QuoteImage{key[:24]}"
+        try:
+            doc = self._c._doc
+            reg_name = doc.getXObjectName(name)
+            if doc.idToObject.get(reg_name) is None:
+                doc.Reference(_EncodedImageXObject(name, encoded), reg_name)
+                doc.addForm(name, doc.idToObject[reg_name])
+        except AttributeError:
+            return None
+        return (name, encoded)
+
+    def _do_image(
+        self, name: str, image: _EncodedImage, x: float, y: float, width: float, height: float, anchor: str
+    ) -> None:
+        # The placement half of `canvas.drawImage`: an image XObject is drawn like a form, in a unit square.
+        c = self._c
+        x, y, width, height, _ = aspectRatioFix(True, anchor, x, y, width, height, image.width, image.height)
+        c.saveState()
+        c.translate(x, y)
+        c.scale(width, height)
+        c.doForm(name)
+        c.restoreState()
+
+
+# Bump whenever rendering changes in a way that should invalidate previously generated PDFs
+# (batch outputs and caches key on `quote_pdf_fingerprint`).
+QUOTE_PDF_RENDERER_VERSION = 1
+
+
+def quote_pdf_fingerprint(artifact: QuotePdfArtifact, *, profile: QuotePdfProfile = DEBUG_PDF_PROFILE) -> str:
+    """
+    Stable sha256 over everything that affects the rendered PDF: the artifact's fields (images
+    by content hash) and the renderer/chrome versions. ReportLab stamps a creation date and
+    document ID into every file, so the PDF bytes themselves can't serve as the identity.
+    """
+    h = hashlib.sha256()
+
+    def feed(tag: str, value: object) -> None:
+        h.update(tag.encode("utf-8") + b"=")
+        if isinstance(value, bytes):
+            h.update(hashlib.sha256(value).digest())
+        else:
+            h.update(repr(value).encode("utf-8"))
+        h.update(b"\x00")
+
+    feed("renderer", QUOTE_PDF_RENDERER_VERSION)
+    feed("chrome", QUOTE_CHROME_LAYOUT_VERSION)
+    feed("profile", profile)
+    for name in (
+        "quote_id",
+        "quote_date",
+        "pricebook_revision",
+        "customer_name",
+        "customer_email",
+        "building_label",
+        "building_summary",
+        "line_items",
+        "totals",
+        "notes",
+    ):
+        feed(name, getattr(artifact, name))
+    feed("logo", artifact.logo_png_bytes or b"")
+    feed("preview", artifact.building_preview_png_bytes or b"")
+    for key, png in sorted((artifact.building_views_png_bytes or {}).items()):
+        feed(f"view:{key}", png or b"")
+    for key, drawing in sorted((artifact.building_views_vector or {}).items()):
+        feed(f"vector:{key}", drawing)
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class QuotePdfOutput:
+    """
+    What `write_quote_pdf` wrote: the document's size and sha256 (hex).
+    """
+
+    size_bytes: int
+    sha256: str
+
+
+class _DigestingWriter:
+    """
+    File-like wrapper that forwards writes to `sink` while counting and hashing them.
+    """
+
+    def __init__(self, sink: BinaryIO) -> None:
+        self._sink = sink
+        self._sha = hashlib.sha256()
+        self._size = 0
+        # ReportLab names the document after the sink; keep it stable across wrappers.
+        self.name = getattr(sink, "name", None)
+
+    def write(self, data: bytes) -> int:
+        self._sink.write(data)
+        self._sha.update(data)
+        self._size += len(data)
+        return len(data)
+
+    def output(self) -> QuotePdfOutput:
+        return QuotePdfOutput(size_bytes=self._size, sha256=self._sha.hexdigest())
+
+
+def make_quote_pdf_bytes(artifact: QuotePdfArtifact, *, profile: QuotePdfProfile = DEBUG_PDF_PROFILE) -> bytes:
+    """
+    Render a quote PDF and return the whole document (see `write_quote_pdf`).
+    """
+    buf = BytesIO()
+    write_quote_pdf(artifact, buf, profile=profile)
+    return buf.getvalue()
+
+
+def write_quote_pdf(
+    artifact: QuotePdfArtifact, sink: BinaryIO, *, profile: QuotePdfProfile = DEBUG_PDF_PROFILE
+) -> QuotePdfOutput:
+    """
+    Render a quote PDF suitable for the demo straight into `sink` (an open binary file, HTTP
+    response, blob upload, ...), so callers that store or stream the PDF never hold their
+    own copy of the document. Returns its size and sha256.
 
     Layout goal:
     - Page 1: similar shape to the vendor screenshot page 1 (header + customer/details + line items + totals).
     - Additional pages: "BUILDING VIEW" pages for each provided view (front/back/left/right/isometric).
+
+    `profile` selects debug output (the default: uncompressed, easy to diff) or production
+    output (compressed streams, images downsampled to their placement); see `QuotePdfProfile`.
     """
-    buf = BytesIO()
-    c = canvas.Canvas(buf, pagesize=letter)
-    # Disable page compression so output is easier to diff/debug and tests can
+    out = _DigestingWriter(sink)
+    c = canvas.Canvas(out, pagesize=letter)
+    # Debug output keeps page compression off so it is easier to diff and tests can
     # reliably find markers in the bytes.
-    c.setPageCompression(0)
+    c.setPageCompression(1 if profile.compress_streams else 0)
     w, h = letter
 
-    margin = 0.6 * inch
+    margin = _PAGE_MARGIN
     x0 = margin
     y_top = h - margin
     pad = 0.15 * inch
 
-    # Header band
-    header_h = 1.35 * inch
-    _rect(c, x0, y_top - header_h, w - 2 * margin, header_h, stroke=1, fill=0)
-
-    # Logo (optional)
-    if artifact.logo_png_bytes:
-        try:
-            img = ImageReader(BytesIO(artifact.logo_png_bytes))
-            c.drawImage(
-                img,
-                x0 + pad,
-                y_top - header_h + pad,
-                width=1.35 * inch,
-                height=0.95 * inch,
-                mask="auto",
-                preserveAspectRatio=True,
-            )
-        except Exception:
-            pass
+    chrome = quote_chrome_template(artifact.logo_png_bytes)
+    forms = _ChromeForms(c)
 
-    # Company / Sales blocks (demo placeholders)
-    c.setFont("Helvetica-Bold", 11)
-    c.drawString(x0 + 1.65 * inch, y_top - 0.40 * inch, "Coast to Coast (Demo)")
-    c.setFont("Helvetica", 9)
-    c.drawString(x0 + 1.65 * inch, y_top - 0.62 * inch, "Local-first quoting demo")
-
-    # Quote summary (right)
+    header_h = _HEADER_H
     box_w = 2.2 * inch
     box_x = w - margin - box_w
     box_y = y_top - header_h + pad
     box_h = header_h - 2 * pad
-    _rect(c, box_x, box_y, box_w, box_h, stroke=1, fill=0)
+    y = y_top - header_h - 0.25 * inch
+    left_w = 3.2 * inch
+    right_w = (w - 2 * margin) - left_w - 0.15 * inch
+    block_h = _CUSTOMER_BLOCK_H
+
+    def draw_header(fc: canvas.Canvas) -> None:
+        # Header band
+        _rect(fc, x0, y_top - header_h, w - 2 * margin, header_h, stroke=1, fill=0)
+
+        # Logo (optional)
+        if chrome.logo is not None:
+            try:
+                fc.drawImage(
+                    chrome.logo,
+                    x0 + pad,
+                    y_top - header_h + pad,
+                    width=1.35 * inch,
+                    height=0.95 * inch,
+                    mask="auto",
+                    preserveAspectRatio=True,
+                )
+            except Exception:
+                pass
+
+        # Company / Sales blocks (demo placeholders)
+        fc.setFont("Helvetica-Bold", 11)
+        fc.drawString(x0 + 1.65 * inch, y_top - 0.40 * inch, "Coast to Coast (Demo)")
+        fc.setFont("Helvetica", 9)
+        fc.drawString(x0 + 1.65 * inch, y_top - 0.62 * inch, "Local-first quoting demo")
+
+        # Quote summary box (right) + Customer / Building boxes
+        _rect(fc, box_x, box_y, box_w, box_h, stroke=1, fill=0)
+        _rect(fc, x0, y - block_h, left_w, block_h, stroke=1, fill=0)
+        _rect(fc, x0 + left_w + 0.15 * inch, y - block_h, right_w, block_h, stroke=1, fill=0)
+        fc.setFont("Helvetica-Bold", 9)
+        fc.drawString(x0 + pad, y - 0.25 * inch, "CUSTOMER DETAILS")
+
+    forms.stamp(_HEADER_FORM, draw_header)
+
+    # Quote summary (right)
     line_h = 0.22 * inch
     t_y = box_y + box_h - 0.28 * inch
     c.setFont("Helvetica-Bold", 10)
@@ -133,18 +626,25 @@ def make_quote_pdf_bytes(artifact: QuotePdfArtifact) -> bytes:
     t_y -= (line_h + 0.03 * inch)
     c.drawString(box_x + pad, t_y, f"Total: {format_usd(artifact.totals.grand_total_cents)}")
 
-    y = y_top - header_h - 0.25 * inch
+    # Register every image placement before drawing, so a PNG shared by the preview and its
+    # BUILDING VIEW page is embedded once, sized for the larger of the two. Views that come as
+    # vector drawings are not embedded as images at all.
+    views = artifact.building_views_png_bytes or {}
+    vectors = artifact.building_views_vector or {}
+    preview_vector = None if artifact.building_preview_png_bytes else vectors.get("isometric")
+    # Reserve a left text column so the preview image never overlaps the "Commercial Buildings" label.
+    text_col_w = 1.10 * inch
+    preview_w = max(0.0, right_w - text_col_w - pad)
+    preview_h = 1.05 * inch
+    images = _DocumentImages(c, profile)
+    if artifact.building_preview_png_bytes:
+        images.reserve(artifact.building_preview_png_bytes, preview_w, preview_h)
+    _, _, view_w, view_h = _view_image_box()
+    for key in _VIEW_ORDER:
+        if views.get(key) and key not in vectors:
+            images.reserve(views[key], view_w, view_h)
 
     # Customer + Building blocks
-    left_w = 3.2 * inch
-    right_w = (w - 2 * margin) - left_w - 0.15 * inch
-    block_h = 1.55 * inch
-
-    _rect(c, x0, y - block_h, left_w, block_h, stroke=1, fill=0)
-    _rect(c, x0 + left_w + 0.15 * inch, y - block_h, right_w, block_h, stroke=1, fill=0)
-
-    c.setFont("Helvetica-Bold", 9)
-    c.drawString(x0 + pad, y - 0.25 * inch, "CUSTOMER DETAILS")
     # Customer name/email: keep inside the box with padding + truncation.
     cust_max_w = left_w - 2 * pad
     raw_name = (artifact.customer_name or "").strip()
@@ -159,8 +659,6 @@ def make_quote_pdf_bytes(artifact: QuotePdfArtifact) -> bytes:
     _draw_truncated(c, x0 + pad, y - 0.75 * inch, email, max_width=cust_max_w)
 
     right_x = x0 + left_w + 0.15 * inch
-    # Reserve a left text column so the preview image never overlaps the "Commercial Buildings" label.
-    text_col_w = 1.10 * inch
     c.setFont("Helvetica-Bold", 10)
     _draw_truncated(c, right_x + pad, y - 0.45 * inch, artifact.building_label, max_width=text_col_w - pad)
     c.setFont("Helvetica", 9)
@@ -169,117 +667,49 @@ def make_quote_pdf_bytes(artifact: QuotePdfArtifact) -> bytes:
     # Building preview image (optional) inside right block
     if artifact.building_preview_png_bytes:
         try:
-            img = ImageReader(BytesIO(artifact.building_preview_png_bytes))
             # Place the preview in the RIGHT portion of the box and right-align the image inside that area.
-            img_area_x = right_x + text_col_w
-            img_area_w = max(0.0, right_w - text_col_w - pad)
-            img_target_w = img_area_w
-            img_target_h = 1.05 * inch
-            img_x = img_area_x
-            img_y = y - block_h + pad
-            c.drawImage(
-                img,
-                img_x,
-                img_y,
-                width=img_target_w,
-                height=img_target_h,
-                preserveAspectRatio=True,
+            images.draw(
+                artifact.building_preview_png_bytes,
+                right_x + text_col_w,
+                y - block_h + pad,
+                width=preview_w,
+                height=preview_h,
                 anchor="e",
-                mask="auto",
             )
         except Exception:
             pass
+    elif preview_vector is not None:
+        _draw_vector_view(
+            c,
+            preview_vector,
+            right_x + text_col_w,
+            y - block_h + pad,
+            width=preview_w,
+            height=preview_h,
+            anchor="e",
+            forms=forms,
+        )
 
-    y = y - block_h - 0.25 * inch
-    # Line items table (auto-grow + paginate so totals never overlap line items)
+    # Line items table: planned up front (auto-grow + paginate so totals never overlap line
+    # items), then replayed page by page.
+    plan = plan_quote_pdf_pages(artifact)
     footer_base_y = margin + 0.35 * inch
-    reserved_bottom_y = footer_base_y
-    if artifact.notes:
-        # Notes render above the footer; reserve space so the table never collides.
-        # We show at most 3 notes, each ~0.12", plus a header gap.
-        reserved_bottom_y = footer_base_y + 0.15 * inch + (min(3, len(artifact.notes)) * 0.12 * inch)
-
-    remaining = list(artifact.line_items)
-    first_page = True
-    while True:
-        if first_page:
-            table_top_y = y
-        else:
+    for page_no, page in enumerate(plan.line_item_pages):
+        if page_no > 0:
+            c.showPage()
             # Continuation pages: a small title, then the table.
-            table_top_y = (h - margin) - 0.55 * inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(x0, (h - margin) - 0.25 * inch, "LINE ITEMS (CONTINUED)")
-
-        max_table_h = _max_table_height(table_top_y, reserved_bottom_y)
-        if max_table_h <= 1.0 * inch:
-            # Extremely defensive: ensure we always draw something valid.
-            max_table_h = 1.0 * inch
-
-        # First, see if the remaining items can fit on a single page WITH totals.
-        needed_with_totals = _needed_table_height_with_totals(
-            item_count=len(remaining),
-            row_h=0.27 * inch,
-            first_row_offset=0.55 * inch,
-            totals_box_h=2.05 * inch,
-            totals_bottom_pad=0.15 * inch,
-            clearance_rows=2,
-        )
-        if needed_with_totals > max_table_h:
-            can_finish_here = False
-        else:
-            # Double-check capacity using the SAME cutoff logic as the renderer so we never
-            # end up with overlap or silently dropped items.
-            table_h_candidate = max(3.6 * inch, needed_with_totals)
-            row_h = 0.27 * inch
-            row_start_y = table_top_y - 0.55 * inch
-            table_bottom_y = table_top_y - table_h_candidate
-            bottom_content_pad = max(0.45 * inch, 2.0 * row_h)
-            totals_box_h = 2.05 * inch
-            totals_bottom_pad = 0.15 * inch
-            totals_box_top_y = table_bottom_y + totals_bottom_pad + totals_box_h
-            totals_clearance_y = totals_box_top_y + (2.0 * row_h)
-            min_row_y = max(table_bottom_y + bottom_content_pad, totals_clearance_y)
-            if row_start_y <= min_row_y:
-                capacity = 0
-            else:
-                capacity = int((row_start_y - min_row_y) // row_h) + 1
-            can_finish_here = capacity >= len(remaining)
-
-        if can_finish_here:
-            table_h = max(3.6 * inch, needed_with_totals)
-            remaining = _render_line_items_table_page(
-                c,
-                artifact=artifact,
-                x0=x0,
-                margin=margin,
-                pad=pad,
-                page_w=w,
-                table_top_y=table_top_y,
-                table_h=table_h,
-                include_totals=True,
-                line_items=tuple(remaining),
-                reserved_bottom_y=reserved_bottom_y,
-            )
-            break
-
-        # Not enough room to finish: render a continuation page WITHOUT totals,
-        # using the maximum available table height to pack rows.
-        table_h = max_table_h
-        remaining = _render_line_items_table_page(
+        _render_line_items_table_page(
             c,
             artifact=artifact,
+            page=page,
             x0=x0,
             margin=margin,
             pad=pad,
             page_w=w,
-            table_top_y=table_top_y,
-            table_h=table_h,
-            include_totals=False,
-            line_items=tuple(remaining),
-            reserved_bottom_y=reserved_bottom_y,
+            forms=forms,
         )
-        c.showPage()
-        first_page = False
 
     # Notes + traceability footer
     c.setFont("Helvetica", 8)
@@ -297,8 +727,6 @@ def make_quote_pdf_bytes(artifact: QuotePdfArtifact) -> bytes:
     c.showPage()
 
     # Additional "BUILDING VIEW" pages, similar to the vendor PDF.
-    views = artifact.building_views_png_bytes or {}
-    view_order = ("front", "back", "left", "right", "isometric")
     view_labels = {
         "front": "FRONT",
         "back": "BACK",
@@ -306,20 +734,20 @@ def make_quote_pdf_bytes(artifact: QuotePdfArtifact) -> bytes:
         "right": "RIGHT",
         "isometric": "ISOMETRIC",
     }
-    for key in view_order:
-        png = views.get(key)
-        if not png:
-            continue
+    for key in plan.view_pages:
         _render_building_view_page(
             c,
-            png_bytes=png,
+            png_bytes=views.get(key),
+            vector=vectors.get(key),
             title="BUILDING VIEW",
             label=view_labels.get(key, key.upper()),
+            forms=forms,
+            images=images,
         )
         c.showPage()
 
     c.save()
-    return buf.getvalue()
+    return out.output()
 
 
 def logo_png_bytes_from_svg(svg_path: Path) -> Optional[bytes]:
@@ -366,34 +794,61 @@ def _totals_row(c: canvas.Canvas, x: float, y: float, label: str, amount_cents:
     c.drawRightString(x + box_w - right_pad, y, amount_txt)
 
 
-def _draw_truncated(c: canvas.Canvas, x: float, y: float, text: str, *, max_width: float) -> None:
+_glyph_widths: Dict[Tuple[str, str], float] = {}
+
+
+def _glyph_width(font_name: str, ch: str) -> float:
     """
-    Draw text truncated with ellipsis so it stays inside a box.
+    Advance width of one character at size 1000, measured once per font and cached.
+    """
+    key = (font_name, ch)
+    w = _glyph_widths.get(key)
+    if w is None:
+        w = pdfmetrics.stringWidth(ch, font_name, 1000)
+        _glyph_widths[key] = w
+    return w
+
+
+def _fit_text(text: str, *, max_width: float, font_name: str, font_size: float) -> str:
+    """
+    `text` truncated with an ellipsis so it fits in `max_width` ("" if nothing fits).
     """
     t = (text or "").strip()
-    if not t:
-        return
-    if max_width <= 0:
-        return
-    if c.stringWidth(t) <= max_width:
-        c.drawString(x, y, t)
-        return
+    if not t or max_width <= 0:
+        return ""
+    scale = font_size / 1000.0
+    prefix = list(accumulate((_glyph_width(font_name, ch) for ch in t), initial=0.0))
+    if prefix[-1] * scale <= max_width:
+        return t
     # ASCII ellipsis for compatibility with ReportLab's built-in fonts.
     ell = "..."
+    ell_w = sum(_glyph_width(font_name, ch) for ch in ell)
     # Walk back until it fits.
     lo = 0
     hi = len(t)
     best = ""
     while lo <= hi:
         mid = (lo + hi) // 2
-        cand = (t[:mid].rstrip() + ell) if mid < len(t) else t
-        if c.stringWidth(cand) <= max_width:
+        if mid < len(t):
+            head = t[:mid].rstrip()
+            cand, cand_w = head + ell, prefix[len(head)] + ell_w
+        else:
+            cand, cand_w = t, prefix[-1]
+        if cand_w * scale <= max_width:
             best = cand
             lo = mid + 1
         else:
             hi = mid - 1
-    if best:
-        c.drawString(x, y, best)
+    return best
+
+
+def _draw_truncated(c: canvas.Canvas, x: float, y: float, text: str, *, max_width: float) -> None:
+    """
+    Draw text truncated with ellipsis so it stays inside a box.
+    """
+    fitted = _fit_text(text, max_width=max_width, font_name=c._fontname, font_size=c._fontsize)
+    if fitted:
+        c.drawString(x, y, fitted)
 
 
 def _max_table_height(table_top_y: float, reserved_bottom_y: float) -> float:
@@ -435,29 +890,124 @@ def _needed_table_height_with_totals(
     )
 
 
+def _reserved_bottom_y(note_count: int) -> float:
+    footer_base_y = _PAGE_MARGIN + 0.35 * inch
+    if not note_count:
+        return footer_base_y
+    # Notes render above the footer; reserve space so the table never collides.
+    # We show at most 3 notes, each ~0.12", plus a header gap.
+    return footer_base_y + 0.15 * inch + (min(3, note_count) * 0.12 * inch)
+
+
+def _rows_that_fit(table_top_y: float, table_h: float, *, include_totals: bool, limit: int) -> int:
+    """
+    How many rows (up to `limit`) a table page holds; the same arithmetic the renderer steps through.
+    """
+    table_bottom_y = table_top_y - table_h
+    bottom_content_pad = max(0.45 * inch, 2.0 * _ROW_H)
+    # 1-2 line heights of clearance above the totals box.
+    totals_clearance_y = table_bottom_y + _TOTALS_BOTTOM_PAD + _TOTALS_BOX_H + 2.0 * _ROW_H
+    row_y = table_top_y - _FIRST_ROW_OFFSET
+    n = 0
+    while n < limit:
+        if row_y < table_bottom_y + bottom_content_pad:
+            break
+        if include_totals and row_y <= totals_clearance_y:
+            break
+        row_y -= _ROW_H
+        n += 1
+    return n
+
+
+def plan_quote_pdf_pages(artifact: QuotePdfArtifact) -> QuotePdfPagePlan:
+    """
+    Lay out the whole quote before anything is drawn: which line items land on which table
+    page (with descriptions already fitted to their column), where the totals go, and which
+    BUILDING VIEW pages follow. `write_quote_pdf` replays this plan as-is.
+    """
+    w, h = letter
+    first_table_top_y = (h - _PAGE_MARGIN) - _HEADER_H - 0.25 * inch - _CUSTOMER_BLOCK_H - 0.25 * inch
+    continued_table_top_y = (h - _PAGE_MARGIN) - 0.55 * inch
+    reserved_bottom_y = _reserved_bottom_y(len(artifact.notes))
+    desc_max_w = (w - 2 * _PAGE_MARGIN) - (1.55 * inch + 0.20 * inch)  # qty+amount columns
+    font_name, font_size = _LINE_ITEM_FONT
+
+    rows = [
+        (
+            _fit_text(li.description, max_width=desc_max_w, font_name=font_name, font_size=font_size),
+            str(max(1, int(li.qty))),
+            format_usd(li.amount_cents),
+        )
+        for li in artifact.line_items
+    ]
+
+    pages: List[LineItemsPagePlan] = []
+    start = 0
+    while True:
+        table_top_y = continued_table_top_y if pages else first_table_top_y
+        remaining = len(rows) - start
+        # Extremely defensive: ensure we always draw something valid.
+        max_table_h = max(_max_table_height(table_top_y, reserved_bottom_y), 1.0 * inch)
+
+        # First, see if the remaining items can fit on this page WITH totals.
+        needed_with_totals = _needed_table_height_with_totals(
+            item_count=remaining,
+            row_h=_ROW_H,
+            first_row_offset=_FIRST_ROW_OFFSET,
+            totals_box_h=_TOTALS_BOX_H,
+            totals_bottom_pad=_TOTALS_BOTTOM_PAD,
+            clearance_rows=2,
+        )
+        if needed_with_totals <= max_table_h:
+            table_h = max(_MIN_TOTALS_TABLE_H, needed_with_totals)
+            if _rows_that_fit(table_top_y, table_h, include_totals=True, limit=remaining) == remaining:
+                pages.append(
+                    LineItemsPagePlan(
+                        table_top_y=table_top_y,
+                        table_h=table_h,
+                        include_totals=True,
+                        rows=tuple(rows[start:]),
+                    )
+                )
+                break
+
+        # Not enough room to finish: a page WITHOUT totals, using the maximum available table
+        # height to pack rows (always at least one, so pagination terminates).
+        count = max(1, _rows_that_fit(table_top_y, max_table_h, include_totals=False, limit=remaining))
+        pages.append(
+            LineItemsPagePlan(
+                table_top_y=table_top_y,
+                table_h=max_table_h,
+                include_totals=False,
+                rows=tuple(rows[start : start + count]),
+            )
+        )
+        start += count
+
+    views = artifact.building_views_png_bytes or {}
+    vectors = artifact.building_views_vector or {}
+    return QuotePdfPagePlan(
+        line_item_pages=tuple(pages),
+        view_pages=tuple(key for key in _VIEW_ORDER if views.get(key) or vectors.get(key)),
+    )
+
+
 def _render_line_items_table_page(
     c: canvas.Canvas,
     *,
     artifact: QuotePdfArtifact,
+    page: LineItemsPagePlan,
     x0: float,
     margin: float,
     pad: float,
     page_w: float,
-    table_top_y: float,
-    table_h: float,
-    include_totals: bool,
-    line_items: Tuple[QuotePdfLineItem, ...],
-    reserved_bottom_y: float,
-) -> list[QuotePdfLineItem]:
+    forms: _ChromeForms,
+) -> None:
     """
-    Render one page of the line-items table.
-
-    Returns the remaining (not rendered) line items.
+    Draw one planned page of the line-items table (see `plan_quote_pdf_pages`).
     """
-    if table_top_y - table_h <= reserved_bottom_y:
-        # Don't hard-error; drawing will still clip visually but we keep output valid.
-        pass
-
+    table_top_y = page.table_top_y
+    table_h = page.table_h
     table_w = page_w - 2 * margin
     table_bottom_y = table_top_y - table_h
     _rect(c, x0, table_bottom_y, table_w, table_h, stroke=1, fill=0)
@@ -468,40 +1018,45 @@ def _render_line_items_table_page(
     c.drawRightString(page_w - margin - 0.15 * inch, table_top_y - 0.25 * inch, "AMOUNT")
     _hline(c, x0, page_w - margin, table_top_y - 0.35 * inch)
 
-    row_h = 0.27 * inch
-    row_y = table_top_y - 0.55 * inch
-    bottom_content_pad = max(0.45 * inch, 2.0 * row_h)
-
-    c.setFont("Helvetica", 9)
-    desc_max_w = (page_w - 2 * margin) - (1.55 * inch + 0.20 * inch)  # qty+amount columns
+    row_y = table_top_y - _FIRST_ROW_OFFSET
+    c.setFont(*_LINE_ITEM_FONT)
+    for description, qty, amount in page.rows:
+        if description:
+            c.drawString(x0 + pad, row_y, description)
+        c.drawRightString(page_w - margin - 1.4 * inch, row_y, qty)
+        c.drawRightString(page_w - margin - 0.15 * inch, row_y, amount)
+        row_y -= _ROW_H
 
     # Optional totals box geometry (bottom-right inside table)
     totals_box_w = 2.35 * inch
-    totals_box_h = 2.05 * inch
-    totals_bottom_pad = 0.15 * inch
-    totals_box_bottom_y = table_bottom_y + totals_bottom_pad
+    totals_box_h = _TOTALS_BOX_H
+    totals_box_bottom_y = table_bottom_y + _TOTALS_BOTTOM_PAD
     totals_box_top_y = totals_box_bottom_y + totals_box_h
-    totals_clearance_y = totals_box_top_y + (2.0 * row_h)  # 1–2 line heights above the box
-
-    rendered = 0
-    for li in line_items:
-        if row_y < (table_bottom_y + bottom_content_pad):
-            break
-        if include_totals and row_y <= totals_clearance_y:
-            break
-        _draw_truncated(c, x0 + pad, row_y, li.description, max_width=desc_max_w)
-        c.drawRightString(page_w - margin - 1.4 * inch, row_y, str(max(1, int(li.qty))))
-        c.drawRightString(page_w - margin - 0.15 * inch, row_y, format_usd(li.amount_cents))
-        row_y -= row_h
-        rendered += 1
 
-    if include_totals:
+    if page.include_totals:
         tx = page_w - margin - totals_box_w
-        _rect(c, tx, totals_box_bottom_y, totals_box_w, totals_box_h, stroke=1, fill=0)
 
         # Totals layout inside the box (keep generous padding so labels never collide with amounts).
         left_pad = 0.12 * inch
         row_step = 0.19 * inch
+        band_h = 0.20 * inch
+        # Offset of the "Pay Now" band's text baseline below the top of the box.
+        band_offset = 0.30 * inch + 4 * row_step + 0.03 * inch + (row_step + 0.05 * inch)
+
+        # The form's BBox starts at its origin, so keep the box stroke clear of it.
+        origin = 1.0
+
+        def draw_totals_chrome(fc: canvas.Canvas) -> None:
+            # Drawn with the box's bottom-left corner at (origin, origin).
+            _rect(fc, origin, origin, totals_box_w, totals_box_h, stroke=1, fill=0)
+            band_text_y = origin + totals_box_h - band_offset
+            fc.setFillColor(colors.black)
+            fc.rect(origin, band_text_y - band_h + 0.02 * inch, totals_box_w, band_h, stroke=0, fill=1)
+            fc.setFillColor(colors.white)
+            fc.setFont("Helvetica-Bold", 9)
+            fc.drawString(origin + left_pad, band_text_y - 0.13 * inch, "Pay Now")
+
+        forms.stamp(_TOTALS_FORM, draw_totals_chrome, x=tx - origin, y=totals_box_bottom_y - origin)
         y_cursor = totals_box_top_y - 0.30 * inch
 
         c.setFont("Helvetica", 9)
@@ -518,15 +1073,7 @@ def _render_line_items_table_page(
         _totals_row(c, tx, y_cursor, "Grand Total", artifact.totals.grand_total_cents, totals_box_w)
         y_cursor -= (row_step + 0.05 * inch)
 
-        # Pay now band + payment breakdown
-        band_h = 0.20 * inch
-        c.setFillColor(colors.black)
-        band_y = y_cursor - band_h + 0.02 * inch
-        c.rect(tx, band_y, totals_box_w, band_h, stroke=0, fill=1)
-        c.setFillColor(colors.white)
-        c.setFont("Helvetica-Bold", 9)
-        c.drawString(tx + left_pad, y_cursor - 0.13 * inch, "Pay Now")
-        c.setFillColor(colors.black)
+        # Pay now band (part of the totals chrome form) + payment breakdown
         # Extra spacing so Downpayment text never overlaps the black band.
         y_cursor -= (band_h + 0.18 * inch)
 
@@ -535,22 +1082,39 @@ def _render_line_items_table_page(
         y_cursor -= row_step
         _totals_row(c, tx, y_cursor, "Balance Due", artifact.totals.balance_due_cents, totals_box_w)
 
-    return list(line_items[rendered:])
+
+def _view_image_box() -> Tuple[float, float, float, float]:
+    """
+    (x, y, width, height) of the image area inside a BUILDING VIEW page frame.
+    """
+    w, h = letter
+    margin = 0.6 * inch
+    pad = 0.18 * inch
+    frame_w = w - 2 * margin
+    frame_h = h - 2 * margin - 1.35 * inch
+    return (
+        margin + pad,
+        margin + 0.85 * inch + pad + 0.20 * inch,
+        frame_w - 2 * pad,
+        frame_h - 2 * pad - 0.20 * inch,
+    )
 
 
 def _render_building_view_page(
     c: canvas.Canvas,
     *,
-    png_bytes: bytes,
+    png_bytes: Optional[bytes],
+    vector: Optional[BuildingViewDrawing] = None,
     title: str,
     label: str,
+    forms: _ChromeForms,
+    images: _DocumentImages,
 ) -> None:
     """
     Render a single "BUILDING VIEW" page with a large image box and a centered label.
     """
     w, h = letter
     margin = 0.6 * inch
-    pad = 0.18 * inch
 
     # Title
     c.setFont("Helvetica-Bold", 11)
@@ -561,30 +1125,104 @@ def _render_building_view_page(
     frame_y = margin + 0.85 * inch
     frame_w = w - 2 * margin
     frame_h = h - 2 * margin - 1.35 * inch
-    _rect(c, frame_x, frame_y, frame_w, frame_h, stroke=1, fill=0)
+    forms.stamp(_VIEW_FRAME_FORM, lambda fc: _rect(fc, frame_x, frame_y, frame_w, frame_h, stroke=1, fill=0))
 
     # Image area inside frame
-    img_x = frame_x + pad
-    img_y = frame_y + pad + 0.20 * inch
-    img_w = frame_w - 2 * pad
-    img_h = frame_h - 2 * pad - 0.20 * inch
-
-    try:
-        img = ImageReader(BytesIO(png_bytes))
-        c.drawImage(
-            img,
-            img_x,
-            img_y,
-            width=img_w,
-            height=img_h,
-            preserveAspectRatio=True,
-            anchor="c",
-            mask="auto",
-        )
-    except Exception:
-        pass
+    img_x, img_y, img_w, img_h = _view_image_box()
+    if vector is not None:
+        _draw_vector_view(c, vector, img_x, img_y, width=img_w, height=img_h, anchor="c", forms=forms)
+    elif png_bytes:
+        try:
+            images.draw(png_bytes, img_x, img_y, width=img_w, height=img_h, anchor="c")
+        except Exception:
+            pass
 
     # Bottom label band
     c.setFont("Helvetica-Bold", 10)
     c.drawCentredString(w / 2.0, margin + 0.45 * inch, (label or "").strip().upper())
 
+
+def _draw_vector_view(
+    c: canvas.Canvas,
+    drawing: BuildingViewDrawing,
+    x: float,
+    y: float,
+    *,
+    width: float,
+    height: float,
+    anchor: str,
+    forms: _ChromeForms,
+) -> None:
+    """
+    Draw a vector building view fitted into the box like `drawImage(preserveAspectRatio=True)`.
+
+    Each drawing becomes one Form XObject in canvas-pixel units, so the isometric view shared by
+    the page-1 preview and its BUILDING VIEW page is written once.
+    """
+    cw, ch = drawing.canvas_px
+    scale = min(width / cw, height / ch)
+    x, y, _, _, _ = aspectRatioFix(True, anchor, x, y, width, height, cw, ch)
+    key = hashlib.sha256(repr(drawing).encode("utf-8")).hexdigest()
+    forms.stamp(
+        f"QuoteView{key[:24]}",
+        lambda fc: _draw_vector_shapes(fc, drawing),
+        x=x,
+        y=y,
+        scale=scale,
+        bbox=(0, 0, cw, ch),
+    )
+
+
+def _rgb(value: Tuple[int, int, int]) -> Tuple[float, float, float]:
+    return (value[0] / 255.0, value[1] / 255.0, value[2] / 255.0)
+
+
+def _draw_vector_shapes(c: canvas.Canvas, drawing: BuildingViewDrawing) -> None:
+    """
+    Paint `drawing` in canvas-pixel coordinates (y down), matching how PIL rasterizes the same
+    shapes: rect/ellipse corners are inclusive pixels, polygons and lines run through pixel centres,
+    and rectangle outlines are drawn inside the rectangle.
+    """
+    _, ch = drawing.canvas_px
+    c.saveState()
+    c.translate(0, ch)
+    c.scale(1, -1)
+    c.setLineJoin(1)
+    for shape in drawing.shapes:
+        _draw_vector_shape(c, shape)
+    c.restoreState()
+
+
+def _draw_vector_shape(c: canvas.Canvas, shape: VectorShape) -> None:
+    if shape.fill is not None:
+        c.setFillColorRGB(*_rgb(shape.fill))
+    if shape.outline is not None:
+        c.setStrokeColorRGB(*_rgb(shape.outline))
+    c.setLineWidth(max(1, shape.width))
+    fill = int(shape.fill is not None)
+    stroke = int(shape.outline is not None)
+    if shape.kind in ("rect", "ellipse"):
+        (x1, y1), (x2, y2) = shape.points[0], shape.points[-1]
+        x1, x2 = min(x1, x2), max(x1, x2) + 1
+        y1, y2 = min(y1, y2), max(y1, y2) + 1
+        if shape.kind == "ellipse":
+            c.ellipse(x1, y1, x2, y2, stroke=stroke, fill=fill)
+            return
+        if fill:
+            c.rect(x1, y1, x2 - x1, y2 - y1, stroke=0, fill=1)
+        if stroke:
+            inset = max(1, shape.width) / 2.0
+            c.rect(x1 + inset, y1 + inset, x2 - x1 - 2 * inset, y2 - y1 - 2 * inset, stroke=1, fill=0)
+        return
+    if len(shape.points) < 2:
+        return
+    path = c.beginPath()
+    px, py = shape.points[0]
+    path.moveTo(px + 0.5, py + 0.5)
+    for px, py in shape.points[1:]:
+        path.lineTo(px + 0.5, py + 0.5)
+    if shape.kind == "polygon":
+        path.close()
+        c.drawPath(path, stroke=stroke, fill=fill)
+    else:
+        c.drawPath(path, stroke=1, fill=0)
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+"""
+Render many quote PDFs in parallel worker processes.
+
+Month-end re-issues and post-price-change runs render hundreds of `QuotePdfArtifact`s; each is
+CPU-bound in ReportLab/PIL, so they are spread over a process pool. Workers write finished
+files straight to `out_dir` (atomically), and each PDF gets a `<name>.pdf.sha256.json` sidecar
+recording the artifact fingerprint and the PDF's own hash. A rerun skips artifacts whose PDF
+exists, still matches its recorded hash, and was rendered from the same fingerprint.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from building_views import BuildingViewDrawing, VectorShape
+from quote_pdf import (
+    PRODUCTION_PDF_PROFILE,
+    QuotePdfArtifact,
+    QuotePdfLineItem,
+    QuotePdfProfile,
+    QuotePdfTotals,
+    quote_pdf_fingerprint,
+    write_quote_pdf,
+)
+
+SIDECAR_SUFFIX = ".sha256.json"
+
+
+@dataclass(frozen=True)
+class BatchPdfResult:
+    quote_id: str
+    path: Path
+    status: str  # "written" | "skipped" | "failed"
+    duration_s: float
+    size_bytes: int = 0
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BatchPdfReport:
+    results: List[BatchPdfResult]
+    elapsed_s: float
+    jobs: int
+
+    def count(self, status: str) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def pdfs_per_s(self) -> float:
+        written = self.count("written")
+        return written / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def quote_pdf_filename(quote_id: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", (quote_id or "").strip()).strip("._") or "quote"
+    return f"QTE-{safe}.pdf"
+
+
+def _sidecar_path(pdf_path: Path) -> Path:
+    return pdf_path.with_name(pdf_path.name + SIDECAR_SUFFIX)
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def is_up_to_date(pdf_path: Path, fingerprint: str) -> bool:
+    sidecar = _sidecar_path(pdf_path)
+    if not pdf_path.is_file() or not sidecar.is_file():
+        return False
+    try:
+        meta = json.loads(sidecar.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    if not isinstance(meta, dict) or meta.get("fingerprint") != fingerprint:
+        return False
+    return meta.get("pdf_sha256") == _sha256_file(pdf_path)
+
+
+@contextmanager
+def _atomic_file(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a temp file next to `path` for writing; it replaces `path` only if the block succeeds.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    with _atomic_file(path) as f:
+        f.write(data)
+
+
+def _render_to_file(
+    artifact: QuotePdfArtifact, pdf_path: Path, fingerprint: str, profile: QuotePdfProfile
+) -> Tuple[int, float]:
+    """
+    Worker entry point: render the PDF straight into its file, then write the sidecar.
+    Returns (size, seconds).
+    """
+    t0 = time.perf_counter()
+    with _atomic_file(pdf_path) as f:
+        out = write_quote_pdf(artifact, f, profile=profile)
+    meta = {
+        "quote_id": artifact.quote_id,
+        "fingerprint": fingerprint,
+        "pdf_sha256": out.sha256,
+        "size_bytes": out.size_bytes,
+    }
+    _write_atomic(_sidecar_path(pdf_path), json.dumps(meta, indent=2).encode("utf-8"))
+    return (out.size_bytes, time.perf_counter() - t0)
+
+
+def make_quote_pdfs(
+    artifacts: Iterable[QuotePdfArtifact],
+    out_dir: Path,
+    *,
+    jobs: Optional[int] = None,
+    profile: QuotePdfProfile = PRODUCTION_PDF_PROFILE,
+    force: bool = False,
+    on_result: Optional[Callable[[BatchPdfResult], None]] = None,
+) -> BatchPdfReport:
+    """
+    Render `artifacts` into `out_dir/QTE-<quote_id>.pdf` using `jobs` worker processes
+    (default: CPU count; 1 renders in-process) with `profile` (default: production, like the CLI).
+    `on_result` is called as each PDF finishes.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    n_jobs = max(1, int(jobs if jobs is not None else (os.cpu_count() or 1)))
+    results: List[BatchPdfResult] = []
+
+    def emit(r: BatchPdfResult) -> None:
+        results.append(r)
+        if on_result is not None:
+            on_result(r)
+
+    t0 = time.perf_counter()
+    todo: List[Tuple[QuotePdfArtifact, Path, str]] = []
+    claimed: Set[Path] = set()
+    for artifact in artifacts:
+        pdf_path = out_dir / quote_pdf_filename(artifact.quote_id)
+        if pdf_path in claimed:
+            emit(
+                BatchPdfResult(
+                    quote_id=artifact.quote_id,
+                    path=pdf_path,
+                    status="failed",
+                    duration_s=0.0,
+                    error="duplicate quote_id in batch",
+                )
+            )
+            continue
+        claimed.add(pdf_path)
+        fingerprint = quote_pdf_fingerprint(artifact, profile=profile)
+        if not force and is_up_to_date(pdf_path, fingerprint):
+            emit(
+                BatchPdfResult(
+                    quote_id=artifact.quote_id,
+                    path=pdf_path,
+                    status="skipped",
+                    duration_s=0.0,
+                    size_bytes=pdf_path.stat().st_size,
+                )
+            )
+            continue
+        todo.append((artifact, pdf_path, fingerprint))
+
+    def finished(artifact: QuotePdfArtifact, pdf_path: Path, fut_result: Callable[[], Tuple[int, float]]) -> None:
+        try:
+            size, seconds = fut_result()
+        except Exception as exc:
+            emit(
+                BatchPdfResult(
+                    quote_id=artifact.quote_id,
+                    path=pdf_path,
+                    status="failed",
+                    duration_s=0.0,
+                    error=f"{type(exc).__name__}: {exc}",
+                )
+            )
+            return
+        emit(BatchPdfResult(quote_id=artifact.quote_id, path=pdf_path, status="written", duration_s=seconds, size_bytes=size))
+
+    if n_jobs == 1 or len(todo) <= 1:
+        for artifact, pdf_path, fingerprint in todo:
+            finished(artifact, pdf_path, lambda: _render_to_file(artifact, pdf_path, fingerprint, profile))
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(todo))) as pool:
+            pending: Dict[Future, Tuple[QuotePdfArtifact, Path]] = {
+                pool.submit(_render_to_file, artifact, pdf_path, fingerprint, profile): (artifact, pdf_path)
+                for artifact, pdf_path, fingerprint in todo
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    artifact, pdf_path = pending.pop(fut)
+                    finished(artifact, pdf_path, fut.result)
+
+    return BatchPdfReport(results=results, elapsed_s=time.perf_counter() - t0, jobs=n_jobs)
+
+
+def _b64(data: Optional[bytes]) -> Optional[str]:
+    return base64.b64encode(data).decode("ascii") if data else None
+
+
+def _unb64(value: object) -> Optional[bytes]:
+    return base64.b64decode(value) if isinstance(value, str) and value else None
+
+
+def _drawing_to_dict(drawing: BuildingViewDrawing) -> Dict[str, object]:
+    return {
+        "canvas_px": list(drawing.canvas_px),
+        "shapes": [
+            [shape.kind, [list(p) for p in shape.points], shape.fill, shape.outline, shape.width]
+            for shape in drawing.shapes
+        ],
+    }
+
+
+def _rgb_or_none(value: object) -> Optional[Tuple[int, int, int]]:
+    return (int(value[0]), int(value[1]), int(value[2])) if isinstance(value, (list, tuple)) else None
+
+
+def _drawing_from_dict(data: Dict[str, object]) -> BuildingViewDrawing:
+    cw, ch = data["canvas_px"]
+    return BuildingViewDrawing(
+        canvas_px=(int(cw), int(ch)),
+        shapes=tuple(
+            VectorShape(
+                kind=str(kind),
+                points=tuple((int(x), int(y)) for x, y in points),
+                fill=_rgb_or_none(fill),
+                outline=_rgb_or_none(outline),
+                width=int(width),
+            )
+            for kind, points, fill, outline, width in data.get("shapes") or []
+        ),
+    )
+
+
+def quote_artifact_to_dict(artifact: QuotePdfArtifact) -> Dict[str, object]:
+    """
+    JSON-safe form of an artifact (images base64-encoded), one line of a batch JSONL file.
+    """
+    return {
+        "quote_id": artifact.quote_id,
+        "quote_date": artifact.quote_date.isoformat(),
+        "pricebook_revision": artifact.pricebook_revision,
+        "customer_name": artifact.customer_name,
+        "customer_email": artifact.customer_email,
+        "building_label": artifact.building_label,
+        "building_summary": artifact.building_summary,
+        "line_items": [
+            {"description": li.description, "qty": li.qty, "amount_cents": li.amount_cents} for li in artifact.line_items
+        ],
+        "totals": {
+            "building_amount_cents": artifact.totals.building_amount_cents,
+            "discount_cents": artifact.totals.discount_cents,
+            "subtotal_cents": artifact.totals.subtotal_cents,
+            "additional_charges_cents": artifact.totals.additional_charges_cents,
+            "grand_total_cents": artifact.totals.grand_total_cents,
+            "downpayment_cents": artifact.totals.downpayment_cents,
+            "balance_due_cents": artifact.totals.balance_due_cents,
+        },
+        "notes": list(artifact.notes),
+        "logo_png_b64": _b64(artifact.logo_png_bytes),
+        "building_preview_png_b64": _b64(artifact.building_preview_png_bytes),
+        "building_views_png_b64": {k: _b64(v) for k, v in (artifact.building_views_png_bytes or {}).items()},
+        "building_views_vector": {k: _drawing_to_dict(v) for k, v in (artifact.building_views_vector or {}).items()},
+    }
+
+
+def quote_artifact_from_dict(data: Dict[str, object]) -> QuotePdfArtifact:
+    totals = data.get("totals")
+    if not isinstance(totals, dict):
+        raise ValueError("Quote artifact is missing `totals`")
+    raw_items = data.get("line_items")
+    raw_views = data.get("building_views_png_b64")
+    views = {str(k): b for k, v in raw_views.items() if (b := _unb64(v))} if isinstance(raw_views, dict) else {}
+    raw_vectors = data.get("building_views_vector")
+    vectors = (
+        {str(k): _drawing_from_dict(v) for k, v in raw_vectors.items() if isinstance(v, dict)}
+        if isinstance(raw_vectors, dict)
+        else {}
+    )
+    return QuotePdfArtifact(
+        quote_id=str(data["quote_id"]),
+        quote_date=date.fromisoformat(str(data["quote_date"])),
+        pricebook_revision=str(data.get("pricebook_revision") or ""),
+        customer_name=str(data.get("customer_name") or ""),
+        customer_email=str(data.get("customer_email") or ""),
+        building_label=str(data.get("building_label") or ""),
+        building_summary=str(data.get("building_summary") or ""),
+        line_items=tuple(
+            QuotePdfLineItem(
+                description=str(li.get("description") or ""),
+                qty=int(li.get("qty") or 1),
+                amount_cents=int(li.get("amount_cents") or 0),
+            )
+            for li in (raw_items if isinstance(raw_items, list) else [])
+            if isinstance(li, dict)
+        ),
+        totals=QuotePdfTotals(**{k: int(v) for k, v in totals.items()}),
+        notes=tuple(str(n) for n in (data.get("notes") or []) if isinstance(n, str)),
+        logo_png_bytes=_unb64(data.get("logo_png_b64")),
+        building_preview_png_bytes=_unb64(data.get("building_preview_png_b64")),
+        building_views_png_bytes=views or None,
+        building_views_vector=vectors or None,
+    )
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+"""
+Disk-backed LRU cache of finished quote PDFs, shared by every app process on the host.
+
+Exporting a quote re-renders all five building views and the whole PDF. The cache key is
+built from the quote's inputs *before* any of that work (see `quote_pdf_cache_key`), so a
+repeated download, or the same quote exported from another worker, is served from disk.
+
+Layout: `<root>/ab/abcdef....pdf`, stored by `disk_lru_cache.DiskLruCache` (atomic writes,
+LRU eviction once the cache exceeds `max_bytes`).
+
+Environment:
+- `QUOTE_PDF_CACHE=0` disables the cache
+- `QUOTE_PDF_CACHE_DIR` (default: `<tmp>/steven-demo-quote-pdfs`)
+- `QUOTE_PDF_CACHE_MAX_MB` (default: 256)
+
+If the cache dir can't be written, `get_or_write` renders into a private spool dir of the process
+instead (see `quote_pdf_spool`), so a full or read-only cache never breaks an export.
+"""
+
+import hashlib
+import json
+import tempfile
+import threading
+from pathlib import Path
+from typing import BinaryIO, Callable, Mapping, Optional
+
+from building_views import BUILDING_VIEWS_RENDERER_VERSION
+from disk_lru_cache import DiskLruCache, DiskLruCacheStats, disk_lru_settings_from_env
+from quote_pdf import QUOTE_CHROME_LAYOUT_VERSION, QUOTE_PDF_RENDERER_VERSION
+
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "steven-demo-quote-pdfs"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
+QUOTE_PDF_CACHE_SCHEMA_VERSION = 1
+
+
+def quote_pdf_cache_key(parts: Mapping[str, object]) -> str:
+    """
+    sha256 over the caller's quote inputs plus the PDF and building-view renderer versions,
+    so a renderer change never serves a stale PDF.
+    """
+    payload = {
+        "schema": QUOTE_PDF_CACHE_SCHEMA_VERSION,
+        "pdf_renderer": QUOTE_PDF_RENDERER_VERSION,
+        "pdf_chrome": QUOTE_CHROME_LAYOUT_VERSION,
+        "building_views": BUILDING_VIEWS_RENDERER_VERSION,
+        "parts": parts,
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# Kept as its own name for callers; the stats come from the shared disk LRU.
+QuotePdfCacheStats = DiskLruCacheStats
+
+
+class QuotePdfDiskCache(DiskLruCache):
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        super().__init__(root, max_bytes=max_bytes, magic={".pdf": b"%PDF"}, label="quote PDF cache")
+        self._spool: Optional[QuotePdfDiskCache] = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.read(key, ".pdf")
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """
+        Like `get`, but returns the entry's path instead of reading the whole PDF. Also finds
+        PDFs `get_or_write` had to spool because the cache dir couldn't be written.
+        """
+        path = self.locate(key, ".pdf")
+        if path is None and self._spool is not None:
+            path = self._spool.locate(key, ".pdf")
+        return path
+
+    def put(self, key: str, pdf: bytes) -> Path:
+        return self.put_stream(key, lambda f: f.write(pdf))
+
+    def put_stream(self, key: str, write: Callable[[BinaryIO], object]) -> Path:
+        """
+        Store the PDF that `write` renders into the file object it is given.
+        """
+        return self.write(key, ".pdf", write)
+
+    def get_or_build(self, key: str, build: Callable[[], bytes]) -> bytes:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        pdf = build()
+        try:
+            self.put(key, pdf)
+        except OSError:
+            # A full or read-only cache dir must never break an export.
+            pass
+        return pdf
+
+    def get_or_write(self, key: str, write: Callable[[BinaryIO], object]) -> Path:
+        """
+        Path of the cached PDF for `key`, rendering it into the cache first on a miss.
+        """
+        cached = self.get_path(key)
+        if cached is not None:
+            return cached
+        try:
+            return self.put_stream(key, write)
+        except OSError:
+            # A full or read-only cache dir must never break an export.
+            with self._lock:
+                if self._spool is None:
+                    self._spool = quote_pdf_spool()
+            return self._spool.put_stream(key, write)
+
+
+def quote_pdf_spool() -> QuotePdfDiskCache:
+    """
+    A small cache in a fresh private temp dir, for PDFs that can't go to the shared cache.
+    """
+    return QuotePdfDiskCache(Path(tempfile.mkdtemp(prefix="steven-demo-quote-pdf-spool-")), max_bytes=SPOOL_MAX_BYTES)
+
+
+def quote_pdf_cache_from_env() -> Optional[QuotePdfDiskCache]:
+    settings = disk_lru_settings_from_env(
+        "QUOTE_PDF_CACHE", default_dir=DEFAULT_CACHE_DIR, default_max_bytes=DEFAULT_MAX_BYTES
+    )
+    if settings is None:
+        return None
+    root, max_bytes = settings
+    return QuotePdfDiskCache(root, max_bytes=max_bytes)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+"""
+Render many quote PDFs in parallel (see quote_pdf_batch.py).
+
+Input is a JSONL file with one quote artifact per line (`quote_pdf_batch.quote_artifact_to_dict`);
+`--demo N` renders N generated sample quotes instead. PDFs already in `--out-dir` that were
+rendered from identical input are skipped unless `--force` is given.
+
+Usage:
+  python3 scripts/batch_quote_pdfs.py --input quotes.jsonl --out-dir out/quotes --jobs 4
+  python3 scripts/batch_quote_pdfs.py --demo 40 --out-dir out/quotes_demo
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+from typing import Iterator
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from quote_pdf import QUOTE_PDF_PROFILES, QuotePdfArtifact, quote_pdf_profile
+from quote_pdf_batch import BatchPdfResult, make_quote_pdfs, quote_artifact_from_dict
+
+
+def _iter_jsonl(path: Path) -> Iterator[QuotePdfArtifact]:
+    with path.open("r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield quote_artifact_from_dict(json.loads(line))
+            except (KeyError, TypeError, ValueError) as e:
+                raise SystemExit(f"{path}:{lineno}: invalid quote artifact ({e})") from e
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Render quote PDFs in parallel worker processes.")
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--input", help="JSONL file, one quote artifact per line.")
+    src.add_argument("--demo", type=int, default=0, help="Render N generated sample quotes.")
+    parser.add_argument("--out-dir", required=True)
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--profile", choices=sorted(QUOTE_PDF_PROFILES), default="production")
+    parser.add_argument("--force", action="store_true", help="Re-render even if an up-to-date PDF exists.")
+    args = parser.parse_args()
+
+    if args.input:
+        artifacts = list(_iter_jsonl(Path(args.input)))
+    else:
+        from benchmark_quote_pdf import sample_artifact
+
+        base = sample_artifact(quote_id="DEMO")
+        artifacts = [replace(base, quote_id=f"DEMO-{i + 1:04d}") for i in range(max(0, args.demo))]
+
+    def progress(r: BatchPdfResult) -> None:
+        if r.status == "failed":
+            print(f"- {r.quote_id}: FAILED {r.error}")
+        elif r.status == "written":
+            print(f"- {r.path.name}: {r.size_bytes} bytes in {r.duration_s * 1000.0:.0f} ms")
+
+    report = make_quote_pdfs(
+        artifacts,
+        Path(args.out_dir),
+        jobs=args.jobs,
+        profile=quote_pdf_profile(args.profile),
+        force=args.force,
+        on_result=progress,
+    )
+    print(
+        f"{report.count('written')} written, {report.count('skipped')} skipped, {report.count('failed')} failed "
+        f"in {report.elapsed_s:.2f}s with {report.jobs} jobs ({report.pdfs_per_s:.1f} PDFs/s)"
+    )
+    return 1 if report.count("failed") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
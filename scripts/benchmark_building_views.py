@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+"""
+Micro-benchmark for building view encoding (`building_views.ViewEncoding`).
+
+Renders the five views of a representative building once, then encodes every view with each
+encoding profile repeatedly, reporting encode time and output bytes per profile. Use it to
+pick profiles: `fast` for interactive previews, `small` for embedding/storage, `webp` for the
+browser. It also times redraws: drawing the views from scratch, after an openings-only change
+(the cached background and structure layers are reused), and after a color-only change
+(the cached geometry is recolored).
+
+The scaling sweep renders every view cold (all geometry caches cleared) across building sizes
+up to the 120 x 250 x 30 ft clamp, canvases up to 2400x1600 and 0 to 40 openings. Per view it
+reports render and encode time, output bytes, the tracemalloc peak (Python heap: scenes,
+shape lists, encoded bytes) and the raster bytes PIL holds outside it. Compare the JSON across
+commits to catch regressions from new drawing detail.
+
+Usage:
+  python3 scripts/benchmark_building_views.py
+  python3 scripts/benchmark_building_views.py --iterations 20 --json out/bench_building_views.json
+  python3 scripts/benchmark_building_views.py --scaling-iterations 0  # skip the scaling sweep
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from building_views import (
+    FAST_VIEW_ENCODING,
+    VIEW_ENCODINGS,
+    BuildingColorScheme,
+    BuildingOpening,
+    BuildingOpeningKind,
+    BuildingSide,
+    ViewEncoding,
+    _encode_view,
+    _frame_mask,
+    _frame_scene,
+    _ground_layer,
+    _ground_scene,
+    _layout_wall,
+    _openings_scene,
+    _render_view,
+    _structure_layer,
+    _structure_scene,
+    _view_geometry,
+    _view_request,
+    _view_scene,
+    view_encoding,
+)
+
+SAMPLE_BUILDING = dict(
+    width_ft=30,
+    length_ft=50,
+    height_ft=14,
+    colors=BuildingColorScheme(roof="Burgundy", trim="White", sides="Tan"),
+    openings=(
+        BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.GARAGE_DOOR, width_ft=12, height_ft=10),
+        BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.DOOR, width_ft=3, height_ft=7),
+        BuildingOpening(side=BuildingSide.RIGHT, kind=BuildingOpeningKind.WINDOW, width_ft=3, height_ft=3),
+        BuildingOpening(side=BuildingSide.RIGHT, kind=BuildingOpeningKind.WINDOW, width_ft=3, height_ft=3),
+    ),
+)
+VIEW_NAMES = ("isometric", "front", "back", "left", "right")
+SCALING_SIZES_FT = ((12, 21, 9), (30, 50, 14), (120, 250, 30))
+SCALING_CANVASES_PX = ((640, 360), (900, 520), (2400, 1600))
+SCALING_OPENING_COUNTS = (0, 8, 40)
+_OPENING_SIZES_FT = {
+    BuildingOpeningKind.WINDOW: (3, 3),
+    BuildingOpeningKind.DOOR: (3, 7),
+    BuildingOpeningKind.GARAGE_DOOR: (10, 8),
+}
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))], 2),
+    }
+
+
+def _clear_view_caches() -> None:
+    for cache in (
+        _view_geometry,
+        _structure_layer,
+        _ground_layer,
+        _frame_mask,
+        _view_scene,
+        _openings_scene,
+        _structure_scene,
+        _ground_scene,
+        _frame_scene,
+        _layout_wall,
+    ):
+        cache.cache_clear()
+
+
+def _sample_openings(count: int) -> Tuple[BuildingOpening, ...]:
+    """
+    `count` auto-placed openings dealt round the four walls, mostly windows with some doors.
+    """
+    kinds = (
+        BuildingOpeningKind.WINDOW,
+        BuildingOpeningKind.WINDOW,
+        BuildingOpeningKind.DOOR,
+        BuildingOpeningKind.WINDOW,
+        BuildingOpeningKind.GARAGE_DOOR,
+    )
+    sides = tuple(BuildingSide)
+    out: List[BuildingOpening] = []
+    for i in range(count):
+        kind = kinds[i % len(kinds)]
+        width_ft, height_ft = _OPENING_SIZES_FT[kind]
+        out.append(BuildingOpening(side=sides[i % len(sides)], kind=kind, width_ft=width_ft, height_ft=height_ft))
+    return tuple(out)
+
+
+def run_encoding_benchmark(*, iterations: int, canvas_px=(900, 520)) -> Dict[str, object]:
+    images = {name: _render_view(name=name, canvas_px=canvas_px, **SAMPLE_BUILDING) for name in VIEW_NAMES}
+    encodings: Dict[str, Dict[str, object]] = {}
+    for enc in VIEW_ENCODINGS.values():
+        samples: List[float] = []
+        size = 0
+        for _ in range(iterations):
+            t0 = time.perf_counter()
+            size = sum(len(_encode_view(img, enc)) for img in images.values())
+            samples.append((time.perf_counter() - t0) * 1000.0)
+        encodings[enc.name] = {"format": enc.format, "bytes_5_views": size, **_summary(samples)}
+    return {"iterations": iterations, "canvas_px": list(canvas_px), "encodings": encodings}
+
+
+def run_recolor_benchmark(*, iterations: int, canvas_px=(900, 520)) -> Dict[str, object]:
+    schemes = [
+        BuildingColorScheme(roof=roof, trim="White", sides="Tan")
+        for roof in ("Burgundy", "Black", "Blue", "Green")
+    ]
+    kwargs = {k: v for k, v in SAMPLE_BUILDING.items() if k != "colors"}
+
+    def _draw_all(colors: BuildingColorScheme) -> None:
+        for name in VIEW_NAMES:
+            _render_view(name=name, colors=colors, canvas_px=canvas_px, **kwargs)
+
+    cold: List[float] = []
+    openings: List[float] = []
+    warm: List[float] = []
+    for i in range(iterations):
+        colors = schemes[i % len(schemes)]
+        _clear_view_caches()
+        t0 = time.perf_counter()
+        _draw_all(colors)
+        cold.append((time.perf_counter() - t0) * 1000.0)
+        _view_geometry.cache_clear()
+        _openings_scene.cache_clear()
+        t0 = time.perf_counter()
+        _draw_all(colors)
+        openings.append((time.perf_counter() - t0) * 1000.0)
+        t0 = time.perf_counter()
+        _draw_all(schemes[(i + 1) % len(schemes)])
+        warm.append((time.perf_counter() - t0) * 1000.0)
+    return {
+        "iterations": iterations,
+        "canvas_px": list(canvas_px),
+        "draw": _summary(cold),
+        "openings_change": _summary(openings),
+        "recolor": _summary(warm),
+    }
+
+
+def run_scaling_benchmark(
+    *,
+    iterations: int,
+    sizes_ft: Sequence[Tuple[int, int, int]] = SCALING_SIZES_FT,
+    canvases_px: Sequence[Tuple[int, int]] = SCALING_CANVASES_PX,
+    opening_counts: Sequence[int] = SCALING_OPENING_COUNTS,
+    encoding: ViewEncoding = FAST_VIEW_ENCODING,
+) -> Dict[str, object]:
+    cases: List[Dict[str, object]] = []
+    for width_ft, length_ft, height_ft in sizes_ft:
+        for canvas_px in canvases_px:
+            for count in opening_counts:
+                w, l, h, openings, _ = _view_request(width_ft, length_ft, height_ft, _sample_openings(count), ())
+                building = dict(
+                    width_ft=w,
+                    length_ft=l,
+                    height_ft=h,
+                    colors=SAMPLE_BUILDING["colors"],
+                    openings=openings,
+                    canvas_px=tuple(canvas_px),
+                )
+                views: Dict[str, Dict[str, object]] = {}
+                for name in VIEW_NAMES:
+                    render: List[float] = []
+                    encode: List[float] = []
+                    size = 0
+                    for _ in range(iterations):
+                        _clear_view_caches()
+                        t0 = time.perf_counter()
+                        img = _render_view(name=name, **building)
+                        t1 = time.perf_counter()
+                        size = len(_encode_view(img, encoding))
+                        t2 = time.perf_counter()
+                        render.append((t1 - t0) * 1000.0)
+                        encode.append((t2 - t1) * 1000.0)
+                    # Memory is measured on a separate cold run so tracing doesn't skew the timings.
+                    _clear_view_caches()
+                    tracemalloc.start()
+                    try:
+                        img = _render_view(name=name, **building)
+                        _encode_view(img, encoding)
+                        peak = tracemalloc.get_traced_memory()[1]
+                    finally:
+                        tracemalloc.stop()
+                    # The "P" view, plus the RGB copy (4 bytes/pixel in PIL) that non-indexed encodings save.
+                    raster = img.width * img.height * (1 if encoding.indexed else 5)
+                    views[name] = {
+                        "render": _summary(render),
+                        "encode": _summary(encode),
+                        "bytes": size,
+                        "peak_kib": round(peak / 1024.0, 1),
+                        "raster_kib": round(raster / 1024.0, 1),
+                    }
+                cases.append(
+                    {"size_ft": [w, l, h], "canvas_px": list(canvas_px), "openings": len(openings), "views": views}
+                )
+    return {"iterations": iterations, "encoding": encoding.name, "cases": cases}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark building view encoding profiles.")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument(
+        "--scaling-iterations", type=int, default=3, help="Cold renders per view in the scaling sweep (0 skips it)."
+    )
+    parser.add_argument("--scaling-encoding", default=FAST_VIEW_ENCODING.name, choices=sorted(VIEW_ENCODINGS))
+    parser.add_argument("--json", default="", help="Optional path to write the JSON results.")
+    args = parser.parse_args()
+
+    iterations = max(1, int(args.iterations))
+    result = {
+        "encoding": run_encoding_benchmark(iterations=iterations),
+        "recolor": run_recolor_benchmark(iterations=iterations),
+    }
+    if args.scaling_iterations > 0:
+        result["scaling"] = run_scaling_benchmark(
+            iterations=int(args.scaling_iterations), encoding=view_encoding(args.scaling_encoding)
+        )
+    for name, stats in result["encoding"]["encodings"].items():
+        print(f"- {name} ({stats['format']}): {stats['bytes_5_views']} bytes, {stats['mean_ms']} ms for 5 views")
+    recolor = result["recolor"]
+    print(
+        f"- redraw: from scratch {recolor['draw']['mean_ms']} ms, openings change {recolor['openings_change']['mean_ms']} ms, "
+        f"color change {recolor['recolor']['mean_ms']} ms for 5 views"
+    )
+    for case in result.get("scaling", {}).get("cases", []):
+        views = case["views"].values()
+        w, l, h = case["size_ft"]
+        cw, ch = case["canvas_px"]
+        print(
+            f"- {w}x{l}x{h} ft, {cw}x{ch} px, {case['openings']} openings: "
+            f"render {round(sum(v['render']['median_ms'] for v in views), 1)} ms, "
+            f"encode {round(sum(v['encode']['median_ms'] for v in views), 1)} ms, "
+            f"{sum(v['bytes'] for v in views)} bytes, peak {max(v['peak_kib'] for v in views)} KiB for 5 views"
+        )
+    if args.json:
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Wrote {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+"""
+Offline throughput benchmark for the extraction pipeline.
+
+Starts `stub_mistral_server.StubServer` on a free local port, writes placeholder PDFs named after
+the recorded books (N copies each), and runs `extract_pricebooks.process_pdf` on them exactly
+as the real CLI would (shared pooled client, OCR + structuring). Reports PDFs/min and chunks/sec.
+
+Usage:
+  python3 scripts/benchmark_extraction_pipeline.py
+  python3 scripts/benchmark_extraction_pipeline.py --copies 5 --ocr-latency-ms 800 --chat-latency-ms 1500 --json out/bench_extraction.json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from extract_pricebooks import (
+    DEFAULT_MAX_TOKENS_PER_CHUNK,
+    Config,
+    make_http_client,
+    make_mistral_client,
+    process_pdf,
+)
+from artifact_store import artifact_exists, read_artifact_json
+from stub_mistral_server import DEFAULT_FIXTURES_DIR, StubBehavior, StubServer
+
+
+def stub_config(base_url: str) -> Config:
+    return Config(
+        mistral_api_key="stub",
+        ocr_endpoint=f"{base_url}/v1/ocr",
+        ocr_model="mistral-ocr-latest",
+        text_model="mistral-small-latest",
+        upload_provider="transfer_sh",
+        supabase_url=None,
+        supabase_anon_key=None,
+        supabase_bucket="mistral-tmp",
+        delete_after_ocr=False,
+        mistral_server_url=base_url,
+        transfer_sh_url=f"{base_url}/upload",
+    )
+
+
+def run_benchmark(
+    *,
+    fixtures_dir: Path,
+    books: List[str],
+    copies: int,
+    behavior: StubBehavior,
+    max_tokens_per_chunk: int,
+    work_dir: Path,
+) -> Dict[str, object]:
+    input_dir = work_dir / "in"
+    out_dir = work_dir / "out"
+    input_dir.mkdir(parents=True, exist_ok=True)
+
+    pdfs: List[Path] = []
+    for book in books:
+        for i in range(copies):
+            pdf = input_dir / f"{book}__copy{i}.pdf"
+            # Placeholder bytes: the stub replays by filename, but uploads still stream real data.
+            pdf.write_bytes(b"%PDF-1.4\n" + (book.encode("utf-8") * 2048))
+            pdfs.append(pdf)
+
+    chunks = 0
+    failures: List[str] = []
+    per_pdf_s: List[float] = []
+    with StubServer(fixtures_dir=fixtures_dir, behavior=behavior) as server:
+        cfg = stub_config(server.base_url)
+        t0 = time.perf_counter()
+        with make_http_client() as http_client:
+            mistral_client = make_mistral_client(
+                api_key=cfg.mistral_api_key, http_client=http_client, server_url=cfg.mistral_server_url
+            )
+            for pdf in pdfs:
+                t_pdf = time.perf_counter()
+                try:
+                    _, structured_path = process_pdf(
+                        pdf_path=pdf,
+                        out_dir=out_dir,
+                        cfg=cfg,
+                        run_structuring=True,
+                        max_tokens_per_chunk=max_tokens_per_chunk,
+                        http_client=http_client,
+                        mistral_client=mistral_client,
+                    )
+                except Exception as exc:
+                    failures.append(f"{pdf.name}: {type(exc).__name__}: {exc}")
+                    continue
+                per_pdf_s.append(time.perf_counter() - t_pdf)
+                structured = read_artifact_json(structured_path)
+                stats = structured.get("chunk_stats") if isinstance(structured, dict) else None
+                if isinstance(stats, dict):
+                    chunks += int(stats.get("chunk_count") or 0)
+        elapsed = time.perf_counter() - t0
+        requests = dict(server.stats.requests)
+        injected = server.stats.injected_errors
+
+    done = len(per_pdf_s)
+    return {
+        "books": books,
+        "copies": copies,
+        "pdfs": len(pdfs),
+        "pdfs_ok": done,
+        "failures": failures,
+        "chunks": chunks,
+        "elapsed_s": round(elapsed, 3),
+        "pdfs_per_min": round(done / elapsed * 60.0, 2) if elapsed > 0 else 0.0,
+        "chunks_per_s": round(chunks / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_pdf_s": round(sum(per_pdf_s) / done, 3) if done else 0.0,
+        "stub_requests": requests,
+        "stub_injected_errors": injected,
+        "behavior": {
+            "upload_latency_ms": behavior.upload_latency_ms,
+            "ocr_latency_ms": behavior.ocr_latency_ms,
+            "chat_latency_ms": behavior.chat_latency_ms,
+            "jitter_ms": behavior.jitter_ms,
+            "error_rate": behavior.error_rate,
+        },
+        "max_tokens_per_chunk": max_tokens_per_chunk,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark extract_pricebooks against the local stub server.")
+    parser.add_argument("--fixtures-dir", default=str(DEFAULT_FIXTURES_DIR))
+    parser.add_argument("--book", action="append", default=[], help="Fixture book to include (repeatable; default: all).")
+    parser.add_argument("--copies", type=int, default=3, help="PDFs per fixture book.")
+    parser.add_argument("--upload-latency-ms", type=float, default=0.0)
+    parser.add_argument("--ocr-latency-ms", type=float, default=0.0)
+    parser.add_argument("--chat-latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-tokens-per-chunk", type=int, default=DEFAULT_MAX_TOKENS_PER_CHUNK)
+    parser.add_argument("--json", default="", help="Optional path to write the JSON results.")
+    args = parser.parse_args()
+
+    fixtures_dir = Path(args.fixtures_dir)
+    available = sorted(p.name for p in fixtures_dir.iterdir() if artifact_exists(p / "ocr_raw.json"))
+    books = [b for b in available if not args.book or b in set(args.book)]
+    if not books:
+        raise SystemExit(f"No fixture books found in {fixtures_dir}")
+
+    behavior = StubBehavior(
+        upload_latency_ms=args.upload_latency_ms,
+        ocr_latency_ms=args.ocr_latency_ms,
+        chat_latency_ms=args.chat_latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory(prefix="bench_extraction_") as tmp:
+        result = run_benchmark(
+            fixtures_dir=fixtures_dir,
+            books=books,
+            copies=max(1, int(args.copies)),
+            behavior=behavior,
+            max_tokens_per_chunk=int(args.max_tokens_per_chunk),
+            work_dir=Path(tmp),
+        )
+
+    print(
+        f"{result['pdfs_ok']}/{result['pdfs']} PDFs, {result['chunks']} chunks in {result['elapsed_s']}s "
+        f"-> {result['pdfs_per_min']} PDFs/min, {result['chunks_per_s']} chunks/sec"
+    )
+    for f in result["failures"]:  # type: ignore[union-attr]
+        print(f"FAILED {f}")
+    if args.json:
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Wrote {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
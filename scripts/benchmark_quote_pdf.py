@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+"""
+Micro-benchmark for quote PDF rendering (`quote_pdf.make_quote_pdf_bytes`).
+
+Builds a representative quote (vendor logo, a dozen line items, the five building views) and
+renders it repeatedly. `cold` clears the quote chrome template cache before every PDF; `warm`
+reuses it like a long-running app. The template only keeps the decoded logo across PDFs (the
+chrome forms are defined again in every document), so the difference is the logo decode.
+`profiles` then reports size and warm time for each output profile (debug, production, and
+production with JPEG re-encoding). `views` compares the export's view step: rendering PNGs
+versus vector drawings, and the production PDF size and time for each.
+
+Usage:
+  python3 scripts/benchmark_quote_pdf.py
+  python3 scripts/benchmark_quote_pdf.py --iterations 50 --json out/bench_quote_pdf.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from building_views import BuildingColorScheme, render_building_views_png, render_building_views_vector
+from quote_pdf import (
+    DEBUG_PDF_PROFILE,
+    PRODUCTION_PDF_PROFILE,
+    QuotePdfArtifact,
+    QuotePdfLineItem,
+    QuotePdfProfile,
+    QuotePdfTotals,
+    clear_quote_chrome_cache,
+    logo_png_bytes_from_svg,
+    make_quote_pdf_bytes,
+)
+
+LOGO_SVG_PATH = _ROOT / "assets" / "coast to coast image.svg"
+
+BENCH_PROFILES: List[QuotePdfProfile] = [
+    DEBUG_PDF_PROFILE,
+    PRODUCTION_PDF_PROFILE,
+    replace(PRODUCTION_PDF_PROFILE, name="production+jpeg", jpeg_quality=85),
+]
+
+
+SAMPLE_VIEWS = dict(
+    width_ft=24,
+    length_ft=36,
+    height_ft=12,
+    colors=BuildingColorScheme(roof="Burgundy", trim="White", sides="Tan"),
+    view_names=("isometric", "front", "back", "left", "right"),
+    canvas_px=(900, 520),
+)
+
+
+def sample_artifact(*, quote_id: str = "BENCH", line_items: int = 12, with_views: bool = True) -> QuotePdfArtifact:
+    views = render_building_views_png(**SAMPLE_VIEWS) if with_views else {}
+    items = tuple(
+        QuotePdfLineItem(description=f"Option {i + 1}: 10' x 10' roll-up door", qty=1, amount_cents=(450 + 25 * i) * 100)
+        for i in range(line_items)
+    )
+    total = sum(li.amount_cents for li in items)
+    down = int(round(total * 0.18))
+    return QuotePdfArtifact(
+        quote_id=quote_id,
+        quote_date=date(2026, 1, 15),
+        pricebook_revision="R29 (NW) demo",
+        customer_name="Benchmark Customer",
+        customer_email="bench@example.com",
+        building_label="Commercial Buildings",
+        building_summary="24 x 36 x 12",
+        line_items=items,
+        totals=QuotePdfTotals(
+            building_amount_cents=total,
+            discount_cents=0,
+            subtotal_cents=total,
+            additional_charges_cents=0,
+            grand_total_cents=total,
+            downpayment_cents=down,
+            balance_due_cents=total - down,
+        ),
+        notes=("Prices valid for 30 days.",),
+        logo_png_bytes=logo_png_bytes_from_svg(LOGO_SVG_PATH) if LOGO_SVG_PATH.exists() else None,
+        building_preview_png_bytes=views.get("isometric"),
+        building_views_png_bytes=views or None,
+    )
+
+
+def _time_ms(fn: Callable[[], object], iterations: int) -> List[float]:
+    out: List[float] = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000.0)
+    return out
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))], 2),
+    }
+
+
+def run_benchmark(*, iterations: int, line_items: int, with_views: bool) -> Dict[str, object]:
+    artifact = sample_artifact(line_items=line_items, with_views=with_views)
+
+    def cold() -> bytes:
+        clear_quote_chrome_cache()
+        return make_quote_pdf_bytes(artifact)
+
+    make_quote_pdf_bytes(artifact)  # warm-up: imports, font metrics
+    cold_ms = _time_ms(cold, iterations)
+    make_quote_pdf_bytes(artifact)
+    warm_ms = _time_ms(lambda: make_quote_pdf_bytes(artifact), iterations)
+    pdf = make_quote_pdf_bytes(artifact)
+    cold_s = _summary(cold_ms)
+    warm_s = _summary(warm_ms)
+
+    profiles: Dict[str, Dict[str, object]] = {}
+    for profile in BENCH_PROFILES:
+        sized = make_quote_pdf_bytes(artifact, profile=profile)
+        samples = _time_ms(lambda: make_quote_pdf_bytes(artifact, profile=profile), iterations)
+        profiles[profile.name] = {"pdf_bytes": len(sized), **_summary(samples)}
+
+    views: Dict[str, Dict[str, object]] = {}
+    if with_views:
+        vector_artifact = replace(
+            artifact,
+            building_preview_png_bytes=None,
+            building_views_png_bytes=None,
+            building_views_vector=render_building_views_vector(**SAMPLE_VIEWS),
+        )
+        for name, render, variant in (
+            ("png", render_building_views_png, artifact),
+            ("vector", render_building_views_vector, vector_artifact),
+        ):
+            sized = make_quote_pdf_bytes(variant, profile=PRODUCTION_PDF_PROFILE)
+            views[name] = {
+                "pdf_bytes": len(sized),
+                "render_views_mean_ms": _summary(_time_ms(lambda: render(**SAMPLE_VIEWS), iterations))["mean_ms"],
+                "pdf_mean_ms": _summary(
+                    _time_ms(lambda: make_quote_pdf_bytes(variant, profile=PRODUCTION_PDF_PROFILE), iterations)
+                )["mean_ms"],
+            }
+    return {
+        "iterations": iterations,
+        "line_items": line_items,
+        "with_views": with_views,
+        "pdf_bytes": len(pdf),
+        "cold": cold_s,
+        "warm": warm_s,
+        "saved_per_pdf_ms": round(cold_s["mean_ms"] - warm_s["mean_ms"], 2),
+        "profiles": profiles,
+        "views": views,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark quote PDF rendering.")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--line-items", type=int, default=12)
+    parser.add_argument("--no-views", action="store_true", help="Render page 1 only (no BUILDING VIEW pages).")
+    parser.add_argument("--json", default="", help="Optional path to write the JSON results.")
+    args = parser.parse_args()
+
+    result = run_benchmark(
+        iterations=max(1, int(args.iterations)), line_items=int(args.line_items), with_views=not args.no_views
+    )
+    print(
+        f"{result['iterations']} PDFs ({result['pdf_bytes']} bytes): "
+        f"cold {result['cold']['mean_ms']} ms, warm {result['warm']['mean_ms']} ms "
+        f"-> {result['saved_per_pdf_ms']} ms saved per PDF by reusing the decoded logo"
+    )
+    for name, stats in result["profiles"].items():
+        print(f"- {name}: {stats['pdf_bytes']} bytes, {stats['mean_ms']} ms/PDF")
+    for name, stats in result["views"].items():
+        print(
+            f"- {name} views: render {stats['render_views_mean_ms']} ms, "
+            f"production PDF {stats['pdf_bytes']} bytes in {stats['pdf_mean_ms']} ms"
+        )
+    if args.json:
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Wrote {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
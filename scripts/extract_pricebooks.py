@@ -4,16 +4,31 @@ import argparse
 import json
 import os
 import re
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import httpx
 from mistralai import Mistral
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+except Exception:  # pragma: no cover - optional dependency
+    h2 = None  # type: ignore[assignment]
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from artifact_store import artifact_exists, read_artifact_json, read_artifact_text, write_artifact_json, write_artifact_text
+from ocr_chunking import chunk_ocr_markdown
+from ocr_quality import DEFAULT_MIN_PAGE_QUALITY, OcrQualityReport, assess_ocr_pages
+from pdf_text_layer import DEFAULT_MIN_TEXT_LAYER_SCORE, merge_text_layer_and_ocr, plan_text_layer_pass
+
 CleanupFn = Callable[[], None]
 
 
@@ -28,6 +43,14 @@ class Config:
     supabase_anon_key: Optional[str]
     supabase_bucket: str
     delete_after_ocr: bool
+    # Overrides for pointing the pipeline at a local stand-in (see scripts/stub_mistral_server.py).
+    mistral_server_url: Optional[str] = None
+    transfer_sh_url: str = "https://transfer.sh"
+    # Local text-layer pre-pass (see pdf_text_layer.py): pages scoring below the threshold go to OCR.
+    use_text_layer: bool = True
+    text_layer_min_score: float = DEFAULT_MIN_TEXT_LAYER_SCORE
+    # OCR pages scoring below this (see ocr_quality.py) are left out of the structuring pass.
+    min_page_quality: float = DEFAULT_MIN_PAGE_QUALITY
 
 
 def _read_json_file(path: Path) -> Dict[str, object]:
@@ -59,6 +82,11 @@ def load_config(config_path: Path) -> Config:
     supabase_anon_key = _as_optional_str(raw.get("supabase_anon_key"))
     supabase_bucket = _as_optional_str(raw.get("supabase_bucket")) or "mistral-tmp"
     delete_after_ocr = bool(raw.get("delete_after_ocr", True))
+    mistral_server_url = _as_optional_str(raw.get("mistral_server_url"))
+    transfer_sh_url = _as_optional_str(raw.get("transfer_sh_url")) or "https://transfer.sh"
+    use_text_layer = bool(raw.get("use_text_layer", True))
+    text_layer_min_score = float(raw.get("text_layer_min_score", DEFAULT_MIN_TEXT_LAYER_SCORE))
+    min_page_quality = float(raw.get("min_page_quality", DEFAULT_MIN_PAGE_QUALITY))
     return Config(
         mistral_api_key=mistral_api_key,
         ocr_endpoint=ocr_endpoint,
@@ -69,6 +97,11 @@ def load_config(config_path: Path) -> Config:
         supabase_anon_key=supabase_anon_key,
         supabase_bucket=supabase_bucket,
         delete_after_ocr=delete_after_ocr,
+        mistral_server_url=mistral_server_url,
+        transfer_sh_url=transfer_sh_url,
+        use_text_layer=use_text_layer,
+        text_layer_min_score=text_layer_min_score,
+        min_page_quality=min_page_quality,
     )
 
 
@@ -101,6 +134,11 @@ def load_config_from_env() -> Config:
     supabase_anon_key = os.environ.get("SUPABASE_ANON_KEY")
     supabase_bucket = os.environ.get("SUPABASE_BUCKET", "mistral-tmp")
     delete_after_ocr = os.environ.get("DELETE_AFTER_OCR", "true").strip().lower() not in {"0", "false", "no"}
+    mistral_server_url = os.environ.get("MISTRAL_SERVER_URL")
+    transfer_sh_url = os.environ.get("TRANSFER_SH_URL", "https://transfer.sh")
+    use_text_layer = os.environ.get("USE_TEXT_LAYER", "true").strip().lower() not in {"0", "false", "no"}
+    text_layer_min_score = float(os.environ.get("TEXT_LAYER_MIN_SCORE", DEFAULT_MIN_TEXT_LAYER_SCORE))
+    min_page_quality = float(os.environ.get("MIN_PAGE_QUALITY", DEFAULT_MIN_PAGE_QUALITY))
 
     return Config(
         mistral_api_key=api_key.strip(),
@@ -112,6 +150,11 @@ def load_config_from_env() -> Config:
         supabase_anon_key=supabase_anon_key.strip() if isinstance(supabase_anon_key, str) and supabase_anon_key.strip() else None,
         supabase_bucket=supabase_bucket.strip(),
         delete_after_ocr=delete_after_ocr,
+        mistral_server_url=mistral_server_url.strip() if isinstance(mistral_server_url, str) and mistral_server_url.strip() else None,
+        transfer_sh_url=transfer_sh_url.strip() or "https://transfer.sh",
+        use_text_layer=use_text_layer,
+        text_layer_min_score=text_layer_min_score,
+        min_page_quality=min_page_quality,
     )
 
 
@@ -126,6 +169,37 @@ def safe_stem(path: Path) -> str:
     return stem or "pdf"
 
 
+# Uploads stream the PDF from disk in blocks of this size instead of reading it into memory.
+_UPLOAD_CHUNK_BYTES = 256 * 1024
+
+
+def make_http_client(*, timeout_s: float = 120.0) -> httpx.Client:
+    """
+    Build the one pooled HTTP client shared by every upload, OCR and structuring call in a run.
+
+    Keep-alive connections are reused across PDFs and chunks, so TLS setup is paid once per
+    host instead of once per request. HTTP/2 is used when the optional `h2` package is installed.
+    """
+    return httpx.Client(
+        timeout=httpx.Timeout(timeout_s, connect=15.0),
+        http2=h2 is not None,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=60.0),
+    )
+
+
+def make_mistral_client(*, api_key: str, http_client: httpx.Client, server_url: Optional[str] = None) -> Mistral:
+    return Mistral(api_key=api_key, client=http_client, server_url=server_url)
+
+
+def _iter_file_chunks(path: Path, *, chunk_size: int = _UPLOAD_CHUNK_BYTES) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                return
+            yield block
+
+
 def _auth_headers(api_key: str) -> Dict[str, str]:
     return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
@@ -161,7 +235,7 @@ def mistral_ocr_pdf(
     api_key: str,
     endpoint: str,
     model: str,
-    pdf_bytes: bytes,
+    pdf_path: Path,
     filename: str,
     upload_provider: str,
     supabase_url: Optional[str],
@@ -169,6 +243,9 @@ def mistral_ocr_pdf(
     supabase_bucket: str,
     delete_after_ocr: bool,
     timeout_s: float = 120.0,
+    client: Optional[httpx.Client] = None,
+    transfer_sh_url: str = "https://transfer.sh",
+    pages: Optional[Sequence[int]] = None,
 ) -> Dict[str, object]:
     """
     Calls Mistral's OCR endpoint with a few payload shapes for compatibility.
@@ -177,54 +254,84 @@ def mistral_ocr_pdf(
     - The official OCR endpoint/schema has evolved; this function retries a few shapes
       and returns the parsed JSON response on success.
     - If all attempts fail, it raises with the last response body included.
+    - Pass the run's shared `client` (see `make_http_client`) to reuse pooled connections;
+      without one, a short-lived client is created for this call.
+    - `pages` (0-based) restricts OCR to those pages; the response keeps their original indexes.
     """
+    if client is None:
+        with make_http_client(timeout_s=timeout_s) as own_client:
+            return mistral_ocr_pdf(
+                api_key=api_key,
+                endpoint=endpoint,
+                model=model,
+                pdf_path=pdf_path,
+                filename=filename,
+                upload_provider=upload_provider,
+                supabase_url=supabase_url,
+                supabase_anon_key=supabase_anon_key,
+                supabase_bucket=supabase_bucket,
+                delete_after_ocr=delete_after_ocr,
+                timeout_s=timeout_s,
+                client=own_client,
+                transfer_sh_url=transfer_sh_url,
+                pages=pages,
+            )
+
     errors: List[str] = []
-    with httpx.Client(timeout=timeout_s) as client:
-        # The current API validation indicates it expects a `document` with type `document_url`.
-        document_url, cleanup = upload_pdf_for_ocr(
-            client=client,
-            pdf_bytes=pdf_bytes,
-            filename=filename,
-            provider=upload_provider,
-            supabase_url=supabase_url,
-            supabase_anon_key=supabase_anon_key,
-            supabase_bucket=supabase_bucket,
-        )
-        try:
-            payload = {"model": model, "document": {"type": "document_url", "document_url": document_url}}
-            resp = client.post(endpoint, headers=_auth_headers(api_key), json=payload)
-            if 200 <= resp.status_code < 300:
-                try:
-                    data = resp.json()
-                except ValueError as e:
-                    raise RuntimeError(f"OCR response was not JSON: {resp.text[:2000]}") from e
-                if not isinstance(data, dict):
-                    raise RuntimeError("OCR response JSON was not an object")
-                return data
-            errors.append(f"HTTP {resp.status_code}: {resp.text[:4000]}")
-            raise RuntimeError(f"OCR failed for {filename}. Errors: {errors}")
-        finally:
-            if delete_after_ocr:
-                try:
-                    cleanup()
-                except Exception:
-                    # Best-effort cleanup only; don't hide OCR errors.
-                    pass
+    # The current API validation indicates it expects a `document` with type `document_url`.
+    document_url, cleanup = upload_pdf_for_ocr(
+        client=client,
+        pdf_path=pdf_path,
+        filename=filename,
+        provider=upload_provider,
+        supabase_url=supabase_url,
+        supabase_anon_key=supabase_anon_key,
+        supabase_bucket=supabase_bucket,
+        transfer_sh_url=transfer_sh_url,
+    )
+    try:
+        payload: Dict[str, object] = {
+            "model": model,
+            "document": {"type": "document_url", "document_url": document_url},
+        }
+        if pages is not None:
+            payload["pages"] = [int(i) for i in pages]
+        resp = client.post(endpoint, headers=_auth_headers(api_key), json=payload)
+        if 200 <= resp.status_code < 300:
+            try:
+                data = resp.json()
+            except ValueError as e:
+                raise RuntimeError(f"OCR response was not JSON: {resp.text[:2000]}") from e
+            if not isinstance(data, dict):
+                raise RuntimeError("OCR response JSON was not an object")
+            return data
+        errors.append(f"HTTP {resp.status_code}: {resp.text[:4000]}")
+        raise RuntimeError(f"OCR failed for {filename}. Errors: {errors}")
+    finally:
+        if delete_after_ocr:
+            try:
+                cleanup()
+            except Exception:
+                # Best-effort cleanup only; don't hide OCR errors.
+                pass
 
 
 def upload_pdf_for_ocr(
     *,
     client: httpx.Client,
-    pdf_bytes: bytes,
+    pdf_path: Path,
     filename: str,
     provider: str,
     supabase_url: Optional[str],
     supabase_anon_key: Optional[str],
     supabase_bucket: str,
+    transfer_sh_url: str = "https://transfer.sh",
 ) -> Tuple[str, CleanupFn]:
     """
     Mistral OCR expects a publicly accessible `document_url`.
     For this demo pipeline, we can temporarily upload the PDF and pass the returned URL.
+
+    The PDF is streamed from `pdf_path` in blocks; it is never read into memory whole.
     """
     provider = provider.strip()
     if provider == "auto":
@@ -233,12 +340,13 @@ def upload_pdf_for_ocr(
             try:
                 return upload_pdf_for_ocr(
                     client=client,
-                    pdf_bytes=pdf_bytes,
+                    pdf_path=pdf_path,
                     filename=filename,
                     provider=candidate,
                     supabase_url=supabase_url,
                     supabase_anon_key=supabase_anon_key,
                     supabase_bucket=supabase_bucket,
+                    transfer_sh_url=transfer_sh_url,
                 )
             except Exception as e:
                 errors.append(f"{candidate}: {type(e).__name__}: {e}")
@@ -257,9 +365,10 @@ def upload_pdf_for_ocr(
             "Authorization": f"Bearer {supabase_anon_key}",
             "apikey": supabase_anon_key,
             "Content-Type": "application/pdf",
+            "Content-Length": str(pdf_path.stat().st_size),
             "x-upsert": "true",
         }
-        resp = client.post(put_url, headers=headers, content=pdf_bytes)
+        resp = client.post(put_url, headers=headers, content=_iter_file_chunks(pdf_path))
         if not (200 <= resp.status_code < 300):
             raise RuntimeError(f"Supabase upload failed: HTTP {resp.status_code} {resp.text[:2000]}")
 
@@ -311,10 +420,11 @@ def upload_pdf_for_ocr(
         return document_url, _cleanup
 
     if provider == "tmpfiles_org":
-        resp = client.post(
-            "https://tmpfiles.org/api/v1/upload",
-            files={"file": (filename, pdf_bytes, "application/pdf")},
-        )
+        with pdf_path.open("rb") as fh:
+            resp = client.post(
+                "https://tmpfiles.org/api/v1/upload",
+                files={"file": (filename, fh, "application/pdf")},
+            )
         if 200 <= resp.status_code < 300:
             try:
                 data = resp.json()
@@ -334,11 +444,11 @@ def upload_pdf_for_ocr(
 
     if provider == "transfer_sh":
         # transfer.sh supports simple PUT uploads and returns the public URL in the response body.
-        upload_url = f"https://transfer.sh/{filename}"
+        upload_url = f"{transfer_sh_url.rstrip('/')}/{filename}"
         resp = client.put(
             upload_url,
-            content=pdf_bytes,
-            headers={"Content-Type": "application/pdf"},
+            content=_iter_file_chunks(pdf_path),
+            headers={"Content-Type": "application/pdf", "Content-Length": str(pdf_path.stat().st_size)},
         )
         if 200 <= resp.status_code < 300:
             url = resp.text.strip()
@@ -404,26 +514,9 @@ def extract_text_from_ocr_payload(ocr_payload: Dict[str, object]) -> str:
     return json.dumps(ocr_payload, indent=2, ensure_ascii=False)
 
 
-def chunk_text(text: str, *, max_chars: int) -> List[str]:
-    if max_chars <= 0:
-        raise ValueError("max_chars must be > 0")
-    text = text.strip()
-    if not text:
-        return []
-
-    chunks: List[str] = []
-    i = 0
-    while i < len(text):
-        j = min(len(text), i + max_chars)
-        # Try to split on a boundary.
-        boundary = text.rfind("\n\n", i, j)
-        if boundary == -1 or boundary <= i + int(max_chars * 0.6):
-            boundary = j
-        chunk = text[i:boundary].strip()
-        if chunk:
-            chunks.append(chunk)
-        i = boundary
-    return chunks
+# Budget per structuring call, in `ocr_chunking.estimate_tokens` units. The model echoes
+# tables back as JSON, so the prompt budget also bounds the response size.
+DEFAULT_MAX_TOKENS_PER_CHUNK = 8000
 
 
 def mistral_extract_pricebook_json(
@@ -432,10 +525,12 @@ def mistral_extract_pricebook_json(
     model: str,
     full_text: str,
     source_name: str,
-    max_chars_per_chunk: int = 18000,
+    max_tokens_per_chunk: int = DEFAULT_MAX_TOKENS_PER_CHUNK,
+    client: Optional[Mistral] = None,
 ) -> Dict[str, object]:
-    client = Mistral(api_key=api_key)
-    chunks = chunk_text(full_text, max_chars=max_chars_per_chunk)
+    if client is None:
+        client = Mistral(api_key=api_key)
+    chunks, stats = chunk_ocr_markdown(full_text, max_tokens=max_tokens_per_chunk)
     if not chunks:
         return {"source": source_name, "error": "empty_ocr_text"}
 
@@ -445,7 +540,13 @@ def mistral_extract_pricebook_json(
         "tables": [],
         "notes": [],
         "unparsed_chunks": [],
+        "chunk_stats": stats.as_dict(),
     }
+    tqdm.write(
+        f"{source_name}: {stats.chunk_count} chunks, ~{stats.total_tokens_est} tokens "
+        f"(max {stats.max_tokens_est}/{stats.max_tokens_budget}), {stats.table_count} tables, "
+        f"{stats.tables_split} split by rows"
+    )
 
     # Visible progress so long structuring runs don't look "stuck".
     for idx, chunk in enumerate(tqdm(chunks, desc=f"Structuring ({source_name})", unit="chunk"), start=1):
@@ -513,55 +614,162 @@ def _merge_extraction(target: Dict[str, object], addition: Dict[str, object]) ->
 
 
 def write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+    # Artifacts go through the compressed, deduplicating store (see artifact_store.py).
+    write_artifact_text(path, text)
 
 
 def write_json(path: Path, data: Dict[str, object]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_artifact_json(path, data)
 
 
-def process_pdf(
+def ocr_stage(
     *,
     pdf_path: Path,
-    out_dir: Path,
+    base_out: Path,
     cfg: Config,
-    run_structuring: bool,
+    http_client: Optional[httpx.Client] = None,
 ) -> Tuple[Path, Path]:
-    pdf_bytes = pdf_path.read_bytes()
-    name = pdf_path.name
-    stem = safe_stem(pdf_path)
-    base_out = out_dir / stem
-
-    ocr_payload = mistral_ocr_pdf(
-        api_key=cfg.mistral_api_key,
-        endpoint=cfg.ocr_endpoint,
-        model=cfg.ocr_model,
-        pdf_bytes=pdf_bytes,
-        filename=name,
-        upload_provider=cfg.upload_provider,
-        supabase_url=cfg.supabase_url,
-        supabase_anon_key=cfg.supabase_anon_key,
-        supabase_bucket=cfg.supabase_bucket,
-        delete_after_ocr=cfg.delete_after_ocr,
-    )
+    """
+    OCR one PDF into `base_out/ocr_raw.json` and `base_out/ocr_text.md`.
+
+    With `cfg.use_text_layer`, pages whose embedded text layer scores well are taken from it
+    directly and only the rest are sent to OCR (none at all for a clean digital book).
+    The merged payload keeps the OCR `pages` shape, so `ocr_text.md` looks the same either way.
+    """
+    plan = plan_text_layer_pass(pdf_path, min_score=cfg.text_layer_min_score) if cfg.use_text_layer else None
+    text_pages = plan.text_layer_indices if plan is not None else []
+    ocr_pages = plan.ocr_indices if plan is not None and text_pages else None
+
+    ocr_payload: Dict[str, object] = {}
+    if ocr_pages is None or ocr_pages:
+        ocr_payload = mistral_ocr_pdf(
+            api_key=cfg.mistral_api_key,
+            endpoint=cfg.ocr_endpoint,
+            model=cfg.ocr_model,
+            pdf_path=pdf_path,
+            filename=pdf_path.name,
+            upload_provider=cfg.upload_provider,
+            supabase_url=cfg.supabase_url,
+            supabase_anon_key=cfg.supabase_anon_key,
+            supabase_bucket=cfg.supabase_bucket,
+            delete_after_ocr=cfg.delete_after_ocr,
+            client=http_client,
+            transfer_sh_url=cfg.transfer_sh_url,
+            # None = whole document, i.e. the same request as without the pre-pass.
+            pages=ocr_pages,
+        )
+    if plan is not None and text_pages:
+        tqdm.write(
+            f"{pdf_path.name}: text layer used for {len(text_pages)}/{plan.page_count} pages, "
+            f"OCR for {len(plan.ocr_indices)}"
+        )
+        ocr_payload = merge_text_layer_and_ocr(plan, ocr_payload or None)
 
     ocr_text = extract_text_from_ocr_payload(ocr_payload)
+    # Recorded for inspection; structure_stage re-scores the same pages against its own threshold.
+    quality = assess_ocr_pages(ocr_payload, min_score=cfg.min_page_quality)
+    ocr_payload["ocr_quality"] = quality.as_dict()
+    if quality.skipped_indices:
+        tqdm.write(
+            f"{pdf_path.name}: {len(quality.skipped_indices)}/{len(quality.pages)} pages below OCR quality "
+            f"{cfg.min_page_quality} will be skipped by structuring: {quality.skipped_indices}"
+        )
     ocr_raw_path = base_out / "ocr_raw.json"
     ocr_text_path = base_out / "ocr_text.md"
     write_json(ocr_raw_path, ocr_payload)
     write_text(ocr_text_path, ocr_text)
+    return (ocr_raw_path, ocr_text_path)
 
-    structured_path = base_out / "pricebook_extracted.json"
-    if run_structuring:
+
+def structuring_text(base_out: Path, *, min_page_quality: float) -> Tuple[str, Optional[OcrQualityReport]]:
+    """
+    The OCR text worth structuring, plus the page scores it was filtered by.
+
+    Falls back to the whole `ocr_text.md` (and no report) when `ocr_raw.json` is missing.
+    """
+    raw_path = base_out / "ocr_raw.json"
+    if not artifact_exists(raw_path):
+        return (read_artifact_text(base_out / "ocr_text.md"), None)
+    payload = read_artifact_json(raw_path)
+    if not isinstance(payload, dict):
+        return (read_artifact_text(base_out / "ocr_text.md"), None)
+
+    quality = assess_ocr_pages(payload, min_score=min_page_quality)
+    usable = set(quality.usable_indices)
+    pages = payload.get("pages")
+    if isinstance(pages, list):
+        kept = [
+            page
+            for pos, page in enumerate(pages)
+            if isinstance(page, dict) and (page.get("index") if isinstance(page.get("index"), int) else pos) in usable
+        ]
+        return (extract_text_from_ocr_payload({"pages": kept}) if kept else "", quality)
+    return (extract_text_from_ocr_payload(payload) if usable else "", quality)
+
+
+def structure_stage(
+    *,
+    base_out: Path,
+    source_name: str,
+    cfg: Config,
+    max_tokens_per_chunk: int = DEFAULT_MAX_TOKENS_PER_CHUNK,
+    mistral_client: Optional[Mistral] = None,
+) -> Path:
+    """
+    Structure the OCR output in `base_out` into `base_out/pricebook_extracted.json`.
+
+    Only pages that passed the OCR quality gate are sent to the model. When none did, no
+    LLM call is made and the output carries `error: "low_quality_ocr"` with the page scores.
+    """
+    ocr_text, quality = structuring_text(base_out, min_page_quality=cfg.min_page_quality)
+    if quality is not None and not quality.usable_indices:
+        tqdm.write(f"{source_name}: no page passed the OCR quality gate; skipping structuring")
+        structured: Dict[str, object] = {
+            "source": source_name,
+            "error": "low_quality_ocr",
+            "rules": [],
+            "tables": [],
+            "notes": [],
+            "unparsed_chunks": [],
+        }
+    else:
         structured = mistral_extract_pricebook_json(
             api_key=cfg.mistral_api_key,
             model=cfg.text_model,
             full_text=ocr_text,
-            source_name=name,
+            source_name=source_name,
+            max_tokens_per_chunk=max_tokens_per_chunk,
+            client=mistral_client,
+        )
+    if quality is not None:
+        structured["ocr_quality"] = quality.as_dict()
+    structured_path = base_out / "pricebook_extracted.json"
+    write_json(structured_path, structured)
+    return structured_path
+
+
+def process_pdf(
+    *,
+    pdf_path: Path,
+    out_dir: Path,
+    cfg: Config,
+    run_structuring: bool,
+    max_tokens_per_chunk: int = DEFAULT_MAX_TOKENS_PER_CHUNK,
+    http_client: Optional[httpx.Client] = None,
+    mistral_client: Optional[Mistral] = None,
+) -> Tuple[Path, Path]:
+    base_out = out_dir / safe_stem(pdf_path)
+    ocr_raw_path, _ = ocr_stage(pdf_path=pdf_path, base_out=base_out, cfg=cfg, http_client=http_client)
+
+    structured_path = base_out / "pricebook_extracted.json"
+    if run_structuring:
+        structure_stage(
+            base_out=base_out,
+            source_name=pdf_path.name,
+            cfg=cfg,
+            max_tokens_per_chunk=max_tokens_per_chunk,
+            mistral_client=mistral_client,
         )
-        write_json(structured_path, structured)
 
     return (ocr_raw_path, structured_path)
 
@@ -586,6 +794,12 @@ def main() -> int:
         action="store_true",
         help="Only run OCR and save raw text; skip the structuring pass.",
     )
+    parser.add_argument(
+        "--max-tokens-per-chunk",
+        type=int,
+        default=DEFAULT_MAX_TOKENS_PER_CHUNK,
+        help="Estimated token budget per structuring call (tables are never split mid-row).",
+    )
     args = parser.parse_args()
 
     # In some execution contexts (e.g. `python -c` / stdin), python-dotenv's auto
@@ -604,13 +818,21 @@ def main() -> int:
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    for pdf in tqdm(pdfs, desc="PDFs"):
-        process_pdf(
-            pdf_path=pdf,
-            out_dir=out_dir,
-            cfg=cfg,
-            run_structuring=not bool(args.no_structure),
+    # One pooled client for the whole run: connection setup is amortized across PDFs and chunks.
+    with make_http_client() as http_client:
+        mistral_client = make_mistral_client(
+            api_key=cfg.mistral_api_key, http_client=http_client, server_url=cfg.mistral_server_url
         )
+        for pdf in tqdm(pdfs, desc="PDFs"):
+            process_pdf(
+                pdf_path=pdf,
+                out_dir=out_dir,
+                cfg=cfg,
+                run_structuring=not bool(args.no_structure),
+                max_tokens_per_chunk=int(args.max_tokens_per_chunk),
+                http_client=http_client,
+                mistral_client=mistral_client,
+            )
 
     return 0
 
@@ -11,6 +11,7 @@ _ROOT = Path(__file__).resolve().parents[1]
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
+from artifact_store import artifact_exists, read_artifact_text, write_artifact_text
 from extracted_pricebooks import find_extracted_pricebooks, load_extracted_pricebook
 from pricebook_from_extracted import (
     parse_base_matrix_table,
@@ -38,8 +39,8 @@ def normalize_one(out_dir: Path, extracted_path: Path) -> Path:
     ocr_text_path = pb_dir / "ocr_text.md"
 
     status: Dict[str, Any] = {"source": extracted.source, "path": str(extracted_path)}
-    if ocr_text_path.exists():
-        ocr_text = ocr_text_path.read_text(encoding="utf-8", errors="replace")
+    if artifact_exists(ocr_text_path):
+        ocr_text = read_artifact_text(ocr_text_path, errors="replace")
         if is_effectively_empty_ocr_text(ocr_text):
             normalized = {
                 "source": extracted.source,
@@ -55,7 +56,7 @@ def normalize_one(out_dir: Path, extracted_path: Path) -> Path:
                 "vertical_end_add_by_width": {},
             }
             out_path = pb_dir / "normalized_pricebook.json"
-            out_path.write_text(json.dumps(normalized, indent=2), encoding="utf-8")
+            write_artifact_text(out_path, json.dumps(normalized, indent=2))
             return out_path
 
     base_matrices: List[Dict[str, Any]] = []
@@ -137,7 +138,7 @@ def normalize_one(out_dir: Path, extracted_path: Path) -> Path:
     }
 
     out_path = extracted_path.parent / "normalized_pricebook.json"
-    out_path.write_text(json.dumps(normalized, indent=2), encoding="utf-8")
+    write_artifact_text(out_path, json.dumps(normalized, indent=2))
     return out_path
 
 
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+"""
+Maintain the compressed artifact store under a price-book output directory (see artifact_store.py).
+
+Commands:
+- pack    move plain per-book artifacts (ocr_raw.json, ocr_text.md, ...) into the store
+- unpack  write stored artifacts back out as plain files, e.g. to inspect or diff them
+- gc      delete blobs that no book (current or earlier revision) points at
+- stats   logical vs stored bytes
+
+Usage:
+  python3 scripts/pricebook_artifacts.py pack --out-dir pricebooks/out
+  python3 scripts/pricebook_artifacts.py stats --out-dir pricebooks/out
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from artifact_store import (
+    BLOB_DIRNAME,
+    POINTER_FILENAME,
+    artifact_ref,
+    collect_garbage,
+    pack_book,
+    unpack_book,
+)
+
+ARTIFACT_NAMES = ["ocr_raw.json", "ocr_text.md", "pricebook_extracted.json", "normalized_pricebook.json"]
+
+
+def _book_dirs(out_dir: Path) -> List[Path]:
+    return sorted(p for p in out_dir.iterdir() if p.is_dir() and p.name != BLOB_DIRNAME)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pack, unpack and garbage-collect price-book artifacts.")
+    parser.add_argument("command", choices=["pack", "unpack", "gc", "stats"])
+    parser.add_argument("--out-dir", required=True, help="Extractor output directory (contains one dir per book).")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out_dir)
+    if not out_dir.is_dir():
+        raise SystemExit(f"Not a directory: {out_dir}")
+
+    if args.command == "pack":
+        for book in _book_dirs(out_dir):
+            packed = pack_book(book, ARTIFACT_NAMES)
+            if packed:
+                print(f"- {book.name}: packed {', '.join(p.name for p in packed)}")
+    elif args.command == "unpack":
+        for book in _book_dirs(out_dir):
+            if (book / POINTER_FILENAME).exists():
+                written = unpack_book(book)
+                print(f"- {book.name}: {len(written)} files")
+    elif args.command == "gc":
+        deleted = collect_garbage(out_dir)
+        print(f"Deleted {len(deleted)} unreferenced blobs")
+    else:
+        logical = 0
+        stored = 0
+        for book in _book_dirs(out_dir):
+            for name in ARTIFACT_NAMES:
+                path = book / name
+                ref = artifact_ref(path)
+                if ref is not None:
+                    logical += ref.size
+                    stored += ref.stored_size
+                elif path.is_file():
+                    size = path.stat().st_size
+                    logical += size
+                    stored += size
+        blobs = out_dir / BLOB_DIRNAME
+        on_disk = sum(b.stat().st_size for b in blobs.glob("*/*.z")) if blobs.is_dir() else 0
+        print(f"logical {logical} bytes, referenced {stored} bytes, blob dir {on_disk} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
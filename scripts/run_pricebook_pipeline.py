@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+"""
+Run the price-book pipeline end to end: OCR -> structure -> normalize.
+
+Each book directory (`<output-dir>/<pdf_stem>/`) gets a `pipeline_manifest.json` that records,
+per stage, the hashes of its inputs, the tool version, the hashes of its outputs and how long
+it took. On the next run a stage only re-runs when one of those changed, so:
+- editing nothing re-runs nothing,
+- re-OCRing a PDF re-runs structuring and normalization only if the OCR text changed,
+- a crash mid-batch resumes from the first unfinished stage of the first unfinished book.
+
+Usage:
+  python3 scripts/run_pricebook_pipeline.py --input-dir . --output-dir pricebooks/out
+  python3 scripts/run_pricebook_pipeline.py --input-dir . --output-dir pricebooks/out --force normalize
+"""
+
+import argparse
+import sys
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+from dotenv import load_dotenv
+from mistralai import Mistral
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from extract_pricebooks import (
+    DEFAULT_MAX_TOKENS_PER_CHUNK,
+    Config,
+    find_pdfs,
+    load_config,
+    load_config_from_env,
+    make_http_client,
+    make_mistral_client,
+    ocr_stage,
+    safe_stem,
+    structure_stage,
+)
+from artifact_store import artifact_exists
+from normalize_pricebooks import normalize_one
+from pdf_text_layer import text_layer_available
+from pipeline_manifest import (
+    PipelineManifest,
+    StageRecord,
+    file_sha256,
+    inputs_fingerprint,
+    load_manifest,
+    utc_now_iso,
+)
+
+STAGES = ("ocr", "structure", "normalize")
+
+# Bump a stage's version when its output format or logic changes in a way that should
+# invalidate previously generated artifacts.
+STAGE_VERSIONS: Dict[str, str] = {
+    "ocr": "ocr-1",
+    "structure": "structure-1",
+    "normalize": "normalize-1",
+}
+
+
+@dataclass(frozen=True)
+class StageOutcome:
+    book: str
+    stage: str
+    status: str  # "ran" | "skipped" | "failed" | "blocked"
+    duration_s: float
+    error: Optional[str] = None
+
+
+def _hash_if_exists(path: Path) -> str:
+    return file_sha256(path) if artifact_exists(path) else "missing"
+
+
+def stage_inputs(
+    stage: str,
+    *,
+    pdf_path: Path,
+    book_dir: Path,
+    cfg: Config,
+    max_tokens_per_chunk: int,
+) -> Dict[str, str]:
+    """
+    The named inputs a stage depends on. Downstream stages hash upstream outputs, which is
+    what makes the stages a DAG: an unchanged upstream output keeps downstream stages clean.
+    """
+    if stage == "ocr":
+        return {
+            "pdf_sha256": file_sha256(pdf_path),
+            "ocr_endpoint": cfg.ocr_endpoint,
+            "ocr_model": cfg.ocr_model,
+            "text_layer": f"{text_layer_available() and cfg.use_text_layer}:{cfg.text_layer_min_score}",
+        }
+    if stage == "structure":
+        return {
+            "ocr_raw_sha256": _hash_if_exists(book_dir / "ocr_raw.json"),
+            "min_page_quality": str(cfg.min_page_quality),
+            "text_model": cfg.text_model,
+            "max_tokens_per_chunk": str(int(max_tokens_per_chunk)),
+        }
+    if stage == "normalize":
+        return {
+            "pricebook_extracted_sha256": _hash_if_exists(book_dir / "pricebook_extracted.json"),
+            "ocr_text_sha256": _hash_if_exists(book_dir / "ocr_text.md"),
+        }
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def _run_stage(
+    stage: str,
+    *,
+    pdf_path: Path,
+    book_dir: Path,
+    out_dir: Path,
+    cfg: Config,
+    max_tokens_per_chunk: int,
+    http_client: httpx.Client,
+    mistral_client: Mistral,
+) -> List[Path]:
+    if stage == "ocr":
+        return list(ocr_stage(pdf_path=pdf_path, base_out=book_dir, cfg=cfg, http_client=http_client))
+    if stage == "structure":
+        return [
+            structure_stage(
+                base_out=book_dir,
+                source_name=pdf_path.name,
+                cfg=cfg,
+                max_tokens_per_chunk=max_tokens_per_chunk,
+                mistral_client=mistral_client,
+            )
+        ]
+    if stage == "normalize":
+        return [normalize_one(out_dir, book_dir / "pricebook_extracted.json")]
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def run_book(
+    *,
+    pdf_path: Path,
+    out_dir: Path,
+    cfg: Config,
+    max_tokens_per_chunk: int,
+    http_client: httpx.Client,
+    mistral_client: Mistral,
+    force: Sequence[str] = (),
+) -> List[StageOutcome]:
+    """
+    Bring one book up to date, running only dirty stages and persisting the manifest after each.
+    """
+    book_dir = out_dir / safe_stem(pdf_path)
+    manifest: PipelineManifest = load_manifest(book_dir, source=pdf_path.name)
+    outcomes: List[StageOutcome] = []
+    failed = False
+
+    for stage in STAGES:
+        if failed:
+            outcomes.append(StageOutcome(book=pdf_path.name, stage=stage, status="blocked", duration_s=0.0))
+            continue
+
+        version = STAGE_VERSIONS[stage]
+        inputs = stage_inputs(
+            stage, pdf_path=pdf_path, book_dir=book_dir, cfg=cfg, max_tokens_per_chunk=max_tokens_per_chunk
+        )
+        input_hash = inputs_fingerprint(inputs, tool_version=version)
+        if stage not in force and manifest.is_current(stage, input_hash=input_hash):
+            outcomes.append(StageOutcome(book=pdf_path.name, stage=stage, status="skipped", duration_s=0.0))
+            continue
+
+        # Drop the stale record first: if we crash mid-stage, the next run must not trust old outputs.
+        manifest.invalidate(stage)
+        started_at = utc_now_iso()
+        t0 = time.perf_counter()
+        try:
+            outputs = _run_stage(
+                stage,
+                pdf_path=pdf_path,
+                book_dir=book_dir,
+                out_dir=out_dir,
+                cfg=cfg,
+                max_tokens_per_chunk=max_tokens_per_chunk,
+                http_client=http_client,
+                mistral_client=mistral_client,
+            )
+        except Exception as exc:
+            duration = time.perf_counter() - t0
+            traceback.print_exc()
+            outcomes.append(
+                StageOutcome(
+                    book=pdf_path.name,
+                    stage=stage,
+                    status="failed",
+                    duration_s=duration,
+                    error=f"{type(exc).__name__}: {exc}",
+                )
+            )
+            failed = True
+            continue
+
+        duration = time.perf_counter() - t0
+        manifest.record(
+            StageRecord(
+                name=stage,
+                input_hash=input_hash,
+                inputs=inputs,
+                tool_version=version,
+                outputs={p.relative_to(book_dir).as_posix(): file_sha256(p) for p in outputs},
+                started_at=started_at,
+                duration_s=duration,
+            )
+        )
+        outcomes.append(StageOutcome(book=pdf_path.name, stage=stage, status="ran", duration_s=duration))
+
+    return outcomes
+
+
+def format_report(outcomes: Sequence[StageOutcome]) -> str:
+    """
+    Per-book stage timings plus per-stage totals ("new PDF to quotable book" latency).
+    """
+    lines: List[str] = []
+    books: Dict[str, List[StageOutcome]] = {}
+    for o in outcomes:
+        books.setdefault(o.book, []).append(o)
+
+    for book, rows in books.items():
+        parts = []
+        for o in rows:
+            if o.status == "ran":
+                parts.append(f"{o.stage} {o.duration_s:.2f}s")
+            else:
+                parts.append(f"{o.stage} {o.status}")
+        total = sum(o.duration_s for o in rows if o.status == "ran")
+        lines.append(f"- {book}: " + ", ".join(parts) + f" | total {total:.2f}s")
+
+    lines.append("")
+    lines.append(f"{'stage':<10} {'ran':>4} {'skipped':>8} {'failed':>7} {'total_s':>9} {'mean_s':>8}")
+    for stage in STAGES:
+        ran = [o for o in outcomes if o.stage == stage and o.status == "ran"]
+        skipped = sum(1 for o in outcomes if o.stage == stage and o.status == "skipped")
+        failed = sum(1 for o in outcomes if o.stage == stage and o.status == "failed")
+        total = sum(o.duration_s for o in ran)
+        mean = total / len(ran) if ran else 0.0
+        lines.append(f"{stage:<10} {len(ran):>4} {skipped:>8} {failed:>7} {total:>9.2f} {mean:>8.2f}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run OCR -> structure -> normalize, re-running only dirty stages.")
+    parser.add_argument("--config", required=False, help="Path to config JSON (copy and edit config.example.json).")
+    parser.add_argument("--input-dir", required=True, help="Directory containing PDFs.")
+    parser.add_argument("--output-dir", required=True, help="Output directory for per-book artifacts.")
+    parser.add_argument(
+        "--pdf",
+        action="append",
+        default=[],
+        help="Optional: process only a specific PDF filename (repeatable).",
+    )
+    parser.add_argument(
+        "--force",
+        action="append",
+        default=[],
+        choices=list(STAGES),
+        help="Re-run a stage even if its manifest says it is up to date (repeatable).",
+    )
+    parser.add_argument("--max-tokens-per-chunk", type=int, default=DEFAULT_MAX_TOKENS_PER_CHUNK)
+    args = parser.parse_args()
+
+    load_dotenv(dotenv_path=Path.cwd() / ".env")
+    cfg = load_config(Path(args.config)) if isinstance(args.config, str) and args.config.strip() else load_config_from_env()
+    input_dir = Path(args.input_dir)
+    out_dir = Path(args.output_dir)
+
+    pdfs = find_pdfs(input_dir)
+    if args.pdf:
+        wanted = {p.strip() for p in args.pdf if isinstance(p, str) and p.strip()}
+        pdfs = [p for p in pdfs if p.name in wanted]
+    if not pdfs:
+        raise SystemExit(f"No PDFs found in {input_dir}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    outcomes: List[StageOutcome] = []
+    with make_http_client() as http_client:
+        mistral_client = make_mistral_client(
+            api_key=cfg.mistral_api_key, http_client=http_client, server_url=cfg.mistral_server_url
+        )
+        for pdf in pdfs:
+            outcomes.extend(
+                run_book(
+                    pdf_path=pdf,
+                    out_dir=out_dir,
+                    cfg=cfg,
+                    max_tokens_per_chunk=int(args.max_tokens_per_chunk),
+                    http_client=http_client,
+                    mistral_client=mistral_client,
+                    force=tuple(args.force),
+                )
+            )
+
+    print(format_report(outcomes))
+    for o in outcomes:
+        if o.status == "failed":
+            print(f"FAILED {o.book} [{o.stage}]: {o.error}")
+    return 1 if any(o.status == "failed" for o in outcomes) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -16,8 +16,8 @@ from building_views import (
     BuildingOpening,
     BuildingOpeningKind,
     BuildingSide,
-    render_building_views_png,
 )
+from building_views_cache import building_view_cache_from_env, render_building_views_cached
 from normalized_pricebooks import (
     build_pricebook_from_normalized,
     find_normalized_pricebooks,
@@ -32,7 +32,7 @@ from pricing_engine import (
     SelectedOption,
     generate_quote,
 )
-from quote_pdf import QuotePdfArtifact, QuotePdfLineItem, QuotePdfTotals, make_quote_pdf_bytes
+from quote_pdf import QuotePdfArtifact, QuotePdfLineItem, QuotePdfTotals, write_quote_pdf
 
 
 @dataclass(frozen=True)
@@ -163,8 +163,9 @@ def main() -> None:
         BuildingOpening(side=BuildingSide.RIGHT, kind=BuildingOpeningKind.DOOR, width_ft=3, height_ft=7, offset_ft=52),
     )
 
-    # Render all view images (same renderer used by Streamlit + PDF export).
-    views = render_building_views_png(
+    # Render all view images (same renderer used by Streamlit + PDF export), via the shared view cache.
+    views = render_building_views_cached(
+        building_view_cache_from_env(),
         width_ft=fixture.width_ft,
         length_ft=fixture.length_ft,
         height_ft=fixture.height_ft,
@@ -212,11 +213,10 @@ def main() -> None:
         building_preview_png_bytes=preview_png,
         building_views_png_bytes=views,
     )
-    pdf_bytes = make_quote_pdf_bytes(artifact)
-
     out_dir = _repo_root() / "out" / "vendor_sim"
     out_dir.mkdir(parents=True, exist_ok=True)
-    (out_dir / "demo_quote_sim.pdf").write_bytes(pdf_bytes)
+    with (out_dir / "demo_quote_sim.pdf").open("wb") as f:
+        write_quote_pdf(artifact, f)
     (out_dir / "demo_quote_sim_preview.png").write_bytes(preview_png)
     for k, png in views.items():
         (out_dir / f"demo_quote_sim_view_{k}.png").write_bytes(png)
@@ -30,6 +30,7 @@ if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
 import local_demo_app
+from artifact_store import artifact_exists
 from building_views import (
     BuildingColorScheme,
     BuildingOpening,
@@ -53,7 +54,7 @@ def _find_r29_normalized_path() -> Path:
         root / "pricebooks" / "out" / "Coast_To_Coast_Carports___Price_Book___R29_1" / "normalized_pricebook.json",
     ]
     for p in candidates:
-        if p.exists():
+        if artifact_exists(p):
             return p
     raise FileNotFoundError("Could not find R29 normalized pricebook. Looked in: " + ", ".join(str(p) for p in candidates))
 
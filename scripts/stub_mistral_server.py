@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+"""
+Local stand-in for the services `extract_pricebooks.py` talks to, replaying recorded fixtures.
+
+Endpoints:
+- PUT  /upload/<filename>        transfer.sh-compatible upload (returns a URL in the body)
+- POST /v1/ocr                   returns the recorded `ocr_raw.json` for the uploaded book
+                                  (only the requested `pages`, when given)
+- POST /v1/chat/completions      returns slices of the recorded `pricebook_extracted.json`
+
+Fixtures are the book directories under `pricebooks/out/*`. An uploaded PDF is matched to the
+fixture whose directory name is the longest prefix of the PDF's safe stem, so
+`<book>__copy3.pdf` replays `<book>`.
+
+Point the pipeline at it with config keys (or the matching env vars):
+  "ocr": {"endpoint": "http://127.0.0.1:8787/v1/ocr", ...},
+  "upload_provider": "transfer_sh",
+  "transfer_sh_url": "http://127.0.0.1:8787/upload",
+  "mistral_server_url": "http://127.0.0.1:8787"
+
+Usage:
+  python3 scripts/stub_mistral_server.py --port 8787 --ocr-latency-ms 800 --chat-latency-ms 1500 --error-rate 0.02
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from artifact_store import artifact_exists, read_artifact_json
+from extract_pricebooks import safe_stem
+
+DEFAULT_FIXTURES_DIR = _ROOT / "pricebooks" / "out"
+
+_CHUNK_RE = re.compile(r"Chunk (\d+) of (\d+)")
+_SOURCE_RE = re.compile(r"^Source: (.+)$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class StubBehavior:
+    """
+    Latency is `base ± jitter` milliseconds per request. `error_rate` is the probability that a
+    request is answered with `error_status` instead of the fixture.
+    """
+
+    upload_latency_ms: float = 0.0
+    ocr_latency_ms: float = 0.0
+    chat_latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: Optional[int] = None
+
+
+@dataclass
+class StubStats:
+    requests: Dict[str, int] = field(default_factory=dict)
+    injected_errors: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def count(self, endpoint: str) -> None:
+        with self.lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+
+class FixtureLibrary:
+    """
+    Recorded book outputs, loaded lazily and cached per book.
+    """
+
+    def __init__(self, fixtures_dir: Path) -> None:
+        self.fixtures_dir = fixtures_dir
+        self._names = sorted(p.name for p in fixtures_dir.iterdir() if artifact_exists(p / "ocr_raw.json"))
+        self._cache: Dict[Tuple[str, str], Dict[str, object]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def match(self, filename: str) -> Optional[str]:
+        stem = safe_stem(Path(filename))
+        best: Optional[str] = None
+        for name in self._names:
+            if stem.startswith(name) and (best is None or len(name) > len(best)):
+                best = name
+        return best
+
+    def load(self, book: str, artifact: str) -> Dict[str, object]:
+        key = (book, artifact)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        path = self.fixtures_dir / book / artifact
+        data = read_artifact_json(path) if artifact_exists(path) else {}
+        if not isinstance(data, dict):
+            data = {}
+        with self._lock:
+            self._cache[key] = data
+        return data
+
+
+def structuring_slice(extracted: Dict[str, object], *, chunk_index: int, chunk_count: int) -> Dict[str, object]:
+    """
+    Split a recorded extraction into `chunk_count` contiguous slices and return slice `chunk_index`
+    (1-based), so merging every chunk's reply reproduces the recording.
+    """
+    out: Dict[str, object] = {}
+    n = max(1, chunk_count)
+    i = min(max(1, chunk_index), n) - 1
+    for key in ("rules", "tables", "notes"):
+        items = extracted.get(key)
+        items = items if isinstance(items, list) else []
+        lo = (len(items) * i) // n
+        hi = (len(items) * (i + 1)) // n
+        out[key] = items[lo:hi]
+    return out
+
+
+def make_handler(
+    *,
+    fixtures: FixtureLibrary,
+    behavior: StubBehavior,
+    stats: StubStats,
+) -> type:
+    rng = random.Random(behavior.seed)
+    rng_lock = threading.Lock()
+    uploads: Dict[str, str] = {}  # token -> original filename
+    uploads_lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - stdlib signature
+            return
+
+        def _read_body(self) -> bytes:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                return self.rfile.read(length)
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                parts: List[bytes] = []
+                while True:
+                    size = int(self.rfile.readline().strip() or b"0", 16)
+                    if size == 0:
+                        self.rfile.readline()
+                        break
+                    parts.append(self.rfile.read(size))
+                    self.rfile.readline()
+                return b"".join(parts)
+            return b""
+
+        def _send(self, status: int, body: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, status: int, data: object) -> None:
+            self._send(status, json.dumps(data).encode("utf-8"), "application/json")
+
+        def _simulate(self, endpoint: str, base_ms: float) -> bool:
+            """
+            Apply latency; return False (after replying) when an error is injected.
+            """
+            stats.count(endpoint)
+            with rng_lock:
+                jitter = rng.uniform(-behavior.jitter_ms, behavior.jitter_ms) if behavior.jitter_ms else 0.0
+                fail = behavior.error_rate > 0 and rng.random() < behavior.error_rate
+            delay = max(0.0, base_ms + jitter) / 1000.0
+            if delay:
+                time.sleep(delay)
+            if fail:
+                with stats.lock:
+                    stats.injected_errors += 1
+                self._send_json(behavior.error_status, {"message": "injected error", "endpoint": endpoint})
+                return False
+            return True
+
+        def do_PUT(self) -> None:  # noqa: N802 - stdlib naming
+            # Drain the upload even though only its filename matters for replay.
+            self._read_body()
+            if not self.path.startswith("/upload/"):
+                self._send_json(404, {"message": f"unknown path {self.path}"})
+                return
+            if not self._simulate("upload", behavior.upload_latency_ms):
+                return
+            filename = unquote(self.path[len("/upload/") :]) or "upload.pdf"
+            token = uuid.uuid4().hex[:12]
+            with uploads_lock:
+                uploads[token] = filename
+            host = self.headers.get("Host") or f"{self.server.server_address[0]}:{self.server.server_address[1]}"
+            url = f"http://{host}/files/{token}/{filename}"
+            self._send(200, url.encode("utf-8"), "text/plain")
+
+        def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+            body = self._read_body()
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                self._send_json(400, {"message": "body was not JSON"})
+                return
+
+            if self.path.rstrip("/") == "/v1/ocr":
+                if not self._simulate("ocr", behavior.ocr_latency_ms):
+                    return
+                document = payload.get("document") if isinstance(payload, dict) else None
+                url = document.get("document_url") if isinstance(document, dict) else None
+                m = re.search(r"/files/([0-9a-f]+)/", url or "")
+                with uploads_lock:
+                    filename = uploads.get(m.group(1)) if m else None
+                book = fixtures.match(filename or "")
+                if book is None:
+                    self._send_json(404, {"message": f"no fixture for document {url!r}"})
+                    return
+                data = fixtures.load(book, "ocr_raw.json")
+                wanted = payload.get("pages")
+                if isinstance(wanted, list) and isinstance(data.get("pages"), list):
+                    keep = {int(i) for i in wanted if isinstance(i, int)}
+                    data = {**data, "pages": [pg for pg in data["pages"] if isinstance(pg, dict) and pg.get("index") in keep]}
+                self._send_json(200, data)
+                return
+
+            if self.path.rstrip("/") == "/v1/chat/completions":
+                if not self._simulate("chat", behavior.chat_latency_ms):
+                    return
+                messages = payload.get("messages") if isinstance(payload, dict) else None
+                prompt = ""
+                if isinstance(messages, list) and messages:
+                    last = messages[-1]
+                    prompt = str(last.get("content") or "") if isinstance(last, dict) else ""
+                source_m = _SOURCE_RE.search(prompt)
+                chunk_m = _CHUNK_RE.search(prompt)
+                book = fixtures.match(source_m.group(1).strip()) if source_m else None
+                extracted = fixtures.load(book, "pricebook_extracted.json") if book else {}
+                idx, total = (int(chunk_m.group(1)), int(chunk_m.group(2))) if chunk_m else (1, 1)
+                content = json.dumps(structuring_slice(extracted, chunk_index=idx, chunk_count=total))
+                self._send_json(
+                    200,
+                    {
+                        "id": f"stub-{uuid.uuid4().hex[:12]}",
+                        "object": "chat.completion",
+                        "model": str(payload.get("model") or "stub"),
+                        "created": int(time.time()),
+                        "usage": {
+                            "prompt_tokens": len(prompt) // 4,
+                            "completion_tokens": len(content) // 4,
+                            "total_tokens": (len(prompt) + len(content)) // 4,
+                        },
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": content},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    },
+                )
+                return
+
+            self._send_json(404, {"message": f"unknown path {self.path}"})
+
+        def do_DELETE(self) -> None:  # noqa: N802 - stdlib naming
+            self._send(200, b"", "text/plain")
+
+    return Handler
+
+
+class StubServer:
+    """
+    Run the stub on a background thread (port 0 picks a free port).
+    """
+
+    def __init__(
+        self,
+        *,
+        fixtures_dir: Path = DEFAULT_FIXTURES_DIR,
+        behavior: StubBehavior = StubBehavior(),
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.fixtures = FixtureLibrary(fixtures_dir)
+        self.stats = StubStats()
+        handler = make_handler(fixtures=self.fixtures, behavior=behavior, stats=self.stats)
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-mistral", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join(timeout=5.0)
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve recorded OCR/structuring fixtures as a local Mistral stand-in.")
+    parser.add_argument("--fixtures-dir", default=str(DEFAULT_FIXTURES_DIR), help="Directory of recorded book outputs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--upload-latency-ms", type=float, default=0.0)
+    parser.add_argument("--ocr-latency-ms", type=float, default=0.0)
+    parser.add_argument("--chat-latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability (0..1) of an injected error reply.")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    behavior = StubBehavior(
+        upload_latency_ms=args.upload_latency_ms,
+        ocr_latency_ms=args.ocr_latency_ms,
+        chat_latency_ms=args.chat_latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    server = StubServer(fixtures_dir=Path(args.fixtures_dir), behavior=behavior, host=args.host, port=args.port)
+    print(f"Stub Mistral server on {server.base_url} replaying {len(server.fixtures.names)} books:")
+    for name in server.fixtures.names:
+        print(f"- {name}")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
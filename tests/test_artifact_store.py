@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from artifact_store import (
+    BLOB_DIRNAME,
+    POINTER_FILENAME,
+    artifact_exists,
+    artifact_ref,
+    artifact_sha256,
+    collect_garbage,
+    find_artifacts,
+    pack_book,
+    read_artifact_json,
+    read_artifact_text,
+    unpack_book,
+    write_artifact_json,
+    write_artifact_text,
+)
+from pipeline_manifest import file_sha256
+
+
+class TestArtifactStore(unittest.TestCase):
+    def test_round_trip_dedupes_across_books_and_keeps_revisions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            payload = {"pages": [{"index": 0, "markdown": "| Width | Price |\n" * 200}]}
+            a = write_artifact_json(out / "book_a" / "ocr_raw.json", payload)
+            b = write_artifact_json(out / "book_b" / "ocr_raw.json", payload)
+
+            self.assertFalse(a.exists())
+            self.assertTrue(artifact_exists(a) and artifact_exists(b))
+            self.assertEqual(read_artifact_json(a), payload)
+            self.assertEqual(len(list((out / BLOB_DIRNAME).glob("*/*.z"))), 1)
+            ref = artifact_ref(a)
+            assert ref is not None
+            self.assertLess(ref.stored_size, ref.size // 10)
+            self.assertEqual(find_artifacts(out, "ocr_raw.json"), [a, b])
+
+            write_artifact_text(out / "book_a" / "ocr_raw.json", "{}")
+            self.assertEqual(read_artifact_text(a), "{}")
+            pointers = json.loads((out / "book_a" / POINTER_FILENAME).read_text(encoding="utf-8"))
+            self.assertEqual(pointers["history"]["ocr_raw.json"][0]["sha256"], ref.sha256)
+            self.assertEqual(collect_garbage(out), [])
+
+            # Plain and stored forms hash identically, so manifests survive pack/unpack.
+            stored_hash = artifact_sha256(b)
+            unpack_book(out / "book_b")
+            self.assertTrue(b.is_file())
+            self.assertEqual(file_sha256(b), stored_hash)
+
+    def test_pack_and_plain_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            book = Path(tmp) / "book"
+            book.mkdir()
+            (book / "ocr_text.md").write_text("# Page 1", encoding="utf-8")
+            self.assertEqual(pack_book(book, ["ocr_text.md", "missing.json"]), [book / "ocr_text.md"])
+            self.assertFalse((book / "ocr_text.md").exists())
+            self.assertEqual(read_artifact_text(book / "ocr_text.md"), "# Page 1")
+            with self.assertRaises(FileNotFoundError):
+                read_artifact_text(book / "missing.json")
+
+            with mock.patch.dict(os.environ, {"PRICEBOOK_ARTIFACT_STORE": "0"}):
+                write_artifact_text(book / "notes.md", "plain")
+            self.assertEqual((book / "notes.md").read_text(encoding="utf-8"), "plain")
+
+    def test_pack_keeps_the_plain_file_when_the_store_write_fails(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            book = Path(tmp) / "book"
+            book.mkdir()
+            (book / "ocr_text.md").write_text("# Page 1", encoding="utf-8")
+            (book / "artifacts.json").write_text("{}", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                pack_book(book, ["ocr_text.md"])
+            self.assertEqual((book / "ocr_text.md").read_text(encoding="utf-8"), "# Page 1")
+
+            (book / "artifacts.json").unlink()
+            with mock.patch("artifact_store._atomic_write_bytes", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    pack_book(book, ["ocr_text.md"])
+            self.assertEqual((book / "ocr_text.md").read_text(encoding="utf-8"), "# Page 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+import os
+import sys
 import unittest
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image
 
 from building_views import (
+    VIEW_ENCODINGS,
     BuildingColorScheme,
     BuildingOpening,
     BuildingOpeningKind,
     BuildingSide,
+    _PixelLruCache,
+    _openings_scene,
+    _structure_layer,
+    _structure_scene,
+    _view_geometry,
+    layout_openings,
     render_building_views_png,
+    render_building_views_svg,
+    render_building_views_vector,
+    view_encoding,
 )
 
+_SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+if str(_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS))
+
+from benchmark_building_views import run_scaling_benchmark  # noqa: E402
+
 
 class TestBuildingViews(unittest.TestCase):
     def test_render_building_views_returns_non_empty_png_bytes(self) -> None:
@@ -72,6 +97,234 @@ class TestBuildingViews(unittest.TestCase):
         )["front"]
         self.assertNotEqual(base, with_openings)
 
+    def test_views_rendered_on_an_executor_match_serial_rendering(self) -> None:
+        kwargs = dict(
+            width_ft=18,
+            length_ft=26,
+            height_ft=12,
+            colors=BuildingColorScheme(roof="Red", trim="Black", sides="Tan"),
+            openings=(BuildingOpening(side=BuildingSide.LEFT, kind=BuildingOpeningKind.WINDOW, width_ft=2, height_ft=3),),
+            canvas_px=(480, 300),
+        )
+        with mock.patch.dict(os.environ, {"BUILDING_VIEWS_PARALLEL": "0"}):
+            serial = render_building_views_png(**kwargs)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            threaded = render_building_views_png(executor=pool, **kwargs)
+        self.assertEqual(list(threaded), ["isometric", "front", "back", "left", "right"])
+        self.assertEqual(threaded, serial)
+
+    def test_encoding_profiles_are_lossless_and_trade_time_for_bytes(self) -> None:
+        kwargs = dict(
+            width_ft=24,
+            length_ft=36,
+            height_ft=12,
+            colors=BuildingColorScheme(roof="Burgundy", trim="White", sides="Tan"),
+            openings=(BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.GARAGE_DOOR, width_ft=10, height_ft=8),),
+            view_names=("isometric", "left"),
+        )
+        encoded = {name: render_building_views_png(encoding=view_encoding(name), **kwargs) for name in VIEW_ENCODINGS}
+        reference = {k: Image.open(BytesIO(v)).convert("RGB").tobytes() for k, v in encoded["default"].items()}
+        for name, views in encoded.items():
+            for view, data in views.items():
+                self.assertEqual(Image.open(BytesIO(data)).convert("RGB").tobytes(), reference[view], (name, view))
+        self.assertEqual(Image.open(BytesIO(encoded["small"]["left"])).mode, "P")
+        self.assertEqual(Image.open(BytesIO(encoded["webp"]["left"])).format, "WEBP")
+        size = {name: sum(map(len, views.values())) for name, views in encoded.items()}
+        self.assertLess(size["small"], size["default"])
+        self.assertLess(size["default"], size["fast"])
+        with self.assertRaises(ValueError):
+            view_encoding("gif")
+
+    def test_vector_views_mirror_png_views(self) -> None:
+        kwargs = dict(
+            width_ft=18,
+            length_ft=26,
+            height_ft=12,
+            colors=BuildingColorScheme(roof="Red", trim="Black", sides="Tan"),
+            openings=(BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.DOOR, width_ft=3, height_ft=7),),
+            view_names=("front", "isometric"),
+            canvas_px=(640, 360),
+        )
+        vectors = render_building_views_vector(**kwargs)
+        self.assertEqual(list(vectors), list(render_building_views_png(**kwargs)))
+        front = vectors["front"]
+        self.assertEqual(front.canvas_px, (640, 360))
+        # Background first, frame last; the red roof gable is in between.
+        self.assertEqual(front.shapes[0].fill, (245, 245, 245))
+        self.assertEqual(front.shapes[-1].outline, (190, 190, 190))
+        self.assertIn((179, 38, 30), {s.fill for s in front.shapes if s.kind == "polygon"})
+        self.assertEqual(vectors, render_building_views_vector(**kwargs))
+
+    def test_color_change_recolors_cached_geometry(self) -> None:
+        kwargs = dict(
+            width_ft=22,
+            length_ft=30,
+            height_ft=11,
+            openings=(BuildingOpening(side=BuildingSide.LEFT, kind=BuildingOpeningKind.WINDOW, width_ft=3, height_ft=3),),
+            view_names=("isometric", "right"),
+        )
+        blue = BuildingColorScheme(roof="Blue", trim="White", sides="Gray")
+        red = BuildingColorScheme(roof="Red", trim="Black", sides="Tan")
+        render_building_views_png(colors=blue, **kwargs)
+        before = _view_geometry.cache_info()
+        recolored = render_building_views_png(colors=red, **kwargs)
+        after = _view_geometry.cache_info()
+        self.assertEqual(after.misses, before.misses)
+        self.assertEqual(after.hits, before.hits + 2)
+        _view_geometry.cache_clear()
+        self.assertEqual(recolored, render_building_views_png(colors=red, **kwargs))
+        self.assertNotEqual(recolored, render_building_views_png(colors=blue, **kwargs))
+
+    def test_openings_change_reuses_structure_layer(self) -> None:
+        kwargs = dict(
+            width_ft=26,
+            length_ft=34,
+            height_ft=12,
+            colors=BuildingColorScheme(roof="Green", trim="White", sides="Tan"),
+            view_names=("front", "left"),
+        )
+        render_building_views_png(openings=(), **kwargs)
+        door = (BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.DOOR, width_ft=3, height_ft=7),)
+        before = _structure_layer.cache_info()
+        with_door = render_building_views_png(openings=door, **kwargs)
+        self.assertEqual(_structure_layer.cache_info().misses, before.misses)
+        _view_geometry.cache_clear()
+        _structure_layer.cache_clear()
+        self.assertEqual(with_door, render_building_views_png(openings=door, **kwargs))
+
+    def test_draft_is_a_scaled_down_view_without_texture(self) -> None:
+        kwargs = dict(
+            width_ft=30,
+            length_ft=40,
+            height_ft=12,
+            colors=BuildingColorScheme(roof="Blue", trim="White", sides="Tan"),
+            view_names=("isometric",),
+            canvas_px=(900, 520),
+        )
+        full = Image.open(BytesIO(render_building_views_png(**kwargs)["isometric"]))
+        draft = Image.open(BytesIO(render_building_views_png(draft=True, **kwargs)["isometric"]))
+        self.assertEqual(draft.size, (360, 208))
+        # Same picture in miniature: the roof blue is there, the siding-line shade is not.
+        siding = (196, 196, 196)  # White trim shaded by 0.8
+        self.assertIn(siding, {c for _, c in full.convert("RGB").getcolors(1 << 16)})
+        draft_colors = {c for _, c in draft.convert("RGB").getcolors(1 << 16)}
+        self.assertIn((26, 115, 232), draft_colors)
+        self.assertNotIn(siding, draft_colors)
+
+    def test_svg_views_draw_the_vector_shapes(self) -> None:
+        kwargs = dict(
+            width_ft=18,
+            length_ft=26,
+            height_ft=12,
+            colors=BuildingColorScheme(roof="Red", trim="Black", sides="Tan"),
+            openings=(BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.DOOR, width_ft=3, height_ft=7),),
+            view_names=("front", "isometric"),
+            canvas_px=(640, 360),
+        )
+        svgs = render_building_views_svg(**kwargs)
+        vectors = render_building_views_vector(**kwargs)
+        self.assertEqual(list(svgs), list(vectors))
+        root = ET.fromstring(svgs["front"])
+        self.assertEqual(root.tag, "{http://www.w3.org/2000/svg}svg")
+        self.assertEqual(root.get("viewBox"), "0 0 640 360")
+        # Filled-and-outlined rectangles become two elements; everything else one.
+        shapes = vectors["front"].shapes
+        doubled = sum(1 for sh in shapes if sh.kind == "rect" and sh.fill is not None and sh.outline is not None)
+        self.assertEqual(len(root), len(shapes) + doubled)
+        self.assertEqual(root[0].get("fill"), "#f5f5f5")
+        self.assertIn("#b3261e", {el.get("fill") for el in root if el.tag.endswith("polygon")})
+
+    def test_layer_caches_are_bounded_by_pixel_bytes(self) -> None:
+        made = []
+
+        def layer(w: int) -> Image.Image:
+            made.append(w)
+            return Image.new("P", (w, 100))
+
+        cache = _PixelLruCache(layer, maxsize=10, max_bytes=250_000)
+        for w in (1000, 1000, 800, 900):
+            cache(w)
+        # 1000 + 800 + 900 px-rows would be 270 KB, so the least recently used (1000) went.
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize, info.currbytes), (1, 3, 2, 170_000))
+        cache(1000)
+        self.assertEqual(made, [1000, 800, 900, 1000])
+        # Too big for the whole budget: returned, never kept.
+        self.assertEqual(cache(3000).size, (3000, 100))
+        self.assertEqual(cache.cache_info().currbytes, 190_000)
+
+    def test_output_formats_share_one_geometry_pass(self) -> None:
+        kwargs = dict(
+            width_ft=28,
+            length_ft=44,
+            height_ft=13,
+            colors=BuildingColorScheme(roof="Black", trim="White", sides="Sandstone"),
+            openings=(BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.GARAGE_DOOR, width_ft=10, height_ft=8),),
+            view_names=("front",),
+        )
+        for cache in (_structure_scene, _openings_scene, _structure_layer, _view_geometry):
+            cache.cache_clear()
+        render_building_views_png(**kwargs)
+        render_building_views_vector(**kwargs)
+        render_building_views_svg(**kwargs)
+        self.assertEqual(_structure_scene.cache_info().misses, 1)
+        self.assertEqual(_openings_scene.cache_info().misses, 1)
+
+    def test_layout_places_explicit_openings_first_and_fills_gaps(self) -> None:
+        door = BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.DOOR, width_ft=4, height_ft=7, offset_ft=10)
+        window = BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.WINDOW, width_ft=3, height_ft=3)
+        layout = layout_openings((window, door, window), width_ft=30, length_ft=40)
+        self.assertEqual(layout.warnings, ())
+        spans = [(p.start_ft, p.end_ft) for p in layout.placements]
+        self.assertEqual(spans[1], (8.0, 12.0))
+        # Both windows go right of the door: 4 ft spacing there beats 2.5 ft in the 8 ft gap on the left.
+        self.assertEqual(spans[0], (16.0, 19.0))
+        self.assertEqual(spans[2], (23.0, 26.0))
+        centered = BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.DOOR, width_ft=4, height_ft=7, offset_ft=15)
+        spans = [(p.start_ft, p.end_ft) for p in layout_openings((window, centered, window), width_ft=30, length_ft=40).placements]
+        # With the door mid-wall, one window lands in each 13 ft gap.
+        self.assertEqual(spans[0], (5.0, 8.0))
+        self.assertEqual(spans[2], (22.0, 25.0))
+
+        clash = BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.GARAGE_DOOR, width_ft=10, height_ft=8, offset_ft=13)
+        warnings = layout_openings((door, clash), width_ft=30, length_ft=40).warnings
+        self.assertEqual(warnings, ("Front wall: the garage door at 13 ft overlaps the door at 10 ft.",))
+        crowded = (window,) * 12
+        self.assertIn("need 36 ft", layout_openings(crowded, width_ft=30, length_ft=30).warnings[0])
+
+    def test_layout_of_dozens_of_openings_on_a_long_wall_has_no_overlaps(self) -> None:
+        openings = tuple(
+            BuildingOpening(
+                side=BuildingSide.LEFT,
+                kind=BuildingOpeningKind.WINDOW if i % 4 else BuildingOpeningKind.GARAGE_DOOR,
+                width_ft=3 if i % 4 else 12,
+                height_ft=4,
+                offset_ft=i * 6 + 6 if i % 4 == 0 else None,
+            )
+            for i in range(40)
+        )
+        layout = layout_openings(openings, width_ft=60, length_ft=250)
+        self.assertEqual(layout.warnings, ())
+        spans = sorted((p.start_ft, p.end_ft) for p in layout.placements)
+        self.assertGreaterEqual(spans[0][0], 0.0)
+        self.assertLessEqual(spans[-1][1], 250.0)
+        for (_, end), (start, _) in zip(spans, spans[1:]):
+            self.assertLessEqual(end, start)
+
+    def test_scaling_benchmark_reports_every_view_of_every_case(self) -> None:
+        result = run_scaling_benchmark(
+            iterations=1, sizes_ft=((120, 250, 30),), canvases_px=((640, 360),), opening_counts=(0, 40)
+        )
+        self.assertEqual([c["openings"] for c in result["cases"]], [0, 40])
+        for case in result["cases"]:
+            self.assertEqual(case["size_ft"], [120, 250, 30])
+            self.assertEqual(list(case["views"]), ["isometric", "front", "back", "left", "right"])
+            for stats in case["views"].values():
+                self.assertGreater(stats["bytes"], 0)
+                self.assertGreater(stats["peak_kib"], 0)
+                self.assertEqual(stats["raster_kib"], 640 * 360 * 5 / 1024)
+                self.assertGreaterEqual(stats["render"]["median_ms"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import building_views_cache
+from building_views import (
+    BuildingColorScheme,
+    BuildingOpening,
+    BuildingOpeningKind,
+    BuildingSide,
+    render_building_views_png,
+    view_encoding,
+)
+from building_views_cache import BuildingViewDiskCache, building_view_cache_key, render_building_views_cached
+
+_VIEW = dict(
+    width_ft=20,
+    length_ft=30,
+    height_ft=10,
+    colors=BuildingColorScheme(roof="Blue", trim="White", sides="Gray"),
+    openings=(BuildingOpening(side=BuildingSide.FRONT, kind=BuildingOpeningKind.DOOR, width_ft=3, height_ft=7),),
+    canvas_px=(640, 360),
+)
+
+
+class TestBuildingViewsCache(unittest.TestCase):
+    def test_key_is_canonical_and_covers_inputs_and_renderer_version(self) -> None:
+        enc = view_encoding("fast")
+        key = building_view_cache_key(name="front", encoding=enc, **_VIEW)
+        same = {**_VIEW, "colors": BuildingColorScheme(roof="#1a73e8", trim="White", sides="Gray")}
+        self.assertEqual(key, building_view_cache_key(name="front", encoding=enc, **same))
+        self.assertNotEqual(key, building_view_cache_key(name="left", encoding=enc, **_VIEW))
+        self.assertNotEqual(key, building_view_cache_key(name="front", encoding=view_encoding("small"), **_VIEW))
+        self.assertNotEqual(key, building_view_cache_key(name="front", encoding=enc, **{**_VIEW, "openings": ()}))
+        self.assertNotEqual(key, building_view_cache_key(name="front", encoding=enc, draft=True, **_VIEW))
+        with mock.patch.object(building_views_cache, "BUILDING_VIEWS_RENDERER_VERSION", 999):
+            self.assertNotEqual(key, building_view_cache_key(name="front", encoding=enc, **_VIEW))
+
+    def test_cached_render_matches_plain_render_and_renders_only_misses(self) -> None:
+        enc = view_encoding("fast")
+        with tempfile.TemporaryDirectory() as td:
+            cache = BuildingViewDiskCache(Path(td))
+            first = render_building_views_cached(cache, view_names=("isometric",), encoding=enc, **_VIEW)
+            with mock.patch.object(
+                building_views_cache, "render_building_views_png", wraps=render_building_views_png
+            ) as render:
+                views = render_building_views_cached(cache, view_names=("front", "isometric"), encoding=enc, **_VIEW)
+            render.assert_called_once()
+            self.assertEqual(render.call_args.kwargs["view_names"], ["front"])
+            self.assertEqual(list(views), ["isometric", "front"])
+            self.assertEqual(views["isometric"], first["isometric"])
+            self.assertEqual(views, render_building_views_png(view_names=("front", "isometric"), encoding=enc, **_VIEW))
+            stats = cache.stats()
+            self.assertEqual((stats.entries, stats.hits, stats.misses), (2, 1, 2))
+            # Another process (a second cache object on the same dir) sees the same entries.
+            other = render_building_views_cached(BuildingViewDiskCache(Path(td)), view_names=("front",), encoding=enc, **_VIEW)
+            self.assertEqual(other, {"front": views["front"]})
+
+    def test_lru_eviction_keeps_recently_used_entries_within_budget(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache = BuildingViewDiskCache(Path(td), max_bytes=2500)
+            enc = view_encoding("default")
+            keys = [building_view_cache_key(name=name, encoding=enc, **_VIEW) for name in ("front", "back", "left")]
+            png = b"\x89PNG\r\n\x1a\n" + b"x" * 1000
+            for i, key in enumerate(keys[:2]):
+                path = cache.put(key, png)
+                os.utime(path, (1000 + i, 1000 + i))
+            self.assertEqual(cache.get(keys[0]), png)
+            # keys[0] was just read, so inserting a third entry evicts keys[1].
+            cache.put(keys[2], png)
+            self.assertIsNotNone(cache.get(keys[0]))
+            self.assertIsNone(cache.get(keys[1]))
+            self.assertLessEqual(cache.stats().total_bytes, 2500)
+            self.assertEqual(list(Path(td).rglob("*.tmp")), [])
+            with self.assertRaises(ValueError):
+                cache.get("../etc/passwd")
+
+
+if __name__ == "__main__":
+    unittest.main()
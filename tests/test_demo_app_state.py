@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import shutil
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 import local_demo_app
+from artifact_store import pack_book
 from local_demo_app import _build_selected_options_from_state
 from normalized_pricebooks import build_demo_pricebook_r29, load_normalized_pricebook
 from pricing_engine import CarportStyle, QuoteInput, RoofStyle, generate_quote
+from prefetch import BackgroundPrefetcher
 
 
 def _load_demo_book():
@@ -332,4 +339,37 @@ class TestDemoAppState(unittest.TestCase):
         self.assertIn("WINDOW_24X36", codes)
         self.assertIn("EXTRA_PANEL", codes)
 
-
+    def test_loads_pricebook_packed_into_the_artifact_store(self) -> None:
+        root = Path(__file__).resolve().parents[1]
+        book_name = "Coast_To_Coast_Carports___Price_Book___R29_1"
+        source = root / "pricebooks" / "out" / book_name / "normalized_pricebook.json"
+        with tempfile.TemporaryDirectory() as td:
+            book_dir = Path(td) / "out" / book_name
+            book_dir.mkdir(parents=True)
+            shutil.copyfile(source, book_dir / "normalized_pricebook.json")
+            with mock.patch.dict("os.environ", {"PRICEBOOK_ARTIFACT_STORE": "1"}):
+                pack_book(book_dir, ["normalized_pricebook.json"])
+            logical = book_dir / "normalized_pricebook.json"
+            self.assertFalse(logical.exists())
+            with mock.patch.object(local_demo_app, "_find_r29_normalized_path", return_value=logical):
+                book = local_demo_app._load_pricebook_from_extracted()
+        self.assertEqual(book, _load_demo_book())
+
+    def test_failed_quote_pdf_prefetch_is_not_resubmitted_on_rerun(self) -> None:
+        builds = []
+
+        def run(job, cancelled=None):
+            builds.append(job.key)
+            raise RuntimeError("render failed")
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prefetcher = BackgroundPrefetcher(pool)
+            with mock.patch.object(local_demo_app, "_quote_pdf_prefetcher", return_value=prefetcher), mock.patch.object(
+                local_demo_app, "_quote_pdf_job", return_value=SimpleNamespace(key="a")
+            ), mock.patch.object(local_demo_app, "_run_quote_pdf_job", side_effect=run):
+                local_demo_app._prefetch_quote_pdf(None, None)
+                self.assertIsNone(prefetcher.take("a", timeout=5))
+                self.assertIsInstance(prefetcher.failed("a"), RuntimeError)
+                local_demo_app._prefetch_quote_pdf(None, None)
+                self.assertIsNone(prefetcher.key)
+        self.assertEqual(builds, ["a"])
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from disk_lru_cache import DiskLruCache, disk_lru_settings_from_env
+
+_KEY = "ab" * 32
+
+
+class TestDiskLruCache(unittest.TestCase):
+    def test_entries_with_the_wrong_magic_are_misses_and_removed(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache = DiskLruCache(Path(td), max_bytes=1 << 20, magic={".bin": b"MAGIC"})
+            path = cache.write(_KEY, ".bin", lambda f: f.write(b"MAGIC payload"))
+            self.assertEqual(cache.read(_KEY, ".bin"), b"MAGIC payload")
+            self.assertEqual(cache.locate(_KEY, ".bin"), path)
+            path.write_bytes(b"garbage")
+            self.assertIsNone(cache.read(_KEY, ".bin"))
+            self.assertFalse(path.exists())
+            stats = cache.stats()
+            self.assertEqual((stats.entries, stats.hits, stats.misses), (0, 2, 1))
+            with self.assertRaises(ValueError):
+                cache.path(_KEY, ".exe")
+
+    def test_settings_from_env(self) -> None:
+        default = Path("/tmp/default-cache")
+        with mock.patch.dict(os.environ, {"DEMO_CACHE_DIR": "/srv/cache", "DEMO_CACHE_MAX_MB": "2"}):
+            self.assertEqual(
+                disk_lru_settings_from_env("DEMO_CACHE", default_dir=default, default_max_bytes=1),
+                (Path("/srv/cache"), 2 * 1024 * 1024),
+            )
+        with mock.patch.dict(os.environ, {"DEMO_CACHE_MAX_MB": "lots"}):
+            self.assertEqual(disk_lru_settings_from_env("DEMO_CACHE", default_dir=default, default_max_bytes=4096), (default, 4096))
+        with mock.patch.dict(os.environ, {"DEMO_CACHE": "0"}):
+            self.assertIsNone(disk_lru_settings_from_env("DEMO_CACHE", default_dir=default, default_max_bytes=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import httpx
+
+_SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+if str(_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS))
+
+import extract_pricebooks  # noqa: E402
+from benchmark_extraction_pipeline import stub_config  # noqa: E402
+from stub_mistral_server import DEFAULT_FIXTURES_DIR, StubServer  # noqa: E402
+
+from artifact_store import read_artifact_json, read_artifact_text  # noqa: E402
+from pdf_text_layer import text_layer_available  # noqa: E402
+from tests.test_pdf_text_layer import write_mixed_pdf  # noqa: E402
+
+_R29 = "Coast_To_Coast_Carports___Price_Book___R29_1"
+_R31 = "Coast_To_Coast_Carports___Price_Book___R31_1"
+
+
+class TestExtractPricebooksHttp(unittest.TestCase):
+    def test_ocr_streams_pdf_from_disk_over_shared_client(self) -> None:
+        seen: list[tuple[str, str, int]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = request.read()
+            seen.append((request.method, request.url.host, len(body)))
+            if request.url.host == "transfer.sh":
+                self.assertEqual(request.headers.get("Content-Length"), str(len(body)))
+                return httpx.Response(200, text="https://transfer.sh/abc/book.pdf")
+            payload = json.loads(body)
+            self.assertEqual(payload["document"]["document_url"], "https://transfer.sh/abc/book.pdf")
+            return httpx.Response(200, json={"pages": [{"index": 0, "markdown": "# Page 1"}]})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "book.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4\n" + b"x" * (extract_pricebooks._UPLOAD_CHUNK_BYTES * 2 + 7))
+            with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+                for _ in range(2):
+                    data = extract_pricebooks.mistral_ocr_pdf(
+                        api_key="test",
+                        endpoint="https://api.mistral.test/v1/ocr",
+                        model="mistral-ocr-latest",
+                        pdf_path=pdf_path,
+                        filename="book.pdf",
+                        upload_provider="transfer_sh",
+                        supabase_url=None,
+                        supabase_anon_key=None,
+                        supabase_bucket="mistral-tmp",
+                        delete_after_ocr=True,
+                        client=client,
+                    )
+                    self.assertEqual(data["pages"][0]["markdown"], "# Page 1")
+                # The caller owns the pooled client; OCR must not close it.
+                self.assertFalse(client.is_closed)
+
+        size = len(b"%PDF-1.4\n") + extract_pricebooks._UPLOAD_CHUNK_BYTES * 2 + 7
+        self.assertEqual([s for s in seen if s[1] == "transfer.sh"], [("PUT", "transfer.sh", size)] * 2)
+        self.assertEqual(len([s for s in seen if s[1] == "api.mistral.test"]), 2)
+
+    def test_make_http_client_pools_connections(self) -> None:
+        with extract_pricebooks.make_http_client(timeout_s=5.0) as client:
+            self.assertFalse(client.is_closed)
+            self.assertEqual(client.timeout.read, 5.0)
+
+
+class TestExtractPricebooksAgainstStub(unittest.TestCase):
+    def test_process_pdf_replays_recorded_book(self) -> None:
+        if not (DEFAULT_FIXTURES_DIR / _R29 / "ocr_raw.json").exists():
+            self.skipTest("recorded R29 fixtures not available")
+        recorded = read_artifact_json(DEFAULT_FIXTURES_DIR / _R29 / "pricebook_extracted.json")
+
+        with tempfile.TemporaryDirectory() as tmp, StubServer() as server:
+            pdf = Path(tmp) / f"{_R29}.pdf"
+            pdf.write_bytes(b"%PDF-1.4\n")
+            cfg = stub_config(server.base_url)
+            with extract_pricebooks.make_http_client() as http_client:
+                mistral_client = extract_pricebooks.make_mistral_client(
+                    api_key=cfg.mistral_api_key, http_client=http_client, server_url=cfg.mistral_server_url
+                )
+                _, structured_path = extract_pricebooks.process_pdf(
+                    pdf_path=pdf,
+                    out_dir=Path(tmp) / "out",
+                    cfg=cfg,
+                    run_structuring=True,
+                    http_client=http_client,
+                    mistral_client=mistral_client,
+                )
+            structured = read_artifact_json(structured_path)
+            ocr_text = read_artifact_text(structured_path.parent / "ocr_text.md")
+
+        self.assertEqual(ocr_text, read_artifact_text(DEFAULT_FIXTURES_DIR / _R29 / "ocr_text.md"))
+        self.assertEqual(len(structured["tables"]), len(recorded["tables"]))
+        self.assertEqual(structured["chunk_stats"]["chunk_count"], server.stats.requests["chat"])
+        self.assertEqual(server.stats.requests["ocr"], 1)
+
+    def test_dot_only_ocr_skips_structuring(self) -> None:
+        if not (DEFAULT_FIXTURES_DIR / _R31 / "ocr_raw.json").exists():
+            self.skipTest("recorded R31 fixtures not available")
+
+        with tempfile.TemporaryDirectory() as tmp, StubServer() as server:
+            pdf = Path(tmp) / f"{_R31}.pdf"
+            pdf.write_bytes(b"%PDF-1.4\n")
+            ocr_raw_path, structured_path = extract_pricebooks.process_pdf(
+                pdf_path=pdf, out_dir=Path(tmp) / "out", cfg=stub_config(server.base_url), run_structuring=True
+            )
+            raw = read_artifact_json(ocr_raw_path)
+            structured = read_artifact_json(structured_path)
+
+        self.assertEqual(server.stats.requests.get("chat", 0), 0)
+        self.assertEqual(structured["error"], "low_quality_ocr")
+        self.assertEqual((structured["rules"], structured["tables"]), ([], []))
+        self.assertEqual(len(structured["ocr_quality"]["skipped_pages"]), 28)
+        self.assertEqual(raw["ocr_quality"]["usable_pages"], [])
+
+    def test_ocr_stage_only_ocrs_pages_without_a_usable_text_layer(self) -> None:
+        if not text_layer_available():
+            self.skipTest("pypdf not installed")
+        if not (DEFAULT_FIXTURES_DIR / _R29 / "ocr_raw.json").exists():
+            self.skipTest("recorded R29 fixtures not available")
+        recorded = read_artifact_json(DEFAULT_FIXTURES_DIR / _R29 / "ocr_raw.json")
+
+        with tempfile.TemporaryDirectory() as tmp, StubServer() as server:
+            pdf = Path(tmp) / f"{_R29}.pdf"
+            write_mixed_pdf(pdf)
+            raw_path, text_path = extract_pricebooks.ocr_stage(
+                pdf_path=pdf, base_out=Path(tmp) / "out", cfg=stub_config(server.base_url)
+            )
+            raw = read_artifact_json(raw_path)
+            ocr_text = read_artifact_text(text_path)
+
+        self.assertEqual(server.stats.requests["ocr"], 1)
+        self.assertEqual([p["source"] for p in raw["pages"]], ["text_layer", "ocr"])
+        self.assertEqual(raw["pages"][1]["markdown"], recorded["pages"][1]["markdown"])
+        self.assertTrue(ocr_text.startswith("Regular Carport Pricing\n\n| Width | Length | Price |"))
+
+
+if __name__ == "__main__":
+    unittest.main()
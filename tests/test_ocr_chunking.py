@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from ocr_chunking import chunk_ocr_markdown, estimate_tokens, split_ocr_markdown_blocks
+
+
+def _price_table(rows: int) -> str:
+    lines = ["|  14 GAUGE | 12 x 20 | $2,895.00  |", "| --- | --- | --- |"]
+    for i in range(rows):
+        lines.append(f"|   |  12 x {20 + i} | ${3000 + i},00.00  |")
+    return "\n".join(lines)
+
+
+class TestOcrChunking(unittest.TestCase):
+    def test_blocks_keep_multiline_table_cells_together(self) -> None:
+        text = (
+            "## Extra frameouts\n"
+            "\n"
+            "|  EXTRA FRAMEOUTS-SIDE WALL\n"
+            "Up To 12' Charge\n"
+            "$450.00 per opening | WELDED  |\n"
+            "| --- | --- |\n"
+            "|  $100.00 | $125.00  |\n"
+        )
+        blocks = split_ocr_markdown_blocks(text)
+        self.assertEqual([b.kind for b in blocks], ["heading", "table"])
+        self.assertIn("$450.00 per opening", blocks[1].text)
+
+    def test_tables_are_never_split_across_chunks(self) -> None:
+        sections = []
+        for i in range(12):
+            sections.append(f"## Section {i}\n\n14 GAUGE STYLE {i}\n\n{_price_table(8)}")
+        text = "\n\n".join(sections)
+        chunks, stats = chunk_ocr_markdown(text, max_tokens=400)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(stats.table_count, 12)
+        self.assertEqual(stats.tables_split, 0)
+        for i in range(12):
+            holders = [c for c in chunks if f"## Section {i}\n" in c]
+            self.assertEqual(len(holders), 1)
+            # Heading, caption and the complete table land in the same chunk.
+            self.assertIn(f"14 GAUGE STYLE {i}", holders[0])
+            self.assertEqual(holders[0].count("| --- | --- | --- |"), holders[0].count("## Section"))
+
+    def test_small_sections_are_packed(self) -> None:
+        text = "\n\n".join(f"# Heading {i}\n\nShort note {i}." for i in range(30))
+        chunks, stats = chunk_ocr_markdown(text, max_tokens=2000)
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(stats.chunk_count, 1)
+        self.assertEqual(stats.oversize_chunk_count, 0)
+
+    def test_oversized_table_is_split_by_rows_with_repeated_header(self) -> None:
+        table = _price_table(200)
+        chunks, stats = chunk_ocr_markdown(f"## Big grid\n\n{table}", max_tokens=300)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(stats.tables_split, 1)
+        self.assertEqual(stats.oversize_chunk_count, 0)
+        for c in chunks:
+            self.assertTrue(c.startswith("## Big grid"))
+            self.assertIn("|  14 GAUGE | 12 x 20 | $2,895.00  |\n| --- | --- | --- |", c)
+        # Every body row survives exactly once.
+        body_rows = [ln for c in chunks for ln in c.splitlines() if ln.startswith("|   |")]
+        self.assertEqual(len(body_rows), 200)
+
+    def test_empty_text_returns_no_chunks(self) -> None:
+        chunks, stats = chunk_ocr_markdown("  \n\n ", max_tokens=100)
+        self.assertEqual(chunks, [])
+        self.assertEqual(stats.chunk_count, 0)
+        with self.assertRaises(ValueError):
+            chunk_ocr_markdown("x", max_tokens=0)
+
+    def test_recorded_r29_text_stays_within_budget(self) -> None:
+        root = Path(__file__).resolve().parents[1]
+        path = root / "pricebooks" / "out" / "Coast_To_Coast_Carports___Price_Book___R29_1" / "ocr_text.md"
+        if not path.exists():
+            self.skipTest("recorded R29 OCR text not available")
+        text = path.read_text(encoding="utf-8")
+        chunks, stats = chunk_ocr_markdown(text, max_tokens=8000)
+        self.assertEqual(stats.oversize_chunk_count, 0)
+        self.assertGreater(stats.table_count, 10)
+        self.assertEqual(sum(estimate_tokens(c) for c in chunks), stats.total_tokens_est)
+
+
+if __name__ == "__main__":
+    unittest.main()
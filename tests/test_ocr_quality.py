@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import unittest
+
+from ocr_quality import assess_ocr_pages, score_ocr_page
+
+
+class TestOcrQuality(unittest.TestCase):
+    def test_price_table_and_rules_pages_pass_dot_filler_fails(self) -> None:
+        table = "## Regular Carports\n\n| Width | 21' | 26' |\n| --- | --- | --- |\n| 12' | $1,595 | $1,795 |\n| 18' | $1,995 | $2,295 |"
+        rules = "# Terms\n\nAll buildings are certified for 140 MPH wind and 30 PSF snow load unless noted otherwise."
+        self.assertGreater(score_ocr_page(table).score, 0.9)
+        self.assertGreater(score_ocr_page(rules).score, 0.6)
+        self.assertGreater(score_ocr_page(table).table_ratio, 0.5)
+
+        self.assertEqual(score_ocr_page(".").score, 0.0)
+        self.assertEqual(score_ocr_page("").score, 0.0)
+        dots = score_ocr_page(". . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .")
+        self.assertEqual(dots.dot_run_ratio, 1.0)
+        self.assertEqual(dots.score, 0.0)
+        self.assertLess(score_ocr_page("![img-0.jpeg](img-0.jpeg)\n\n![img-1.jpeg](img-1.jpeg)").score, 0.35)
+
+    def test_report_keeps_page_indexes(self) -> None:
+        payload = {
+            "pages": [
+                {"index": 3, "markdown": "| Width | Price |\n| --- | --- |\n| 12' | $1,595 |\n| 18' | $1,995 |"},
+                {"index": 4, "markdown": "."},
+            ]
+        }
+        report = assess_ocr_pages(payload)
+        self.assertEqual((report.usable_indices, report.skipped_indices), ([3], [4]))
+        self.assertEqual(report.as_dict()["skipped_pages"], [4])
+        self.assertEqual(assess_ocr_pages({"markdown": "."}).skipped_indices, [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+from pdf_text_layer import (
+    merge_text_layer_and_ocr,
+    plan_text_layer_pass,
+    score_text_layer_page,
+    text_layer_available,
+    text_layer_to_markdown,
+)
+
+_ROWS = [["Width", "Length", "Price"], ["12", "21", "$1,595"], ["12", "26", "$1,795"], ["18", "21", "$1,995"]]
+
+
+def write_mixed_pdf(path: Path) -> None:
+    """
+    Page 0: digital text with a column-aligned price table. Page 1: image only (needs OCR).
+    """
+    c = canvas.Canvas(str(path), pagesize=letter)
+    c.drawString(72, 720, "Regular Carport Pricing")
+    for r, row in enumerate(_ROWS):
+        for k, cell in enumerate(row):
+            c.drawString(72 + k * 120, 690 - r * 18, cell)
+    c.showPage()
+    c.rect(72, 72, 200, 200, fill=1)
+    c.showPage()
+    c.save()
+
+
+class TestPdfTextLayer(unittest.TestCase):
+    def test_aligned_columns_become_pipe_table(self) -> None:
+        text = "Regular Carport Pricing\n\n" + "\n".join("        ".join(r) for r in _ROWS)
+        md = text_layer_to_markdown(text)
+        self.assertIn("| Width | Length | Price |\n| --- | --- | --- |\n| 12 | 21 | $1,595 |", md)
+        self.assertTrue(md.startswith("Regular Carport Pricing"))
+        self.assertEqual(score_text_layer_page(text), 1.0)
+
+    def test_broken_layers_score_low(self) -> None:
+        self.assertEqual(score_text_layer_page(""), 0.0)
+        flattened = "Regular Carport Pricing " + " ".join(f"{w} 21 ${w},595" for w in range(12, 30, 2))
+        self.assertLess(score_text_layer_page(flattened), 0.75)
+        cid = "Price Book " + "(cid:31)(cid:12)(cid:44) " * 20
+        self.assertLess(score_text_layer_page(cid), 0.75)
+
+    def test_plan_routes_image_pages_to_ocr_and_merges_in_order(self) -> None:
+        if not text_layer_available():
+            self.skipTest("pypdf not installed")
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf = Path(tmp) / "book.pdf"
+            write_mixed_pdf(pdf)
+            plan = plan_text_layer_pass(pdf)
+            self.assertIsNone(plan_text_layer_pass(Path(tmp) / "missing.pdf"))
+
+        assert plan is not None
+        self.assertEqual((plan.text_layer_indices, plan.ocr_indices), ([0], [1]))
+        merged = merge_text_layer_and_ocr(plan, {"pages": [{"index": 1, "markdown": "# From OCR"}], "model": "m"})
+        self.assertEqual([(p["index"], p["source"]) for p in merged["pages"]], [(0, "text_layer"), (1, "ocr")])
+        self.assertEqual(merged["model"], "m")
+        self.assertEqual(merged["text_layer"]["ocr_pages"], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from pipeline_manifest import StageRecord, file_sha256, inputs_fingerprint, load_manifest
+
+
+class TestPipelineManifest(unittest.TestCase):
+    def _record(self, book_dir: Path, *, input_hash: str) -> StageRecord:
+        out = book_dir / "ocr_text.md"
+        return StageRecord(
+            name="ocr",
+            input_hash=input_hash,
+            inputs={"pdf_sha256": "abc"},
+            tool_version="ocr-1",
+            outputs={"ocr_text.md": file_sha256(out)},
+            started_at="2026-01-01T00:00:00+00:00",
+            duration_s=1.25,
+        )
+
+    def test_recorded_stage_is_current_until_inputs_or_outputs_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            book_dir = Path(tmp) / "book"
+            book_dir.mkdir()
+            (book_dir / "ocr_text.md").write_text("# Page 1", encoding="utf-8")
+            h = inputs_fingerprint({"pdf_sha256": "abc"}, tool_version="ocr-1")
+
+            manifest = load_manifest(book_dir, source="book.pdf")
+            self.assertFalse(manifest.is_current("ocr", input_hash=h))
+            manifest.record(self._record(book_dir, input_hash=h))
+
+            # Persisted immediately, so a fresh load (e.g. after a crash) sees the finished stage.
+            reloaded = load_manifest(book_dir, source="book.pdf")
+            self.assertTrue(reloaded.is_current("ocr", input_hash=h))
+            self.assertAlmostEqual(reloaded.stages["ocr"].duration_s, 1.25)
+
+            h2 = inputs_fingerprint({"pdf_sha256": "def"}, tool_version="ocr-1")
+            self.assertFalse(reloaded.is_current("ocr", input_hash=h2))
+            self.assertNotEqual(h, inputs_fingerprint({"pdf_sha256": "abc"}, tool_version="ocr-2"))
+
+            (book_dir / "ocr_text.md").write_text("edited", encoding="utf-8")
+            self.assertFalse(reloaded.is_current("ocr", input_hash=h))
+
+    def test_invalidate_and_corrupt_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            book_dir = Path(tmp)
+            (book_dir / "ocr_text.md").write_text("x", encoding="utf-8")
+            manifest = load_manifest(book_dir, source="book.pdf")
+            manifest.record(self._record(book_dir, input_hash="h"))
+            manifest.invalidate("ocr")
+            self.assertNotIn("ocr", load_manifest(book_dir, source="book.pdf").stages)
+
+            manifest.path.write_text("{not json", encoding="utf-8")
+            self.assertEqual(load_manifest(book_dir, source="book.pdf").stages, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
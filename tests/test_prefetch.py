@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from prefetch import BackgroundPrefetcher
+
+
+class TestBackgroundPrefetcher(unittest.TestCase):
+    def test_take_returns_prefetched_bytes_for_matching_key_only(self) -> None:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prefetcher = BackgroundPrefetcher(pool)
+            calls = []
+            prefetcher.prefetch("a", lambda cancelled: calls.append(1) or b"%PDF-a")
+            prefetcher.prefetch("a", lambda cancelled: calls.append(2) or b"%PDF-other")
+            self.assertIsNone(prefetcher.take("b"))
+            self.assertEqual(prefetcher.take("a", timeout=5), b"%PDF-a")
+            self.assertEqual(calls, [1])
+
+    def test_new_key_cancels_running_and_queued_builds(self) -> None:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prefetcher = BackgroundPrefetcher(pool)
+            started = threading.Event()
+            seen: dict = {}
+
+            def slow(cancelled: threading.Event) -> bytes:
+                started.set()
+                seen["a"] = cancelled
+                cancelled.wait(5)
+                raise RuntimeError("stopped")
+
+            prefetcher.prefetch("a", slow)
+            self.assertTrue(started.wait(5))
+            prefetcher.prefetch("b", lambda cancelled: b"%PDF-b")
+            self.assertTrue(seen["a"].is_set())
+            self.assertIsNone(prefetcher.take("a"))
+            self.assertEqual(prefetcher.take("b", timeout=5), b"%PDF-b")
+
+    def test_failed_build_is_dropped(self) -> None:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prefetcher = BackgroundPrefetcher(pool)
+
+            def boom(cancelled: threading.Event) -> bytes:
+                raise ValueError("bad quote")
+
+            prefetcher.prefetch("a", boom)
+            self.assertIsNone(prefetcher.failed("a"))
+            self.assertIsNone(prefetcher.take("a", timeout=5))
+            self.assertIsNone(prefetcher.key)
+            self.assertIsInstance(prefetcher.failed("a"), ValueError)
+            self.assertIsNone(prefetcher.failed("b"))
+            # Prefetching again is an explicit retry and forgets the failure.
+            prefetcher.prefetch("a", lambda cancelled: b"%PDF-a")
+            self.assertIsNone(prefetcher.failed("a"))
+            self.assertEqual(prefetcher.take("a", timeout=5), b"%PDF-a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,30 @@
 from __future__ import annotations
 
+import hashlib
+import re
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from io import BytesIO
+from unittest import mock
 
-from quote_pdf import QuotePdfArtifact, QuotePdfLineItem, QuotePdfTotals, make_quote_pdf_bytes
+from PIL import Image
+from reportlab.pdfgen.canvas import Canvas
+
+import quote_pdf
+from building_views import BuildingColorScheme, render_building_views_vector
+from quote_pdf import (
+    PRODUCTION_PDF_PROFILE,
+    QuotePdfArtifact,
+    QuotePdfLineItem,
+    QuotePdfTotals,
+    clear_quote_chrome_cache,
+    make_quote_pdf_bytes,
+    plan_quote_pdf_pages,
+    quote_chrome_template,
+    write_quote_pdf,
+)
 
 
 class TestQuotePdf(unittest.TestCase):
@@ -51,6 +72,32 @@ class TestQuotePdf(unittest.TestCase):
         self.assertIn(b"Downpayment", pdf)
         self.assertIn(b"Balance Due", pdf)
 
+    def test_write_quote_pdf_streams_into_sink_and_reports_size_and_hash(self) -> None:
+        artifact = QuotePdfArtifact(
+            quote_id="STREAM1",
+            quote_date=date(2026, 1, 15),
+            pricebook_revision="R29 (NW) demo",
+            customer_name="Demo Customer",
+            customer_email="demo@example.com",
+            building_label="Commercial Buildings",
+            building_summary="20 x 30 x 10",
+            line_items=(QuotePdfLineItem(description="Base building", qty=1, amount_cents=9990 * 100),),
+            totals=QuotePdfTotals(
+                building_amount_cents=9990 * 100,
+                discount_cents=0,
+                subtotal_cents=9990 * 100,
+                additional_charges_cents=0,
+                grand_total_cents=9990 * 100,
+            ),
+        )
+        with tempfile.TemporaryFile() as f:
+            out = write_quote_pdf(artifact, f, profile=PRODUCTION_PDF_PROFILE)
+            f.seek(0)
+            written = f.read()
+        self.assertTrue(written.startswith(b"%PDF"))
+        self.assertEqual(out.size_bytes, len(written))
+        self.assertEqual(out.sha256, hashlib.sha256(written).hexdigest())
+
     def test_pdf_includes_one_page_per_view(self) -> None:
         # Minimal, valid PNG bytes for embedding:
         # Use short, deterministic dummy bytes? (ReportLab requires real images)
@@ -130,6 +177,207 @@ class TestQuotePdf(unittest.TestCase):
         # Ensure the final line item isn't dropped (compression disabled).
         self.assertIn(b"Item 79", pdf)
 
+    def test_chrome_template_is_cached_per_logo_and_layout_and_stamped_as_forms(self) -> None:
+        buf = BytesIO()
+        Image.new("RGBA", (40, 20), (200, 30, 30, 255)).save(buf, format="PNG")
+        logo = buf.getvalue()
+        template = quote_chrome_template(logo)
+        self.assertIs(quote_chrome_template(logo), template)
+        self.assertIsNotNone(template.logo)
+        self.assertIsNot(quote_chrome_template(logo + b"x"), template)
+        with mock.patch.object(quote_pdf, "QUOTE_CHROME_LAYOUT_VERSION", quote_pdf.QUOTE_CHROME_LAYOUT_VERSION + 1):
+            self.assertIsNot(quote_chrome_template(logo), template)
+
+        png_1x1 = (
+            b"\x89PNG\r\n\x1a\n"
+            b"\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde"
+            b"\x00\x00\x00\nIDAT\x08\xd7c\xf8\x0f\x00\x01\x01\x01\x00\x18\xdd\x8d\x9b"
+            b"\x00\x00\x00\x00IEND\xaeB`\x82"
+        )
+        artifact = QuotePdfArtifact(
+            quote_id="TESTFORMS",
+            quote_date=date(2026, 1, 15),
+            pricebook_revision="R29 (NW) demo",
+            customer_name="Demo Customer",
+            customer_email="demo@example.com",
+            building_label="Commercial Buildings",
+            building_summary="20 x 20 x 10",
+            line_items=(QuotePdfLineItem(description="Base building", qty=1, amount_cents=100 * 100),),
+            totals=QuotePdfTotals(
+                building_amount_cents=100 * 100,
+                discount_cents=0,
+                subtotal_cents=100 * 100,
+                additional_charges_cents=0,
+                grand_total_cents=100 * 100,
+            ),
+            logo_png_bytes=logo,
+            building_views_png_bytes={k: png_1x1 for k in ("front", "back", "left", "right")},
+        )
+        pdf = make_quote_pdf_bytes(artifact)
+        # One frame form, stamped on each view page.
+        self.assertEqual(pdf.count(b"/FormXob.QuoteBuildingViewFrame Do"), 4)
+        self.assertEqual(pdf.count(b"/FormXob.QuoteHeaderChrome Do"), 1)
+        self.assertIn(b"Pay Now", pdf)
+        self.assertIn(b"Downpayment", pdf)
+
+    def test_concurrent_builds_share_the_cached_logo(self) -> None:
+        buf = BytesIO()
+        Image.new("RGBA", (40, 20), (200, 30, 30, 128)).save(buf, format="PNG")
+        logo = buf.getvalue()
+        clear_quote_chrome_cache()
+        artifacts = [
+            QuotePdfArtifact(
+                quote_id=f"TESTLOGO{i}",
+                quote_date=date(2026, 1, 15),
+                pricebook_revision="R29 (NW) demo",
+                customer_name="Demo Customer",
+                customer_email="demo@example.com",
+                building_label="Commercial Buildings",
+                building_summary="20 x 20 x 10",
+                line_items=(QuotePdfLineItem(description="Base building", qty=1, amount_cents=100 * 100),),
+                totals=QuotePdfTotals(
+                    building_amount_cents=100 * 100,
+                    discount_cents=0,
+                    subtotal_cents=100 * 100,
+                    additional_charges_cents=0,
+                    grand_total_cents=100 * 100,
+                ),
+                logo_png_bytes=logo,
+            )
+            for i in range(6)
+        ]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pdfs = list(pool.map(make_quote_pdf_bytes, artifacts))
+        for i, pdf in enumerate(pdfs):
+            images = re.findall(rb"<<[^<>]*/Subtype /Image[^<>]*>>", pdf)
+            # The logo and its soft mask, each embedded once, in every document.
+            self.assertEqual(len(images), 2, i)
+            self.assertEqual(sum(b"/SMask" in im for im in images), 1, i)
+            self.assertTrue(all(b"/Width 40" in im and b"/Height 20" in im for im in images), i)
+            self.assertIn(f"TESTLOGO{i}".encode(), pdf)
+        self.assertIs(quote_chrome_template(logo), quote_chrome_template(logo))
+
+    def test_page_plan_is_known_up_front_and_matches_rendered_pages(self) -> None:
+        items = tuple(
+            QuotePdfLineItem(description=f"Item {i} " + "wide option text " * (i % 7), qty=1, amount_cents=100)
+            for i in range(300)
+        )
+        artifact = QuotePdfArtifact(
+            quote_id="TESTPLAN",
+            quote_date=date(2026, 1, 15),
+            pricebook_revision="R29 (NW) demo",
+            customer_name="Demo Customer",
+            customer_email="demo@example.com",
+            building_label="Commercial Buildings",
+            building_summary="60 x 100 x 16",
+            line_items=items,
+            totals=QuotePdfTotals(
+                building_amount_cents=300 * 100,
+                discount_cents=0,
+                subtotal_cents=300 * 100,
+                additional_charges_cents=0,
+                grand_total_cents=300 * 100,
+            ),
+            notes=("Prices valid for 30 days.",),
+        )
+        plan = plan_quote_pdf_pages(artifact)
+        rows = [r for page in plan.line_item_pages for r in page.rows]
+        self.assertEqual(len(rows), len(items))
+        self.assertTrue(all(page.rows for page in plan.line_item_pages[:-1]))
+        self.assertTrue(plan.line_item_pages[-1].include_totals)
+        self.assertFalse(any(p.include_totals for p in plan.line_item_pages[:-1]))
+        # Long descriptions are fitted to the column once, in the plan.
+        self.assertTrue(any(desc.endswith("...") for desc, _, _ in rows))
+        self.assertEqual(self._count_pdf_pages(make_quote_pdf_bytes(artifact)), plan.page_count)
+
+    def test_production_profile_compresses_dedupes_and_downsamples_images(self) -> None:
+        buf = BytesIO()
+        Image.new("RGB", (900, 520), (40, 90, 160)).save(buf, format="PNG")
+        view = buf.getvalue()
+        buf = BytesIO()
+        Image.new("RGB", (900, 520), (200, 60, 40)).save(buf, format="PNG")
+        preview_only = buf.getvalue()
+        base = QuotePdfArtifact(
+            quote_id="TESTPROD",
+            quote_date=date(2026, 1, 15),
+            pricebook_revision="R29 (NW) demo",
+            customer_name="Demo Customer",
+            customer_email="demo@example.com",
+            building_label="Commercial Buildings",
+            building_summary="20 x 20 x 10",
+            line_items=(QuotePdfLineItem(description="Base building", qty=1, amount_cents=100 * 100),),
+            totals=QuotePdfTotals(
+                building_amount_cents=100 * 100,
+                discount_cents=0,
+                subtotal_cents=100 * 100,
+                additional_charges_cents=0,
+                grand_total_cents=100 * 100,
+            ),
+            building_preview_png_bytes=view,
+            building_views_png_bytes={k: view for k in ("front", "back", "isometric")},
+        )
+        pdf = make_quote_pdf_bytes(base, profile=PRODUCTION_PDF_PROFILE)
+        self.assertEqual(self._count_pdf_pages(pdf), 4)
+        # Content streams are compressed, so page text no longer appears in the bytes.
+        self.assertNotIn(b"BUILDING VIEW", pdf)
+        # Preview + three view pages share one image object, kept at full size for the pages.
+        self.assertEqual(pdf.count(b"/Subtype /Image"), 1)
+        self.assertEqual(re.findall(rb"/Width (\d+)", pdf), [b"900"])
+        # Embedded by the passthrough path, not re-encoded by the `drawImage` fallback.
+        self.assertRegex(pdf, rb"/FormXob\.QuoteImage[0-9a-f]{24}")
+
+        # A PNG drawn only as the small page-1 preview is downsampled for that box.
+        thumb = make_quote_pdf_bytes(
+            QuotePdfArtifact(**{**base.__dict__, "building_preview_png_bytes": preview_only}),
+            profile=PRODUCTION_PDF_PROFILE,
+        )
+        widths = sorted(int(w) for w in re.findall(rb"/Width (\d+)", thumb))
+        self.assertEqual(len(widths), 2)
+        self.assertLess(widths[0], 400)
+
+    def test_reportlab_internals_used_for_passthrough_images_exist(self) -> None:
+        # `_DocumentImages._embed` registers pre-encoded images through these private ReportLab
+        # attributes and quietly falls back to `drawImage` without them; fail loudly instead.
+        c = Canvas(BytesIO())
+        doc = c._doc
+        for attr in ("getXObjectName", "Reference", "addForm"):
+            self.assertTrue(callable(getattr(doc, attr, None)), attr)
+        self.assertIsInstance(doc.idToObject, dict)
+        self.assertEqual(doc.getXObjectName("QuoteImageabc"), "FormXob.QuoteImageabc")
+
+    def test_vector_views_are_drawn_without_images(self) -> None:
+        vectors = render_building_views_vector(
+            width_ft=24,
+            length_ft=36,
+            height_ft=12,
+            colors=BuildingColorScheme(roof="Burgundy", trim="White", sides="Tan"),
+            view_names=("isometric", "front", "left"),
+        )
+        artifact = QuotePdfArtifact(
+            quote_id="TESTVEC",
+            quote_date=date(2026, 1, 15),
+            pricebook_revision="R29 (NW) demo",
+            customer_name="Demo Customer",
+            customer_email="demo@example.com",
+            building_label="Commercial Buildings",
+            building_summary="24 x 36 x 12",
+            line_items=(QuotePdfLineItem(description="Base building", qty=1, amount_cents=100 * 100),),
+            totals=QuotePdfTotals(
+                building_amount_cents=100 * 100,
+                discount_cents=0,
+                subtotal_cents=100 * 100,
+                additional_charges_cents=0,
+                grand_total_cents=100 * 100,
+            ),
+            building_views_vector=vectors,
+        )
+        self.assertEqual(plan_quote_pdf_pages(artifact).view_pages, ("front", "left", "isometric"))
+        pdf = make_quote_pdf_bytes(artifact)
+        self.assertEqual(self._count_pdf_pages(pdf), 4)
+        self.assertNotIn(b"/Subtype /Image", pdf)
+        # One form per drawing: the isometric view is shared by the page-1 preview and its page.
+        self.assertEqual(len(set(re.findall(rb"/FormXob\.(QuoteView[0-9a-f]+)", pdf))), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+from building_views import BuildingViewDrawing, VectorShape
+from quote_pdf import QuotePdfArtifact, QuotePdfLineItem, QuotePdfTotals
+from quote_pdf_batch import make_quote_pdfs, quote_artifact_from_dict, quote_artifact_to_dict
+
+
+def _artifact(quote_id: str) -> QuotePdfArtifact:
+    return QuotePdfArtifact(
+        quote_id=quote_id,
+        quote_date=date(2026, 1, 15),
+        pricebook_revision="R29 (NW) demo",
+        customer_name="Demo Customer",
+        customer_email="demo@example.com",
+        building_label="Commercial Buildings",
+        building_summary="40 x 60 x 14",
+        line_items=(QuotePdfLineItem(description="Base building", qty=1, amount_cents=24790 * 100),),
+        totals=QuotePdfTotals(
+            building_amount_cents=24790 * 100,
+            discount_cents=0,
+            subtotal_cents=24790 * 100,
+            additional_charges_cents=0,
+            grand_total_cents=24790 * 100,
+            downpayment_cents=4462 * 100,
+            balance_due_cents=20328 * 100,
+        ),
+        notes=(),
+        logo_png_bytes=None,
+        building_preview_png_bytes=None,
+        building_views_png_bytes=None,
+    )
+
+
+class TestQuotePdfBatch(unittest.TestCase):
+    def test_parallel_batch_writes_pdfs_and_skips_unchanged_on_rerun(self) -> None:
+        artifacts = [_artifact(f"B{i}") for i in range(3)]
+        with tempfile.TemporaryDirectory() as td:
+            out = Path(td)
+            first = make_quote_pdfs(artifacts, out, jobs=2)
+            self.assertEqual(first.count("written"), 3)
+            for a in artifacts:
+                pdf = out / f"QTE-{a.quote_id}.pdf"
+                self.assertTrue(pdf.read_bytes().startswith(b"%PDF"))
+                self.assertIn("fingerprint", json.loads((out / f"{pdf.name}.sha256.json").read_text()))
+
+            changed = [artifacts[0], replace(artifacts[1], customer_name="Someone Else"), artifacts[2]]
+            second = make_quote_pdfs(changed, out, jobs=2)
+            by_id = {r.quote_id: r.status for r in second.results}
+            self.assertEqual(by_id, {"B0": "skipped", "B1": "written", "B2": "skipped"})
+
+            # A PDF edited on disk no longer matches its recorded hash and is re-rendered.
+            (out / "QTE-B2.pdf").write_bytes(b"%PDF-truncated")
+            third = make_quote_pdfs(changed, out, jobs=1)
+            self.assertEqual({r.quote_id: r.status for r in third.results}["B2"], "written")
+
+    def test_artifact_dict_round_trip(self) -> None:
+        drawing = BuildingViewDrawing(
+            canvas_px=(900, 520),
+            shapes=(
+                VectorShape("rect", ((0, 0), (899, 519)), fill=(245, 245, 245)),
+                VectorShape("line", ((10, 10), (20, 30)), outline=(0, 0, 0), width=3),
+            ),
+        )
+        a = replace(
+            _artifact("RT"),
+            logo_png_bytes=b"\x89PNG-logo",
+            building_views_png_bytes={"front": b"png"},
+            building_views_vector={"isometric": drawing},
+        )
+        self.assertEqual(quote_artifact_from_dict(json.loads(json.dumps(quote_artifact_to_dict(a)))), a)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import quote_pdf_cache
+from quote_pdf_cache import QuotePdfDiskCache, quote_pdf_cache_key
+
+
+class TestQuotePdfCache(unittest.TestCase):
+    def test_key_covers_inputs_and_renderer_versions(self) -> None:
+        parts = {"signature": "abc123", "discount_pct": 0.05, "lead": {"name": "A", "email": "a@example.com"}}
+        key = quote_pdf_cache_key(parts)
+        self.assertEqual(key, quote_pdf_cache_key(dict(parts)))
+        self.assertNotEqual(key, quote_pdf_cache_key({**parts, "discount_pct": 0.1}))
+        with mock.patch.object(quote_pdf_cache, "QUOTE_PDF_RENDERER_VERSION", 999):
+            self.assertNotEqual(key, quote_pdf_cache_key(parts))
+
+    def test_lru_eviction_keeps_recently_used_entries_within_budget(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache = QuotePdfDiskCache(Path(td), max_bytes=2500)
+            keys = [quote_pdf_cache_key({"n": i}) for i in range(3)]
+            pdf = b"%PDF-1.4\n" + b"x" * 1000
+            for i, key in enumerate(keys[:2]):
+                path = cache.put(key, pdf)
+                os.utime(path, (1000 + i, 1000 + i))
+
+            builds = []
+            self.assertEqual(cache.get_or_build(keys[0], lambda: builds.append(1) or b"%PDF-new"), pdf)
+            self.assertEqual(builds, [])
+            # keys[0] was just read, so inserting a third entry evicts keys[1].
+            cache.put(keys[2], pdf)
+            self.assertIsNotNone(cache.get(keys[0]))
+            self.assertIsNone(cache.get(keys[1]))
+            self.assertIsNotNone(cache.get(keys[2]))
+            self.assertLessEqual(cache.stats().total_bytes, 2500)
+
+            # Another process (a second cache object on the same dir) sees the same entries.
+            self.assertEqual(QuotePdfDiskCache(Path(td)).get(keys[2]), pdf)
+
+    def test_get_or_write_streams_once_and_keeps_the_fresh_entry(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache = QuotePdfDiskCache(Path(td), max_bytes=10)
+            key = quote_pdf_cache_key({"n": 1})
+            writes = []
+
+            def write(sink) -> None:
+                writes.append(1)
+                sink.write(b"%PDF-1.4\n" + b"x" * 100)
+
+            path = cache.get_or_write(key, write)
+            # Over budget on its own, but the entry just handed out survives eviction.
+            self.assertTrue(path.is_file())
+            self.assertEqual(cache.get_or_write(key, write), path)
+            self.assertEqual(writes, [1])
+            self.assertEqual(list(Path(td).rglob("*.tmp")), [])
+
+    def test_get_or_write_spools_when_the_cache_dir_is_unwritable(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            blocker = Path(td) / "not-a-dir"
+            blocker.write_bytes(b"")
+            cache = QuotePdfDiskCache(blocker / "cache")
+            key = quote_pdf_cache_key({"n": 1})
+            spool = QuotePdfDiskCache(Path(td) / "spool")
+            writes = []
+
+            def write(sink) -> None:
+                writes.append(1)
+                sink.write(b"%PDF-1.4\n")
+
+            with mock.patch.object(quote_pdf_cache, "quote_pdf_spool", return_value=spool):
+                path = cache.get_or_write(key, write)
+            self.assertEqual(path.read_bytes(), b"%PDF-1.4\n")
+            self.assertEqual(path.parent.parent, spool.root)
+            # Later lookups find the spooled PDF instead of rendering it again.
+            self.assertEqual(cache.get_path(key), path)
+            self.assertEqual(cache.get_or_write(key, write), path)
+            self.assertEqual(writes, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()